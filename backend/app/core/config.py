@@ -1,5 +1,5 @@
 import json
-from typing import Annotated
+from typing import Annotated, Literal
 from urllib.parse import urlparse
 
 from pydantic import field_validator
@@ -23,6 +23,32 @@ class Settings(BaseSettings):
     app_name: str = "HMS"
     environment: str = "development"
     database_url: str
+    # Connection pool, per process. When database_max_connections is set, it is the
+    # budget across all web_concurrency worker processes and caps each pool's
+    # size + overflow; a pool size of 0 disables pooling (NullPool).
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_max_connections: int = 0
+    web_concurrency: int = 1
+    database_pool_timeout_seconds: float = 30.0
+    database_pool_recycle_seconds: int = 1800
+    # Prepared statements cached per connection by the asyncpg driver.
+    database_statement_cache_size: int = 100
+    # "pgbouncer" targets PgBouncer in transaction mode: no statement caching and
+    # unique prepared statement names. LISTEN needs a session-level connection, so
+    # export events then use database_listen_url (Postgres or a session-mode pool).
+    database_pool_profile: Literal["direct", "pgbouncer"] = "direct"
+    database_listen_url: str | None = None
+    # Idle connections are checked in the background instead of pinged on every
+    # checkout; 0 falls back to a ping per checkout. Checkouts that wait longer than
+    # database_pool_slow_checkout_ms are logged.
+    database_pool_liveness_seconds: int = 30
+    database_pool_slow_checkout_ms: int = 100
+    # Optional streaming replica for report, dashboard, audit list and export reads.
+    # After a write, the client's reads stay on the primary for the sticky window,
+    # which should exceed normal replication lag.
+    database_replica_url: str | None = None
+    database_replica_sticky_seconds: int = 5
     jwt_secret: str
     jwt_algorithm: str = "HS256"
     jwt_access_ttl_minutes: int = 10
@@ -36,6 +62,67 @@ class Settings(BaseSettings):
     reports_storage_path: str = "storage/reports"
     report_export_poll_seconds: int = 3
     report_export_batch_size: int = 5
+    # Store CSV/NDJSON exports gzip-compressed; downloads negotiate Content-Encoding.
+    report_export_compress: bool = True
+    # Exports estimated above this many rows are split into date-range shards that
+    # render in parallel worker processes.
+    report_export_shard_min_rows: int = 200000
+    report_export_shard_count: int = 8
+    report_export_processes: int = 4
+    # Unsharded exports render and report progress in batches of this many rows.
+    report_export_progress_rows: int = 5000
+    # Export artifact lifecycle: files expire after the TTL, rows are purged after the
+    # retention window, and unreferenced files older than the grace period are removed.
+    report_export_ttl_hours: int = 72
+    report_export_row_retention_days: int = 30
+    report_export_tenant_quota_bytes: int = 2 * 1024**3
+    report_export_orphan_grace_minutes: int = 60
+    report_export_cleanup_interval_seconds: int = 3600
+    # Guest imports: uploads are spooled here, validated and COPY-loaded in batches.
+    guest_imports_storage_path: str = "storage/imports"
+    guest_import_max_bytes: int = 200 * 1024**2
+    guest_import_batch_size: int = 5000
+    guest_import_max_errors: int = 1000
+    guest_import_poll_seconds: int = 3
+    export_events_queue_size: int = 100
+    export_events_heartbeat_seconds: int = 15
+    export_events_reconnect_seconds: int = 5
+    # Direct report streams above this planner row estimate are queued as exports instead.
+    report_stream_max_rows: int = 50000
+    report_stream_fetch_size: int = 1000
+    report_summary_max_age_seconds: int = 60
+    # Paginated list totals: unfiltered lists whose planner estimate exceeds the
+    # threshold report the estimate; totals are cached per tenant and filter set.
+    list_count_estimate_threshold: int = 10000
+    list_count_cache_seconds: int = 30
+    list_count_cache_size: int = 2048
+    # audit_logs is partitioned by UTC month. The maintenance job keeps partitions
+    # created this many months ahead and, when retention is positive, detaches
+    # partitions older than that many months into the archive schema.
+    audit_log_partitions_ahead: int = 3
+    audit_log_retention_months: int = 0
+    audit_log_archive_schema: str = "audit_archive"
+    audit_log_maintenance_interval_seconds: int = 86400
+    # Non-critical audit events are queued and written in batches off the request
+    # path; a batch is flushed once it is full or its oldest event is this old.
+    # When the queue is full, events fall back to an in-transaction insert.
+    audit_writer_enabled: bool = True
+    audit_writer_queue_size: int = 10000
+    audit_writer_batch_size: int = 500
+    audit_writer_flush_seconds: float = 1.0
+    # A failed batch is retried this many times in all, waiting this long before
+    # the first retry and doubling after that. It is then written row by row so a
+    # bad row only loses itself.
+    audit_writer_retry_attempts: int = 3
+    audit_writer_retry_seconds: float = 0.5
+    # Audit streams stop this far behind now, so rows still in an open transaction
+    # or in another process's writer queue are not skipped by a client's watermark.
+    # Rows this process's writer has not flushed yet cap the bound as well.
+    audit_stream_settle_seconds: int = 10
+    audit_stream_fetch_size: int = 2000
+    # POST /api/batch runs up to this many GET sub-requests in-process, sharing one
+    # auth resolution and one database session.
+    batch_max_requests: int = 20
 
     admin_seed_email: str = "admin@demo.com"
     admin_seed_password: str = "Admin123!"
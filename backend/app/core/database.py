@@ -1,13 +1,23 @@
-﻿from collections.abc import AsyncGenerator
+﻿import time
+from collections.abc import AsyncGenerator
+from contextvars import ContextVar
+
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.core.pool import ReplicaQueuePool, engine_options
+
 
+engine = create_async_engine(settings.database_url, **engine_options())
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=False,
-    pool_pre_ping=True,
+# LISTEN holds a session-level connection, which a transaction-mode PgBouncer
+# cannot provide; database_listen_url points the listener past it.
+listen_engine = (
+    create_async_engine(settings.database_listen_url, poolclass=NullPool)
+    if settings.database_listen_url
+    else engine
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -16,7 +26,57 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+replica_engine = (
+    create_async_engine(settings.database_replica_url, **engine_options(ReplicaQueuePool))
+    if settings.database_replica_url
+    else None
+)
+
+# Read-only work that tolerates replication lag; falls back to the primary.
+AsyncReadSessionLocal = async_sessionmaker(
+    replica_engine or engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# Unix time until which the client's reads stay on the primary; set after writes.
+PRIMARY_UNTIL_COOKIE = "primary_until"
+
+# Set while a batch request dispatches its sub-requests, so they reuse its session.
+shared_session: ContextVar[AsyncSession | None] = ContextVar("shared_session", default=None)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    session = shared_session.get()
+    if session is not None:
+        yield session
+        return
     async with AsyncSessionLocal() as session:
         yield session
+
+
+def reads_primary(request: Request) -> bool:
+    """Whether the client wrote recently enough that a replica may not show it yet."""
+    try:
+        until = float(request.cookies.get(PRIMARY_UNTIL_COOKIE, 0))
+    except ValueError:
+        return False
+    now = time.time()
+    # Bounded, so a tampered cookie cannot pin the client to the primary.
+    return now < until <= now + settings.database_replica_sticky_seconds
+
+
+def read_sessionmaker(request: Request) -> async_sessionmaker[AsyncSession]:
+    if replica_engine is None or reads_primary(request):
+        return AsyncSessionLocal
+    return AsyncReadSessionLocal
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only endpoints: the replica, unless the client just wrote."""
+    session = shared_session.get()
+    if session is not None:
+        yield session
+        return
+    async with read_sessionmaker(request)() as session:
+        yield session
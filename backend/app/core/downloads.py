@@ -0,0 +1,164 @@
+import gzip
+import mimetypes
+from email.utils import formatdate
+from pathlib import Path
+from typing import Iterator
+
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+
+from app.core.storage import GZIP_SUFFIX
+
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+mimetypes.add_type("application/vnd.apache.parquet", ".parquet")
+
+
+class RangeNotSatisfiableError(ValueError):
+    pass
+
+
+def parse_byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=`` range into inclusive ``(start, end)`` offsets.
+
+    Returns None when the full body should be sent instead (no header, an
+    unsupported unit, or a multi-range request, all of which RFC 9110 allows a
+    server to ignore).
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_text, sep, end_text = spec.strip().partition("-")
+    if not sep:
+        return None
+
+    try:
+        if start_text == "":
+            suffix_length = int(end_text)
+            if suffix_length <= 0:
+                raise RangeNotSatisfiableError("Empty suffix range")
+            start, end = max(size - suffix_length, 0), size - 1
+        else:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+    except ValueError as exc:
+        if isinstance(exc, RangeNotSatisfiableError):
+            raise
+        return None
+
+    if start < 0 or start >= size or start > end:
+        raise RangeNotSatisfiableError("Range not satisfiable")
+    return start, min(end, size - 1)
+
+
+def accepts_gzip(request: Request) -> bool:
+    for token in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = token.strip().partition(";")
+        if coding.strip().lower() not in {"gzip", "*"}:
+            continue
+        quality = params.strip().replace(" ", "").lower()
+        return quality not in {"q=0", "q=0.0", "q=0.00", "q=0.000"}
+    return False
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def _iter_file(path: Path, start: int, length: int) -> Iterator[bytes]:
+    with path.open("rb") as handle:
+        handle.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = handle.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _iter_gunzip(path: Path) -> Iterator[bytes]:
+    with gzip.open(path, "rb") as handle:
+        while chunk := handle.read(DOWNLOAD_CHUNK_SIZE):
+            yield chunk
+
+
+def export_file_response(
+    request: Request,
+    file_path: str,
+    file_name: str,
+    file_sha256: str | None = None,
+) -> Response:
+    """Serve a stored export with ETag, conditional GET and single-range support.
+
+    Gzip artifacts are sent as ``Content-Encoding: gzip`` to clients that accept
+    it, and inflated on the fly (without range support) for those that do not.
+    Strong ETags come from the digest recorded when the file was written; older
+    exports without one fall back to a weak validator, which never satisfies
+    ``If-Range``.
+    """
+    path = Path(file_path)
+    if not path.is_file():
+        raise FileNotFoundError(file_path)
+
+    stat = path.stat()
+    media_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+    compressed = path.suffix == GZIP_SUFFIX
+    headers = {
+        "Content-Disposition": f'attachment; filename="{file_name}"',
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+    }
+    if compressed:
+        headers["Vary"] = "Accept-Encoding"
+
+    if file_sha256:
+        etag = f'"{file_sha256}"'
+    else:
+        etag = f'W/"{stat.st_size:x}-{int(stat.st_mtime):x}"'
+
+    if compressed and not accepts_gzip(request):
+        # The inflated body is a different representation, so it gets its own tag.
+        headers["ETag"] = etag[:-1] + '-identity"'
+        headers["Accept-Ranges"] = "none"
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return StreamingResponse(_iter_gunzip(path), media_type=media_type, headers=headers)
+
+    headers["ETag"] = etag
+    headers["Accept-Ranges"] = "bytes"
+    if compressed:
+        headers["Content-Encoding"] = "gzip"
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    range_allowed = if_range is None or (not etag.startswith("W/") and if_range.strip() == etag)
+    if range_allowed:
+        try:
+            byte_range = parse_byte_range(request.headers.get("range"), stat.st_size)
+        except RangeNotSatisfiableError:
+            headers["Content-Range"] = f"bytes */{stat.st_size}"
+            return Response(status_code=416, headers=headers)
+
+    if byte_range is None:
+        headers["Content-Length"] = str(stat.st_size)
+        return StreamingResponse(
+            _iter_file(path, 0, stat.st_size), media_type=media_type, headers=headers
+        )
+
+    start, end = byte_range
+    length = end - start + 1
+    headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+    headers["Content-Length"] = str(length)
+    return StreamingResponse(
+        _iter_file(path, start, length), status_code=206, media_type=media_type, headers=headers
+    )
@@ -0,0 +1,117 @@
+import asyncio
+import json
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from app.core.config import settings
+
+
+EXPORT_EVENTS_CHANNEL = "report_export_events"
+SSE_RETRY_MS = 5000
+
+
+class EventBroker:
+    """In-process fan-out of events to per-key subscriber queues.
+
+    Slow subscribers lose their oldest events rather than blocking publishers;
+    each export event carries the full export state, so only the latest matters.
+    """
+
+    def __init__(self, queue_size: int = 100) -> None:
+        self.queue_size = queue_size
+        self._subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+
+    def subscribe(self, key: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[key].add(queue)
+        return queue
+
+    def unsubscribe(self, key: str, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(key)
+        if not queues:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[key]
+
+    def publish(self, key: str, event: dict[str, Any]) -> None:
+        for queue in self._subscribers.get(key, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+
+export_events = EventBroker(queue_size=settings.export_events_queue_size)
+
+
+def export_event_payload(export) -> dict[str, Any]:
+    return {
+        "id": str(export.id),
+        "scope": export.scope,
+        "tenant_id": str(export.tenant_id) if export.tenant_id else None,
+        "requested_by": str(export.requested_by) if export.requested_by else None,
+        "report_code": export.report_code,
+        "export_format": export.export_format,
+        "status": export.status,
+        "file_name": export.file_name,
+        "shards_total": export.shards_total,
+        "shards_completed": export.shards_completed,
+        "rows_total": export.rows_total,
+        "rows_processed": export.rows_processed,
+        "error_message": export.error_message,
+        "created_at": export.created_at.isoformat() if export.created_at else None,
+        "completed_at": export.completed_at.isoformat() if export.completed_at else None,
+    }
+
+
+async def notify_export_event(session: AsyncSession, export) -> None:
+    """Queue a NOTIFY for ``export``; Postgres delivers it when the transaction commits."""
+    payload = json.dumps(export_event_payload(export), separators=(",", ":"))
+    await session.execute(select(func.pg_notify(EXPORT_EVENTS_CHANNEL, payload)))
+
+
+def format_sse(event: str, data: dict[str, Any], event_id: str | None = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def iter_export_events(
+    request: Request,
+    user_id: str,
+    render: Callable[[dict[str, Any]], dict[str, Any] | None],
+    broker: EventBroker = export_events,
+) -> AsyncIterator[str]:
+    """Server-sent events for the exports requested by ``user_id``.
+
+    ``render`` turns a raw event into the client payload, or returns None to skip
+    events the caller may not see. Keep-alive comments are sent when idle, which
+    is also when a disconnected client is noticed.
+    """
+    queue = broker.subscribe(user_id)
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=settings.export_events_heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n"
+                continue
+
+            data = render(event)
+            if data is None:
+                continue
+            name = data["status"] if data.get("status") in {"completed", "failed"} else "progress"
+            yield format_sse(name, data, event_id=data.get("id"))
+    finally:
+        broker.unsubscribe(user_id, queue)
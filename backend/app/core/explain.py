@@ -0,0 +1,84 @@
+import json
+from typing import Any, Iterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+
+class Explain(Executable, ClauseElement):
+    """Wraps a statement in ``EXPLAIN (FORMAT JSON)`` while keeping its bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement, analyze: bool = False) -> None:
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    options = "ANALYZE, FORMAT JSON" if element.analyze else "FORMAT JSON"
+    return f"EXPLAIN ({options}) " + compiler.process(element.statement, **kw)
+
+
+async def explain_plan(session: AsyncSession, statement, analyze: bool = False) -> dict[str, Any]:
+    """Return the top-level plan node produced by the planner for ``statement``."""
+    raw = await session.scalar(Explain(statement, analyze=analyze))
+    document = json.loads(raw) if isinstance(raw, str) else raw
+    if isinstance(document, list) and document:
+        return document[0].get("Plan", {})
+    return {}
+
+
+async def estimate_row_count(session: AsyncSession, statement) -> int:
+    """Planner row estimate for ``statement``; cheap because nothing is executed."""
+    plan = await explain_plan(session, statement)
+    return int(plan.get("Plan Rows") or 0)
+
+
+SCAN_NODE_TYPES = {"Seq Scan"}
+SORT_NODE_TYPES = {"Sort", "Incremental Sort"}
+
+
+def plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield ``plan`` and every node below it, depth first."""
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from plan_nodes(child)
+
+
+def node_rows(node: dict[str, Any]) -> float:
+    """Rows a node produced: actual when analyzed, otherwise the planner estimate."""
+    if "Actual Rows" in node:
+        return node["Actual Rows"] * node.get("Actual Loops", 1)
+    return node.get("Plan Rows", 0)
+
+
+def scanned_rows(node: dict[str, Any]) -> float:
+    """Rows a scan read, counting those its filter threw away when analyzed."""
+    removed = node.get("Rows Removed by Filter", 0) * node.get("Actual Loops", 1)
+    return node_rows(node) + removed
+
+
+def find_plan_regressions(plan: dict[str, Any], row_threshold: int) -> list[str]:
+    """Describe sequential scans and sorts in ``plan`` that touch ``row_threshold`` rows or more.
+
+    A sort is measured by its input, since a top-N sort under a LIMIT still has
+    to read every row it is given.
+    """
+    problems = []
+    for node in plan_nodes(plan):
+        node_type = node.get("Node Type")
+        if node_type in SCAN_NODE_TYPES:
+            rows = scanned_rows(node)
+            if rows >= row_threshold:
+                problems.append(f"{node_type} on {node.get('Relation Name')} ({rows:.0f} rows)")
+        elif node_type in SORT_NODE_TYPES:
+            children = node.get("Plans") or [node]
+            rows = node_rows(children[0])
+            if rows >= row_threshold:
+                keys = ", ".join(node.get("Sort Key", ()))
+                problems.append(f"{node_type} on {keys} ({rows:.0f} rows)")
+    return problems
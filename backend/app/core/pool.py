@@ -0,0 +1,172 @@
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """Checkout counters for one of this process's connection pools."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.checkout_wait_seconds_total = 0.0
+        self.checkout_wait_seconds_max = 0.0
+        self.slow_checkouts = 0
+        self.checkout_timeouts = 0
+        self.liveness_failures = 0
+
+    def record_checkout(self, waited: float) -> None:
+        self.checkouts += 1
+        self.checkout_wait_seconds_total += waited
+        self.checkout_wait_seconds_max = max(self.checkout_wait_seconds_max, waited)
+        if waited * 1000 >= settings.database_pool_slow_checkout_ms:
+            self.slow_checkouts += 1
+            logger.warning("Database connection checkout waited %.0f ms", waited * 1000)
+
+    def record_timeout(self) -> None:
+        self.checkout_timeouts += 1
+
+    def record_liveness_failure(self) -> None:
+        self.liveness_failures += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        average = self.checkout_wait_seconds_total / self.checkouts if self.checkouts else 0.0
+        return {
+            "checkouts": self.checkouts,
+            "checkout_wait_ms_avg": round(average * 1000, 3),
+            "checkout_wait_ms_max": round(self.checkout_wait_seconds_max * 1000, 3),
+            "slow_checkouts": self.slow_checkouts,
+            "checkout_timeouts": self.checkout_timeouts,
+            "liveness_failures": self.liveness_failures,
+        }
+
+
+pool_metrics = PoolMetrics()
+replica_pool_metrics = PoolMetrics()
+
+# Set around the liveness probe so its checkout is not counted as request traffic.
+_liveness_probe: ContextVar[bool] = ContextVar("liveness_probe", default=False)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited.
+
+    The wait covers queueing for a free connection and, within the overflow
+    allowance, opening a new one.
+    """
+
+    metrics = pool_metrics
+
+    def connect(self):
+        if _liveness_probe.get():
+            return super().connect()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - started)
+        return connection
+
+
+class ReplicaQueuePool(InstrumentedQueuePool):
+    metrics = replica_pool_metrics
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def pool_limits() -> tuple[int, int]:
+    """Per-process ``(pool_size, max_overflow)``, within the connection budget if set."""
+    size = max(settings.database_pool_size, 0)
+    overflow = max(settings.database_max_overflow, 0)
+    if settings.database_max_connections > 0 and size:
+        per_process = max(settings.database_max_connections // max(settings.web_concurrency, 1), 1)
+        size = min(size, per_process)
+        overflow = min(overflow, per_process - size)
+    return size, overflow
+
+
+def engine_options(poolclass: type[InstrumentedQueuePool] = InstrumentedQueuePool) -> dict[str, Any]:
+    """Keyword arguments for the application's ``create_async_engine`` calls."""
+    if settings.database_pool_profile == "pgbouncer":
+        # In transaction mode consecutive statements may run on different server
+        # connections, so nothing prepared on one can be looked up on the next.
+        connect_args: dict[str, Any] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    else:
+        connect_args = {
+            "statement_cache_size": settings.database_statement_cache_size,
+            "prepared_statement_cache_size": settings.database_statement_cache_size,
+        }
+    options: dict[str, Any] = {"echo": False, "connect_args": connect_args}
+    size, overflow = pool_limits()
+    if not size:
+        options["poolclass"] = NullPool
+        return options
+    options.update(
+        poolclass=poolclass,
+        pool_size=size,
+        max_overflow=overflow,
+        pool_timeout=settings.database_pool_timeout_seconds,
+        pool_recycle=settings.database_pool_recycle_seconds,
+        pool_pre_ping=settings.database_pool_liveness_seconds <= 0,
+    )
+    return options
+
+
+def pool_status(pool: Pool) -> dict[str, Any]:
+    status: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            pool_size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    status.update(getattr(pool, "metrics", pool_metrics).as_dict())
+    return status
+
+
+async def check_pool_liveness(engine: AsyncEngine) -> bool:
+    """Ping one idle pooled connection; returns False when it was dead.
+
+    The pool hands out its oldest idle connection first, so successive checks
+    rotate through them. A disconnect invalidates the whole pool, so every
+    connection opened before it is replaced on its next checkout instead of
+    failing a request; pool_recycle bounds the age of the rest.
+    """
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedQueuePool) or not pool.checkedin():
+        return True
+    token = _liveness_probe.set(True)
+    try:
+        async with engine.connect() as connection:
+            await connection.exec_driver_sql("SELECT 1")
+    except exc.DBAPIError as error:
+        if not error.connection_invalidated:
+            raise
+        pool.metrics.record_liveness_failure()
+        logger.warning("Database pool liveness check found a dead connection; pool invalidated")
+        return False
+    finally:
+        _liveness_probe.reset(token)
+    return True
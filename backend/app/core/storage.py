@@ -1,15 +1,35 @@
 import csv
+import gzip
+import hashlib
+import json
+import shutil
+import uuid
+import zipfile
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from decimal import Decimal
+from itertools import islice
+from typing import IO, Iterable, Iterator
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import xlsxwriter
 from fpdf import FPDF
 
 
+GZIP_SUFFIX = ".gz"
+DIGEST_CHUNK_SIZE = 1024 * 1024
+PARQUET_ROW_GROUP_SIZE = 50_000
+# Archive members in these formats are already compressed internally.
+PRECOMPRESSED_SUFFIXES = (".xlsx", ".parquet")
+
+
 class ReportStorage:
-    def __init__(self, base_path: str) -> None:
+    def __init__(self, base_path: str, compress: bool = False) -> None:
         self.base_path = Path(base_path)
+        # Text formats (CSV, NDJSON) are gzip-compressed on disk when enabled. The
+        # returned file name keeps the plain extension used for downloads.
+        self.compress = compress
 
     def save_export(
         self,
@@ -22,6 +42,10 @@ class ReportStorage:
         export_format = export_format.lower()
         if export_format == "csv":
             return self.save_csv(report_code, columns, rows)
+        if export_format == "ndjson":
+            return self.save_ndjson(report_code, columns, rows)
+        if export_format == "parquet":
+            return self.save_parquet(report_code, columns, rows)
         if export_format == "excel":
             return self.save_excel(report_code, columns, rows)
         if export_format == "pdf":
@@ -37,11 +61,11 @@ class ReportStorage:
         self.base_path.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
         file_name = f"{report_code}-{timestamp}.csv"
-        file_path = self.base_path / file_name
+        file_path = self._text_path(file_name)
 
         header, keys = self._header_and_keys(columns)
 
-        with file_path.open("w", newline="", encoding="utf-8") as handle:
+        with self._open_text(file_path) as handle:
             writer = csv.writer(handle)
             writer.writerow(header)
             for row in rows:
@@ -49,6 +73,54 @@ class ReportStorage:
 
         return str(file_path), file_name
 
+    def save_ndjson(
+        self,
+        report_code: str,
+        columns: Iterable[dict[str, str]],
+        rows: Iterable[dict[str, object]],
+    ) -> tuple[str, str]:
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        file_name = f"{report_code}-{timestamp}.ndjson"
+        file_path = self._text_path(file_name)
+
+        _, keys = self._header_and_keys(columns)
+
+        with self._open_text(file_path) as handle:
+            for row in rows:
+                record = {key: self._json_value(row.get(key)) for key in keys}
+                handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+        return str(file_path), file_name
+
+    def save_parquet(
+        self,
+        report_code: str,
+        columns: Iterable[dict[str, str]],
+        rows: Iterable[dict[str, object]],
+    ) -> tuple[str, str]:
+        """Write typed columns, one row group per ``PARQUET_ROW_GROUP_SIZE`` rows.
+
+        The schema is fixed from the first row group (see ``_parquet_type``), so
+        only one group of rows is held in memory at a time.
+        """
+        writer = self.open_parquet(report_code, columns)
+        row_iter = iter(rows)
+        try:
+            while batch := list(islice(row_iter, PARQUET_ROW_GROUP_SIZE)):
+                writer.write(batch)
+        except Exception:
+            writer.discard()
+            raise
+        return writer.close()
+
+    def open_parquet(self, report_code: str, columns: Iterable[dict[str, str]]) -> "ParquetExportWriter":
+        """Start a Parquet export that is fed rows in batches; see :class:`ParquetExportWriter`."""
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        file_name = f"{report_code}-{timestamp}.parquet"
+        return ParquetExportWriter(self.base_path / file_name, columns)
+
     def save_excel(
         self,
         report_code: str,
@@ -122,6 +194,164 @@ class ReportStorage:
         pdf.output(str(file_path))
         return str(file_path), file_name
 
+    def save_part(
+        self,
+        part_path: str,
+        export_format: str,
+        columns: Iterable[dict[str, str]],
+        rows: Iterable[dict[str, object]],
+        include_header: bool = False,
+    ) -> str:
+        """Render one shard of a CSV/NDJSON export for later :meth:`merge_parts`.
+
+        Compressed parts are complete gzip members, so concatenating their bytes
+        yields a valid multi-member gzip file.
+        """
+        path = Path(part_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header, keys = self._header_and_keys(columns)
+
+        with self._open_text(path) as handle:
+            if export_format == "csv":
+                writer = csv.writer(handle)
+                if include_header:
+                    writer.writerow(header)
+                for row in rows:
+                    writer.writerow([self._format_value(row.get(key)) for key in keys])
+            elif export_format == "ndjson":
+                for row in rows:
+                    record = {key: self._json_value(row.get(key)) for key in keys}
+                    handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+            else:
+                raise ValueError("Unsupported export format")
+
+        return str(path)
+
+    def part_path(self, export_id: str, export_format: str, index: int) -> str:
+        file_name = f"part-{index:04d}.{export_format}"
+        return str(self.base_path / "parts" / export_id / self._text_path(file_name).name)
+
+    def discard_parts(self, export_id: str) -> None:
+        shutil.rmtree(self.base_path / "parts" / export_id, ignore_errors=True)
+
+    def merge_parts(self, report_code: str, export_format: str, part_paths: Iterable[str]) -> tuple[str, str]:
+        """Concatenate rendered parts, in order, into the final export and remove them."""
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        file_name = f"{report_code}-{timestamp}.{export_format}"
+        file_path = self._text_path(file_name)
+
+        part_list = [Path(part) for part in part_paths]
+        with file_path.open("wb") as target:
+            for part in part_list:
+                with part.open("rb") as source:
+                    while chunk := source.read(DIGEST_CHUNK_SIZE):
+                        target.write(chunk)
+        for part in part_list:
+            part.unlink(missing_ok=True)
+        if part_list:
+            try:
+                part_list[0].parent.rmdir()
+            except OSError:
+                pass
+
+        return str(file_path), file_name
+
+    def build_bundle(self, entries: Iterable[tuple[str, str]]) -> str:
+        """Pack ``(file_path, archive_name)`` entries into one zip and return its path.
+
+        Gzip artifacts are inflated into the archive so the bundle holds plain files.
+        """
+        bundle_dir = self.base_path / "bundles"
+        bundle_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        bundle_path = bundle_dir / f"exports-{timestamp}-{uuid.uuid4().hex[:8]}.zip"
+
+        used_names: set[str] = set()
+        try:
+            with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for file_path, archive_name in entries:
+                    name = archive_name
+                    counter = 1
+                    while name in used_names:
+                        stem, dot, suffix = archive_name.rpartition(".")
+                        name = f"{stem}-{counter}.{suffix}" if dot else f"{archive_name}-{counter}"
+                        counter += 1
+                    used_names.add(name)
+
+                    source = Path(file_path)
+                    info = zipfile.ZipInfo.from_file(source, arcname=name)
+                    # Deflating an already-compressed format again only costs CPU.
+                    info.compress_type = (
+                        zipfile.ZIP_STORED if name.endswith(PRECOMPRESSED_SUFFIXES) else zipfile.ZIP_DEFLATED
+                    )
+                    opener = gzip.open if source.suffix == GZIP_SUFFIX else open
+                    with opener(source, "rb") as src, archive.open(info, "w", force_zip64=True) as dst:
+                        while chunk := src.read(DIGEST_CHUNK_SIZE):
+                            dst.write(chunk)
+        except BaseException:
+            bundle_path.unlink(missing_ok=True)
+            raise
+
+        return str(bundle_path)
+
+    def partition_path(self, tenant_id: object | None, when: datetime) -> str:
+        """Directory for one export's artifacts, sharded by owner and day.
+
+        Keeps any single directory small and lets whole tenants or days be
+        listed, backed up or removed cheaply.
+        """
+        owner = Path("tenants") / str(tenant_id) if tenant_id else Path("platform")
+        return str(self.base_path / owner / when.strftime("%Y/%m/%d"))
+
+    def iter_files(self) -> Iterator[Path]:
+        if not self.base_path.is_dir():
+            return
+        for path in self.base_path.rglob("*"):
+            if path.is_file():
+                yield path
+
+    def remove_artifact(self, file_path: str) -> int:
+        """Delete a stored file, prune emptied directories, and return the bytes freed."""
+        path = Path(file_path)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return 0
+
+        root = self.base_path.resolve()
+        parent = path.parent.resolve()
+        while parent != root and root in parent.parents:
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+        return size
+
+    @staticmethod
+    def file_digest(file_path: str) -> tuple[int, str]:
+        """Return ``(size, sha256 hex)`` of a stored artifact, used for strong ETags."""
+        digest = hashlib.sha256()
+        size = 0
+        with open(file_path, "rb") as handle:
+            while chunk := handle.read(DIGEST_CHUNK_SIZE):
+                digest.update(chunk)
+                size += len(chunk)
+        return size, digest.hexdigest()
+
+    def _text_path(self, file_name: str) -> Path:
+        if self.compress:
+            return self.base_path / f"{file_name}{GZIP_SUFFIX}"
+        return self.base_path / file_name
+
+    @staticmethod
+    def _open_text(file_path: Path) -> IO[str]:
+        if file_path.suffix == GZIP_SUFFIX:
+            return gzip.open(file_path, "wt", newline="", encoding="utf-8")
+        return file_path.open("w", newline="", encoding="utf-8")
+
     @staticmethod
     def _header_and_keys(columns: Iterable[dict[str, str]]) -> tuple[list[str], list[str]]:
         column_list = list(columns)
@@ -135,6 +365,53 @@ class ReportStorage:
             return value
         return value[: max_chars - 3] + "..."
 
+    @staticmethod
+    def _json_value(value: object) -> object:
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        return str(value)
+
+    @staticmethod
+    def _parquet_type(key: str, sample: list[object]) -> pa.DataType:
+        # Naming conventions win over sampling so an all-NULL first row group
+        # (e.g. ``resolved_at``) still gets the right type.
+        if key.endswith("_cents"):
+            return pa.int64()
+        if key.endswith("_at"):
+            return pa.timestamp("us", tz="UTC")
+        value = next((item for item in sample if item is not None), None)
+        if isinstance(value, bool):
+            return pa.bool_()
+        if isinstance(value, int):
+            return pa.int64()
+        if isinstance(value, (float, Decimal)):
+            return pa.float64()
+        if isinstance(value, datetime):
+            return pa.timestamp("us", tz="UTC")
+        if isinstance(value, date):
+            return pa.date32()
+        return pa.string()
+
+    @staticmethod
+    def _parquet_value(value: object, data_type: pa.DataType) -> object:
+        if value is None:
+            return None
+        if pa.types.is_string(data_type):
+            return ReportStorage._format_value(value)
+        if pa.types.is_timestamp(data_type):
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            if isinstance(value, datetime) and value.tzinfo is None:
+                return value.replace(tzinfo=timezone.utc)
+            return value
+        if pa.types.is_integer(data_type):
+            return int(value)
+        if pa.types.is_floating(data_type):
+            return float(value)
+        return value
+
     @staticmethod
     def _format_value(value: object) -> str:
         if value is None:
@@ -144,3 +421,56 @@ class ReportStorage:
         if isinstance(value, date):
             return value.isoformat()
         return str(value)
+
+
+class ParquetExportWriter:
+    """Parquet file written incrementally, one row group per ``PARQUET_ROW_GROUP_SIZE`` rows.
+
+    Rows are buffered only until a row group fills, and the schema is fixed from
+    the first group, so memory stays bounded however many rows are written.
+    """
+
+    def __init__(self, file_path: Path, columns: Iterable[dict[str, str]]) -> None:
+        self.file_path = file_path
+        _, self._keys = ReportStorage._header_and_keys(columns)
+        self._pending: list[dict[str, object]] = []
+        self._schema: pa.Schema | None = None
+        self._writer: pq.ParquetWriter | None = None
+
+    def write(self, rows: Iterable[dict[str, object]]) -> None:
+        self._pending.extend(rows)
+        while len(self._pending) >= PARQUET_ROW_GROUP_SIZE:
+            group = self._pending[:PARQUET_ROW_GROUP_SIZE]
+            del self._pending[:PARQUET_ROW_GROUP_SIZE]
+            self._write_group(group)
+
+    def close(self) -> tuple[str, str]:
+        # An export with no rows still gets a file with its schema.
+        if self._pending or self._writer is None:
+            self._write_group(self._pending)
+            self._pending = []
+        self._writer.close()
+        return str(self.file_path), self.file_path.name
+
+    def discard(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self.file_path.unlink(missing_ok=True)
+
+    def _write_group(self, rows: list[dict[str, object]]) -> None:
+        if self._schema is None:
+            self._schema = pa.schema(
+                [
+                    (key, ReportStorage._parquet_type(key, [row.get(key) for row in rows]))
+                    for key in self._keys
+                ]
+            )
+            self._writer = pq.ParquetWriter(str(self.file_path), self._schema, compression="zstd")
+        arrays = [
+            pa.array(
+                [ReportStorage._parquet_value(row.get(field.name), field.type) for row in rows],
+                type=field.type,
+            )
+            for field in self._schema
+        ]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
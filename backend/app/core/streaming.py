@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+import zlib
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+
+from app.core.storage import ReportStorage
+
+
+STREAM_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# Rows are buffered into chunks of this size so the ASGI server is not asked to
+# flush one tiny write per row.
+STREAM_CHUNK_ROWS = 500
+
+
+def ndjson_line(row: dict[str, Any]) -> str:
+    record = {key: ReportStorage._json_value(value) for key, value in row.items()}
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+async def iter_csv(
+    columns: Iterable[dict[str, str]],
+    rows: AsyncIterable[dict[str, Any]],
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+) -> AsyncIterator[str]:
+    header, keys = ReportStorage._header_and_keys(columns)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    pending = 0
+
+    async for row in rows:
+        writer.writerow([ReportStorage._format_value(row.get(key)) for key in keys])
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+
+    remainder = buffer.getvalue()
+    if remainder:
+        yield remainder
+
+
+async def iter_ndjson(
+    columns: Iterable[dict[str, str]],
+    rows: AsyncIterable[dict[str, Any]],
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+) -> AsyncIterator[str]:
+    _, keys = ReportStorage._header_and_keys(columns)
+    lines: list[str] = []
+
+    async for row in rows:
+        lines.append(ndjson_line({key: row.get(key) for key in keys}))
+        if len(lines) >= chunk_rows:
+            yield "".join(lines)
+            lines = []
+
+    if lines:
+        yield "".join(lines)
+
+
+def iter_stream(
+    stream_format: str,
+    columns: Iterable[dict[str, str]],
+    rows: AsyncIterable[dict[str, Any]],
+) -> AsyncIterator[str]:
+    if stream_format == "csv":
+        return iter_csv(columns, rows)
+    if stream_format == "ndjson":
+        return iter_ndjson(columns, rows)
+    raise ValueError("Unsupported stream format")
+
+
+async def iter_gzip(chunks: AsyncIterable[str]) -> AsyncIterator[bytes]:
+    """Gzip-encode a text stream incrementally, yielding only non-empty output."""
+    compressor = zlib.compressobj(wbits=31)
+    async for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
@@ -4,13 +4,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.core.database import AsyncSessionLocal
+from app.core.database import AsyncSessionLocal, replica_engine
 from app.core.seed import seed_initial_data
 from app.middleware.auth import JwtPayloadMiddleware
 from app.middleware.csrf import CsrfMiddleware
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.modules.tenant.middleware import TenantContextMiddleware
 from app.modules.auth.router import router as auth_router
+from app.modules.batch.router import router as batch_router
 from app.modules.admin.dashboard.router import router as admin_dashboard_router
 from app.modules.admin.hotels.router import router as admin_hotels_router
 from app.modules.admin.users.router import router as admin_users_router
@@ -37,6 +39,13 @@ from app.modules.hotel.audit.router import router as hotel_audit_router
 from app.modules.hotel.reports.router import router as hotel_reports_router
 from app.modules.hotel.profile.router import router as hotel_profile_router
 from app.modules.hotel.settings.router import router as hotel_settings_router
+from app.modules.hotel.search.router import router as hotel_search_router
+from app.workers.export_events import start_export_event_listener, stop_export_event_listener
+from app.workers.audit_partitions import start_audit_partition_worker, stop_audit_partition_worker
+from app.workers.audit_writer import start_audit_writer, stop_audit_writer
+from app.workers.guest_imports import start_guest_import_worker, stop_guest_import_worker
+from app.workers.pool_liveness import start_pool_liveness_worker, stop_pool_liveness_worker
+from app.workers.export_lifecycle import start_export_lifecycle_worker, stop_export_lifecycle_worker
 from app.workers.report_exports import start_report_export_worker, stop_report_export_worker
 
 
@@ -53,12 +62,24 @@ def create_app() -> FastAPI:
                 await seed_initial_data(session)
 
         # Start background workers (existing behavior)
+        start_pool_liveness_worker()
+        start_audit_writer()
         start_report_export_worker()
+        start_export_event_listener()
+        start_export_lifecycle_worker()
+        start_audit_partition_worker()
+        start_guest_import_worker()
 
         yield
 
         # Shutdown: stop background workers (existing behavior)
+        await stop_guest_import_worker()
+        await stop_audit_partition_worker()
+        await stop_export_lifecycle_worker()
+        await stop_export_event_listener()
         await stop_report_export_worker()
+        await stop_audit_writer()
+        await stop_pool_liveness_worker()
 
     app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
@@ -74,9 +95,12 @@ def create_app() -> FastAPI:
     )
     app.add_middleware(TenantContextMiddleware)
     app.add_middleware(JwtPayloadMiddleware)
+    if replica_engine is not None:
+        app.add_middleware(ReadYourWritesMiddleware)
     app.add_middleware(CsrfMiddleware)
 
     app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
+    app.include_router(batch_router, prefix="/api/batch", tags=["batch"])
     app.include_router(admin_dashboard_router, prefix="/api/admin/dashboard", tags=["admin-dashboard"])
     app.include_router(admin_hotels_router, prefix="/api/admin/hotels", tags=["admin-hotels"])
     app.include_router(admin_users_router, prefix="/api/admin/users", tags=["admin-users"])
@@ -103,6 +127,7 @@ def create_app() -> FastAPI:
     app.include_router(hotel_reports_router, prefix="/api/hotel/reports", tags=["hotel-reports"])
     app.include_router(hotel_profile_router, prefix="/api/hotel/profile", tags=["hotel-profile"])
     app.include_router(hotel_settings_router, prefix="/api/hotel/settings", tags=["hotel-settings"])
+    app.include_router(hotel_search_router, prefix="/api/hotel/search", tags=["hotel-search"])
 
     @app.get("/api/health")
     async def health() -> dict[str, str]:
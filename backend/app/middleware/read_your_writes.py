@@ -0,0 +1,36 @@
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.core.database import PRIMARY_UNTIL_COOKIE
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Keep a client's replica-eligible reads on the primary right after it writes.
+
+    Successful unsafe requests set a short-lived cookie that ``get_read_session``
+    checks, so a report or dashboard loaded straight after a change shows it even
+    if the replica has not replayed it yet. Only registered when a replica is
+    configured.
+    """
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        response = await call_next(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            sticky_seconds = max(settings.database_replica_sticky_seconds, 1)
+            response.set_cookie(
+                key=PRIMARY_UNTIL_COOKIE,
+                value=str(int(time.time()) + sticky_seconds),
+                httponly=True,
+                secure=settings.cookie_secure,
+                samesite=settings.cookie_samesite,
+                max_age=sticky_seconds,
+                path="/",
+                domain=settings.cookie_domain,
+            )
+        return response
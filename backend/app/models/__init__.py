@@ -3,13 +3,16 @@ from app.models.plan import Plan
 from app.models.invoice import Invoice
 from app.models.subscription import Subscription
 from app.models.report_export import ReportExport
+from app.models.report_rollup import RevenueMonthlyRollup, TenantMonthlyRollup
 from app.models.kiosk import Kiosk
 from app.models.helpdesk_ticket import HelpdeskTicket
 from app.models.hotel_setting import HotelSetting
 from app.models.platform_setting import PlatformSetting
 from app.models.guest import Guest
+from app.models.guest_import import GuestImport
 from app.models.room import Room
 from app.models.incident import Incident
+from app.models.search_document import SearchDocument
 from app.models.rbac import Permission, Role, RolePermission, UserRole
 from app.models.tenant import Tenant
 from app.models.token import RefreshToken, RefreshTokenFamily
@@ -30,11 +33,15 @@ __all__ = [
     "Subscription",
     "Invoice",
     "ReportExport",
+    "RevenueMonthlyRollup",
+    "TenantMonthlyRollup",
     "Kiosk",
     "HelpdeskTicket",
     "HotelSetting",
     "PlatformSetting",
     "Guest",
+    "GuestImport",
     "Room",
     "Incident",
+    "SearchDocument",
 ]
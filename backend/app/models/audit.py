@@ -10,6 +10,11 @@ from app.models.base import Base
 
 
 class AuditLog(Base):
+    """Append-only audit trail, range-partitioned by UTC month on ``created_at``.
+
+    The database primary key is ``(id, created_at)``; ids are unique on their own.
+    """
+
     __tablename__ = "audit_logs"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -31,7 +36,9 @@ class AuditLog(Base):
     impersonated_by: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL")
     )
-    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Backward-compatible aliases used by existing HMS services/schemas.
     user_id = synonym("actor_user_id")
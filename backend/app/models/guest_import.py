@@ -0,0 +1,33 @@
+import datetime
+import uuid
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+
+
+class GuestImport(Base, TimestampMixin):
+    """A CSV or NDJSON guest upload, loaded in batches by the guest import worker."""
+
+    __tablename__ = "guest_imports"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    requested_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL")
+    )
+    import_format: Mapped[str] = mapped_column(String(10), nullable=False)
+    status: Mapped[str] = mapped_column(String(30), nullable=False, default="pending")
+    file_path: Mapped[str | None] = mapped_column(String(500))
+    file_size: Mapped[int | None] = mapped_column(BigInteger)
+    rows_processed: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    rows_imported: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    rows_failed: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # First guest_import_max_errors failures as {"row": n, "message": ...}.
+    errors: Mapped[list | None] = mapped_column(JSONB)
+    error_message: Mapped[str | None] = mapped_column(Text)
+    completed_at: Mapped[datetime.datetime | None] = mapped_column(DateTime(timezone=True))
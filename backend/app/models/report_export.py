@@ -1,7 +1,7 @@
 import datetime
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -25,5 +25,11 @@ class ReportExport(Base, TimestampMixin):
     filters: Mapped[dict | None] = mapped_column(JSONB)
     file_name: Mapped[str | None] = mapped_column(String(255))
     file_path: Mapped[str | None] = mapped_column(String(500))
+    file_size: Mapped[int | None] = mapped_column(BigInteger)
+    file_sha256: Mapped[str | None] = mapped_column(String(64))
+    shards_total: Mapped[int | None] = mapped_column(Integer)
+    shards_completed: Mapped[int | None] = mapped_column(Integer)
+    rows_total: Mapped[int | None] = mapped_column(BigInteger)
+    rows_processed: Mapped[int | None] = mapped_column(BigInteger)
     error_message: Mapped[str | None] = mapped_column(Text)
     completed_at: Mapped[datetime.datetime | None] = mapped_column(DateTime(timezone=True))
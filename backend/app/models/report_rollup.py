@@ -0,0 +1,33 @@
+import datetime
+
+from sqlalchemy import BigInteger, Date, DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class RevenueMonthlyRollup(Base):
+    """Per-month invoice totals, kept current by triggers on ``invoices``."""
+
+    __tablename__ = "revenue_monthly_rollups"
+
+    month: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    billed_cents: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    paid_cents: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    invoice_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class TenantMonthlyRollup(Base):
+    """Per-month count of new tenants, kept current by triggers on ``tenants``."""
+
+    __tablename__ = "tenant_monthly_rollups"
+
+    month: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    new_hotels: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
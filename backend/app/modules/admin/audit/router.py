@@ -1,9 +1,13 @@
-﻿from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+﻿from collections.abc import AsyncIterator
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.core.database import get_session
+from app.core.database import AsyncSessionLocal, get_read_session, get_session
+from app.core.downloads import accepts_gzip
+from app.core.streaming import STREAM_MEDIA_TYPES, iter_gzip
 from app.modules.auth.dependencies import require_permission
 from app.modules.admin.audit.schemas import (
     AuditLogListResponse,
@@ -11,6 +15,8 @@ from app.modules.admin.audit.schemas import (
     Pagination,
 )
 from app.modules.admin.audit.service import AuditLogService
+from app.services.audit_stream import iter_audit_ndjson, stream_upper_bound
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -24,13 +30,15 @@ router = APIRouter()
 async def list_audit_logs(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     user_id: str | None = Query(None),
     tenant_id: str | None = Query(None),
     action: str | None = Query(None),
     resource_type: str | None = Query(None),
     date_from: datetime | None = Query(None),
     date_to: datetime | None = Query(None),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> AuditLogListResponse:
     service = AuditLogService(session)
 
@@ -46,29 +54,99 @@ async def list_audit_logs(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid filter id"
         ) from exc
 
-    items, total = await service.list_logs(
-        page=page,
-        limit=limit,
-        user_id=user_uuid,
-        tenant_id=tenant_uuid,
-        action=action,
-        resource_type=resource_type,
-        date_from=date_from,
-        date_to=date_to,
-    )
+    try:
+        listing = await service.list_logs(
+            page=page,
+            limit=limit,
+            user_id=user_uuid,
+            tenant_id=tenant_uuid,
+            action=action,
+            resource_type=resource_type,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return AuditLogListResponse(
-        items=[AuditLogOut.model_validate(item) for item in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[AuditLogOut.model_validate(item) for item in listing.items],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
+async def _stream_audit_body(
+    until: datetime,
+    since: datetime | None,
+    since_id: UUID | None,
+    tenant_id: UUID | None,
+) -> AsyncIterator[str]:
+    # The stream outlives the request-scoped session, so it owns its own. It reads the
+    # primary: replica lag could exceed the settle window and skip rows past a watermark.
+    async with AsyncSessionLocal() as session:
+        rows = AuditLogService(session).stream_logs(until, since, since_id, tenant_id)
+        async for chunk in iter_audit_ndjson(rows):
+            yield chunk
+
+
+@router.get(
+    "/stream",
+    response_model=None,
+    dependencies=[Depends(require_permission("admin:audit:read"))],
+)
+async def stream_audit_logs(
+    request: Request,
+    since: datetime | None = Query(None),
+    since_id: str | None = Query(None),
+    tenant_id: str | None = Query(None),
+    gzip: bool = Query(False),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """Stream audit logs as NDJSON, oldest first, for SIEM collectors.
+
+    Resume by passing the last record's ``created_at`` and ``id`` as ``since``
+    and ``since_id``. ``X-Audit-Until`` reports the upper bound of this pull.
+    """
+    try:
+        since_uuid = UUID(since_id) if since_id else None
+        tenant_uuid = UUID(tenant_id) if tenant_id else None
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid filter id"
+        ) from exc
+    if since_uuid is not None and since is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="since_id requires since"
+        )
+
+    until = stream_upper_bound()
+    # The stream can run for a long time; release the auth lookup's connection now.
+    await session.close()
+    body = _stream_audit_body(until, since, since_uuid, tenant_uuid)
+    headers = {
+        "X-Accel-Buffering": "no",
+        "X-Audit-Until": until.isoformat(),
+        "Vary": "Accept-Encoding",
+    }
+    if gzip and accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        body = iter_gzip(body)
+    return StreamingResponse(body, media_type=STREAM_MEDIA_TYPES["ndjson"], headers=headers)
+
+
 @router.get(
     "/{audit_id}",
     response_model=AuditLogOut,
     dependencies=[Depends(require_permission("admin:audit:read"))],
 )
 async def get_audit_log(
-    audit_id: str, session: AsyncSession = Depends(get_session)
+    audit_id: str, session: AsyncSession = Depends(get_read_session)
 ) -> AuditLogOut:
     service = AuditLogService(session)
     try:
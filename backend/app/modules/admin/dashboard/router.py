@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_session
-from app.modules.admin.dashboard.schemas import AdminDashboardSummaryOut
+from app.core.database import engine, get_read_session, replica_engine
+from app.core.pool import pool_status
+from app.modules.admin.dashboard.schemas import AdminDashboardSummaryOut, DatabasePoolOut
 from app.modules.admin.dashboard.service import AdminDashboardService
 from app.modules.auth.dependencies import require_permission
 
@@ -16,8 +19,23 @@ router = APIRouter()
     dependencies=[Depends(require_permission("admin:dashboard:read"))],
 )
 async def get_dashboard_summary(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> AdminDashboardSummaryOut:
     service = AdminDashboardService(session)
     summary = await service.get_summary()
     return AdminDashboardSummaryOut.model_validate(summary)
+
+
+@router.get(
+    "/database-pool",
+    response_model=DatabasePoolOut,
+    dependencies=[Depends(require_permission("admin:dashboard:read"))],
+)
+async def get_database_pool(
+    target: Literal["primary", "replica"] = Query("primary"),
+) -> DatabasePoolOut:
+    # Per process: each worker process has its own pools and counters.
+    selected = replica_engine if target == "replica" else engine
+    if selected is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No replica configured")
+    return DatabasePoolOut.model_validate(pool_status(selected.sync_engine.pool))
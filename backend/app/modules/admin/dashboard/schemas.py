@@ -20,3 +20,18 @@ class AdminDashboardSummaryOut(BaseModel):
     outstanding_balance_cents: int
     new_hotels_last_30_days: int
     recent_hotels: list[RecentHotelOut]
+
+
+class DatabasePoolOut(BaseModel):
+    pool_class: str
+    pool_size: int | None = None
+    max_overflow: int | None = None
+    checked_out: int | None = None
+    checked_in: int | None = None
+    overflow: int | None = None
+    checkouts: int
+    checkout_wait_ms_avg: float
+    checkout_wait_ms_max: float
+    slow_checkouts: int
+    checkout_timeouts: int
+    liveness_failures: int
@@ -12,6 +12,7 @@ from app.modules.admin.helpdesk.schemas import (
     Pagination,
 )
 from app.modules.admin.helpdesk.service import HelpdeskService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -31,6 +32,8 @@ def build_out(ticket, tenant_name=None, assignee_email=None) -> HelpdeskOut:
 async def list_tickets(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     status_filter: str | None = Query(None, alias="status"),
     priority: str | None = Query(None),
     tenant_id: str | None = Query(None),
@@ -44,10 +47,30 @@ async def list_tickets(
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid tenant id") from exc
 
-    items, total = await service.list(page, limit, status_filter, priority, tenant_uuid)
+    try:
+        listing = await service.list(
+            page,
+            limit,
+            status_filter,
+            priority,
+            tenant_uuid,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return HelpdeskListResponse(
-        items=[build_out(ticket, tenant_name, assignee_email) for ticket, tenant_name, assignee_email in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[
+            build_out(ticket, tenant_name, assignee_email)
+            for ticket, tenant_name, assignee_email in listing.items
+        ],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
@@ -48,7 +48,9 @@ class HelpdeskOut(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class HelpdeskListResponse(BaseModel):
@@ -1,11 +1,13 @@
 from datetime import datetime, timezone
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.models.helpdesk_ticket import HelpdeskTicket
 from app.models.tenant import Tenant
 from app.models.user import User
+from app.services.base import ListPage, paginate
+from app.services.search import index_document, remove_document
 
 
 class HelpdeskService:
@@ -19,31 +21,35 @@ class HelpdeskService:
         status: str | None = None,
         priority: str | None = None,
         tenant_id: UUID | None = None,
-    ) -> tuple[list[tuple[HelpdeskTicket, str | None, str | None]], int]:
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> ListPage:
         page = max(page, 1)
         limit = max(min(limit, 100), 1)
 
-        total_stmt = select(func.count()).select_from(HelpdeskTicket)
         stmt = (
             select(HelpdeskTicket, Tenant.name, User.email)
             .join(Tenant, Tenant.id == HelpdeskTicket.tenant_id, isouter=True)
             .join(User, User.id == HelpdeskTicket.assigned_to, isouter=True)
-            .order_by(HelpdeskTicket.created_at.desc())
         )
         if status:
-            total_stmt = total_stmt.where(HelpdeskTicket.status == status)
             stmt = stmt.where(HelpdeskTicket.status == status)
         if priority:
-            total_stmt = total_stmt.where(HelpdeskTicket.priority == priority)
             stmt = stmt.where(HelpdeskTicket.priority == priority)
         if tenant_id:
-            total_stmt = total_stmt.where(HelpdeskTicket.tenant_id == tenant_id)
             stmt = stmt.where(HelpdeskTicket.tenant_id == tenant_id)
 
-        total = await self.session.scalar(total_stmt)
-        stmt = stmt.offset((page - 1) * limit).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.all(), int(total or 0)
+        return await paginate(
+            self.session,
+            stmt,
+            (HelpdeskTicket.created_at, HelpdeskTicket.id),
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            include_total=include_total,
+            count_key=("admin_helpdesk", tenant_id, status, priority),
+            filtered=bool(status or priority),
+        )
 
     async def get(self, ticket_id: UUID) -> HelpdeskTicket | None:
         return await self.session.get(HelpdeskTicket, ticket_id)
@@ -71,6 +77,8 @@ class HelpdeskService:
             assigned_to=payload.assigned_to,
         )
         self.session.add(ticket)
+        await self.session.flush()
+        await index_document(self.session, ticket)
         await self.session.commit()
         await self.session.refresh(ticket)
         return ticket
@@ -108,10 +116,13 @@ class HelpdeskService:
             ticket.closed_at = payload.closed_at
 
         self.session.add(ticket)
+        await self.session.flush()
+        await index_document(self.session, ticket)
         await self.session.commit()
         await self.session.refresh(ticket)
         return ticket
 
     async def delete(self, ticket: HelpdeskTicket) -> None:
+        await remove_document(self.session, ticket)
         await self.session.delete(ticket)
         await self.session.commit()
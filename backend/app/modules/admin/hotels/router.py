@@ -12,6 +12,7 @@ from app.modules.admin.hotels.schemas import (
     Pagination,
 )
 from app.modules.admin.hotels.service import HotelService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -25,13 +26,24 @@ router = APIRouter()
 async def list_hotels(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     session: AsyncSession = Depends(get_session),
 ) -> HotelListResponse:
     service = HotelService(session)
-    items, total = await service.list_hotels(page, limit)
+    try:
+        listing = await service.list_hotels(page, limit, cursor=cursor, include_total=include_total)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return HotelListResponse(
-        items=[HotelOut.model_validate(item) for item in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[HotelOut.model_validate(item) for item in listing.items],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
@@ -98,17 +110,16 @@ async def update_hotel(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid hotel id"
         ) from exc
 
-    tenant = await service.get(tenant_uuid)
-    if not tenant:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Hotel not found"
-        )
     try:
-        updated = await service.update(tenant, payload)
+        updated = await service.update(tenant_uuid, payload)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Hotel not found"
+        )
     return HotelOut.model_validate(updated)
 
 
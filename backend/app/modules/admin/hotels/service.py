@@ -1,8 +1,19 @@
 ﻿import re
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.tenant import Tenant
+from app.services.base import (
+    ListPage,
+    changed_fields,
+    insert_returning,
+    paginate,
+    update_returning,
+)
+
+
+# tenants.slug was declared unique inline, so it has PostgreSQL's default name.
+TENANT_CONSTRAINT_ERRORS = {"tenants_slug_key": "Slug already exists"}
 
 
 def slugify(value: str) -> str:
@@ -16,20 +27,26 @@ class HotelService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def list_hotels(self, page: int, limit: int) -> tuple[list[Tenant], int]:
+    async def list_hotels(
+        self,
+        page: int,
+        limit: int,
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> ListPage:
         page = max(page, 1)
         limit = max(min(limit, 100), 1)
 
-        total = await self.session.scalar(select(func.count()).select_from(Tenant))
-        stmt = (
-            select(Tenant)
-            .order_by(Tenant.created_at.desc())
-            .offset((page - 1) * limit)
-            .limit(limit)
+        return await paginate(
+            self.session,
+            select(Tenant),
+            (Tenant.created_at, Tenant.id),
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            include_total=include_total,
+            count_key=("hotels",),
         )
-        result = await self.session.execute(stmt)
-        items = result.scalars().all()
-        return items, int(total or 0)
 
     async def get(self, tenant_id) -> Tenant | None:
         return await self.session.get(Tenant, tenant_id)
@@ -40,42 +57,32 @@ class HotelService:
         if not slug:
             raise ValueError("Invalid slug")
 
-        existing = await self.session.scalar(select(Tenant).where(Tenant.slug == slug))
-        if existing:
-            raise ValueError("Slug already exists")
-
-        tenant = Tenant(
-            name=payload.name,
-            slug=slug,
-            status=payload.status,
-            subscription_tier=payload.subscription_tier,
+        tenant = await insert_returning(
+            self.session,
+            Tenant,
+            {
+                "name": payload.name,
+                "slug": slug,
+                "status": payload.status,
+                "subscription_tier": payload.subscription_tier,
+            },
+            TENANT_CONSTRAINT_ERRORS,
         )
-        self.session.add(tenant)
         await self.session.commit()
-        await self.session.refresh(tenant)
         return tenant
 
-    async def update(self, tenant: Tenant, payload) -> Tenant:
-        if payload.name is not None:
-            tenant.name = payload.name
-        if payload.status is not None:
-            tenant.status = payload.status
-        if payload.subscription_tier is not None:
-            tenant.subscription_tier = payload.subscription_tier
-        if payload.slug is not None:
-            slug = slugify(payload.slug)
-            if not slug:
+    async def update(self, tenant_id, payload) -> Tenant | None:
+        values = changed_fields(payload)
+        if "slug" in values:
+            values["slug"] = slugify(values["slug"])
+            if not values["slug"]:
                 raise ValueError("Invalid slug")
-            existing = await self.session.scalar(
-                select(Tenant).where(Tenant.slug == slug, Tenant.id != tenant.id)
-            )
-            if existing:
-                raise ValueError("Slug already exists")
-            tenant.slug = slug
 
-        self.session.add(tenant)
-        await self.session.commit()
-        await self.session.refresh(tenant)
+        tenant = await update_returning(
+            self.session, Tenant, tenant_id, values, constraint_errors=TENANT_CONSTRAINT_ERRORS
+        )
+        if tenant is not None and values:
+            await self.session.commit()
         return tenant
 
     async def delete(self, tenant: Tenant) -> None:
@@ -12,6 +12,7 @@ from app.modules.admin.invoices.schemas import (
     Pagination,
 )
 from app.modules.admin.invoices.service import InvoiceService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -35,16 +36,29 @@ def build_out(invoice, tenant_name=None, plan_name=None, plan_code=None) -> Invo
 async def list_invoices(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     session: AsyncSession = Depends(get_session),
 ) -> InvoiceListResponse:
     service = InvoiceService(session)
-    items, total = await service.list_invoices(page, limit)
+    try:
+        listing = await service.list_invoices(
+            page, limit, cursor=cursor, include_total=include_total
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return InvoiceListResponse(
         items=[
             build_out(invoice, tenant_name, plan_name, plan_code)
-            for invoice, tenant_name, plan_name, plan_code in items
+            for invoice, tenant_name, plan_name, plan_code in listing.items
         ],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
@@ -114,18 +128,16 @@ async def update_invoice(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid invoice id"
         ) from exc
 
-    invoice = await service.get(invoice_uuid)
-    if not invoice:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Invoice not found"
-        )
-
     try:
-        updated = await service.update(invoice, payload)
+        updated = await service.update(invoice_uuid, payload)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Invoice not found"
+        )
 
     tenant_name, plan_name, plan_code = await service.get_names(updated)
     return build_out(updated, tenant_name, plan_name, plan_code)
@@ -53,7 +53,9 @@ class InvoiceOut(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class InvoiceListResponse(BaseModel):
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
@@ -9,6 +9,10 @@ from app.models.invoice import Invoice
 from app.models.plan import Plan
 from app.models.subscription import Subscription
 from app.models.tenant import Tenant
+from app.services.base import ListPage, changed_fields, paginate, update_returning
+
+
+INVOICE_CONSTRAINT_ERRORS = {"ix_invoices_invoice_number": "Invoice number already exists"}
 
 
 def generate_invoice_number() -> str:
@@ -20,24 +24,27 @@ class InvoiceService:
         self.session = session
 
     async def list_invoices(
-        self, page: int, limit: int
-    ) -> tuple[list[tuple[Invoice, str | None, str | None, str | None]], int]:
+        self, page: int, limit: int, cursor: str | None = None, include_total: bool = True
+    ) -> ListPage:
         page = max(page, 1)
         limit = max(min(limit, 100), 1)
 
-        total = await self.session.scalar(select(func.count()).select_from(Invoice))
         stmt = (
             select(Invoice, Tenant.name, Plan.name, Plan.code)
             .join(Tenant, Tenant.id == Invoice.tenant_id)
             .join(Subscription, Subscription.id == Invoice.subscription_id)
             .join(Plan, Plan.id == Subscription.plan_id)
-            .order_by(Invoice.created_at.desc())
-            .offset((page - 1) * limit)
-            .limit(limit)
         )
-        result = await self.session.execute(stmt)
-        items = result.all()
-        return items, int(total or 0)
+        return await paginate(
+            self.session,
+            stmt,
+            (Invoice.created_at, Invoice.id),
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            include_total=include_total,
+            count_key=("admin_invoices",),
+        )
 
     async def get(self, invoice_id: UUID) -> Invoice | None:
         return await self.session.get(Invoice, invoice_id)
@@ -93,7 +100,34 @@ class InvoiceService:
         await self.session.refresh(invoice)
         return invoice
 
-    async def update(self, invoice: Invoice, payload) -> Invoice:
+    async def update(self, invoice_id: UUID, payload) -> Invoice | None:
+        values = changed_fields(payload)
+        if "tenant_id" in values or "subscription_id" in values:
+            # Moving an invoice is checked against its current row, so only
+            # this path reads the invoice before updating it.
+            invoice = await self.get(invoice_id)
+            if invoice is None:
+                return None
+            await self._check_ownership(invoice, payload)
+        if "invoice_number" in values:
+            values["invoice_number"] = values["invoice_number"].strip()
+            if not values["invoice_number"]:
+                raise ValueError("Invalid invoice number")
+        if "currency" in values:
+            values["currency"] = values["currency"].upper()
+
+        invoice = await update_returning(
+            self.session,
+            Invoice,
+            invoice_id,
+            values,
+            constraint_errors=INVOICE_CONSTRAINT_ERRORS,
+        )
+        if invoice is not None and values:
+            await self.session.commit()
+        return invoice
+
+    async def _check_ownership(self, invoice: Invoice, payload) -> None:
         next_tenant_id = payload.tenant_id or invoice.tenant_id
 
         if payload.tenant_id is not None:
@@ -111,44 +145,6 @@ class InvoiceService:
         if subscription and subscription.tenant_id != next_tenant_id:
             raise ValueError("Subscription does not belong to tenant")
 
-        if payload.tenant_id is not None:
-            invoice.tenant_id = payload.tenant_id
-        if payload.subscription_id is not None:
-            invoice.subscription_id = payload.subscription_id
-
-        if payload.invoice_number is not None:
-            invoice_number = payload.invoice_number.strip()
-            if not invoice_number:
-                raise ValueError("Invalid invoice number")
-            existing = await self.session.scalar(
-                select(Invoice).where(
-                    Invoice.invoice_number == invoice_number, Invoice.id != invoice.id
-                )
-            )
-            if existing:
-                raise ValueError("Invoice number already exists")
-            invoice.invoice_number = invoice_number
-
-        if payload.status is not None:
-            invoice.status = payload.status
-        if payload.amount_cents is not None:
-            invoice.amount_cents = payload.amount_cents
-        if payload.currency is not None:
-            invoice.currency = payload.currency.upper()
-        if payload.issued_at is not None:
-            invoice.issued_at = payload.issued_at
-        if payload.due_at is not None:
-            invoice.due_at = payload.due_at
-        if payload.paid_at is not None:
-            invoice.paid_at = payload.paid_at
-        if payload.notes is not None:
-            invoice.notes = payload.notes
-
-        self.session.add(invoice)
-        await self.session.commit()
-        await self.session.refresh(invoice)
-        return invoice
-
     async def delete(self, invoice: Invoice) -> None:
         await self.session.delete(invoice)
         await self.session.commit()
@@ -12,6 +12,7 @@ from app.modules.admin.kiosks.schemas import (
     Pagination,
 )
 from app.modules.admin.kiosks.service import KioskService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -34,13 +35,24 @@ def build_out(kiosk, tenant_name=None, issued_token: str | None = None) -> Kiosk
 async def list_kiosks(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     session: AsyncSession = Depends(get_session),
 ) -> KioskListResponse:
     service = KioskService(session)
-    items, total = await service.list(page, limit)
+    try:
+        listing = await service.list(page, limit, cursor=cursor, include_total=include_total)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return KioskListResponse(
-        items=[build_out(kiosk, tenant_name) for kiosk, tenant_name in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[build_out(kiosk, tenant_name) for kiosk, tenant_name in listing.items],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
@@ -98,14 +110,12 @@ async def update_kiosk(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid kiosk id") from exc
 
-    kiosk = await service.get(kiosk_uuid)
-    if not kiosk:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Kiosk not found")
-
     try:
-        updated, issued_token = await service.update(kiosk, payload)
+        updated, issued_token = await service.update(kiosk_uuid, payload)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if not updated:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Kiosk not found")
 
     return build_out(updated, issued_token=issued_token)
 
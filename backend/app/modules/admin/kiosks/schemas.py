@@ -39,7 +39,9 @@ class KioskOut(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class KioskListResponse(BaseModel):
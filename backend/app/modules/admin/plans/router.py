@@ -98,18 +98,16 @@ async def update_plan(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid plan id"
         ) from exc
 
-    plan = await service.get(plan_uuid)
-    if not plan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found"
-        )
-
     try:
-        updated = await service.update(plan, payload)
+        updated = await service.update(plan_uuid, payload)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found"
+        )
 
     return PlanOut.model_validate(updated)
 
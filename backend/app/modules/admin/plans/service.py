@@ -3,6 +3,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.plan import Plan
+from app.services.base import changed_fields, update_returning
 
 
 def normalize_code(value: str) -> str:
@@ -12,6 +13,13 @@ def normalize_code(value: str) -> str:
     return value.strip("-")
 
 
+# plans.code is unique both inline and through ix_plans_code.
+PLAN_CONSTRAINT_ERRORS = {
+    "plans_code_key": "Plan code already exists",
+    "ix_plans_code": "Plan code already exists",
+}
+
+
 class PlanService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -58,33 +66,20 @@ class PlanService:
         await self.session.refresh(plan)
         return plan
 
-    async def update(self, plan: Plan, payload) -> Plan:
-        if payload.name is not None:
-            plan.name = payload.name
-        if payload.description is not None:
-            plan.description = payload.description
-        if payload.price_cents is not None:
-            plan.price_cents = payload.price_cents
-        if payload.currency is not None:
-            plan.currency = payload.currency.upper()
-        if payload.billing_interval is not None:
-            plan.billing_interval = payload.billing_interval
-        if payload.is_active is not None:
-            plan.is_active = payload.is_active
-        if payload.code is not None:
-            code = normalize_code(payload.code)
-            if not code:
+    async def update(self, plan_id, payload) -> Plan | None:
+        values = changed_fields(payload)
+        if "currency" in values:
+            values["currency"] = values["currency"].upper()
+        if "code" in values:
+            values["code"] = normalize_code(values["code"])
+            if not values["code"]:
                 raise ValueError("Invalid code")
-            existing = await self.session.scalar(
-                select(Plan).where(Plan.code == code, Plan.id != plan.id)
-            )
-            if existing:
-                raise ValueError("Plan code already exists")
-            plan.code = code
 
-        self.session.add(plan)
-        await self.session.commit()
-        await self.session.refresh(plan)
+        plan = await update_returning(
+            self.session, Plan, plan_id, values, constraint_errors=PLAN_CONSTRAINT_ERRORS
+        )
+        if plan is not None and values:
+            await self.session.commit()
         return plan
 
     async def delete(self, plan: Plan) -> None:
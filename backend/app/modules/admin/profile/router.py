@@ -37,11 +37,10 @@ async def update_profile(
     session: AsyncSession = Depends(get_session),
 ) -> ProfileOut:
     service = ProfileService(session)
-    user = await service.get(current_user.id)
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     try:
-        updated = await service.update(user, payload)
+        updated = await service.update(current_user.id, payload)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if not updated:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return ProfileOut.model_validate(updated)
@@ -4,7 +4,8 @@ from pydantic import BaseModel, ConfigDict, Field
 from uuid import UUID
 
 
-ExportFormat = Literal["csv", "pdf", "excel"]
+ExportFormat = Literal["csv", "ndjson", "parquet", "pdf", "excel"]
+StreamFormat = Literal["csv", "ndjson"]
 
 
 class ReportMetric(BaseModel):
@@ -36,6 +37,12 @@ class ReportDetail(BaseModel):
     summary: list[ReportMetric]
     columns: list[ReportColumn]
     rows: list[dict[str, str | int | float | datetime | None]]
+    next_cursor: str | None = None
+
+
+class ReportSummary(BaseModel):
+    code: str
+    summary: list[ReportMetric]
 
 
 class ReportExportRequest(BaseModel):
@@ -45,6 +52,10 @@ class ReportExportRequest(BaseModel):
     status: str | None = None
 
 
+class ReportExportBundleRequest(BaseModel):
+    export_ids: list[UUID] = Field(min_length=1, max_length=20)
+
+
 class ReportExportOut(BaseModel):
     id: UUID
     report_code: str
@@ -52,8 +63,62 @@ class ReportExportOut(BaseModel):
     status: str
     file_name: str | None = None
     download_path: str | None = None
+    shards_total: int | None = None
+    shards_completed: int | None = None
+    rows_total: int | None = None
+    rows_processed: int | None = None
     error_message: str | None = None
     created_at: datetime | None = None
     completed_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class ExportLifecycleOut(BaseModel):
+    expired: int
+    evicted: int
+    rows_deleted: int
+    orphans_removed: int
+    bytes_reclaimed: int
+
+
+class AgingBucketOut(BaseModel):
+    code: str
+    label: str
+
+
+class AgingBucketTotals(BaseModel):
+    count: int
+    amount_cents: int
+
+
+class InvoiceAgingTenantRow(BaseModel):
+    tenant_id: UUID
+    hotel_name: str
+    buckets: dict[str, AgingBucketTotals]
+    total_outstanding_cents: int
+
+
+class InvoiceAgingResponse(BaseModel):
+    as_of: datetime
+    buckets: list[AgingBucketOut]
+    tenants: list[InvoiceAgingTenantRow]
+    next_cursor: str | None = None
+
+
+class InvoiceAgingInvoice(BaseModel):
+    id: UUID
+    tenant_id: UUID
+    invoice_number: str
+    hotel_name: str
+    amount_cents: int
+    status: str
+    due_at: datetime | None = None
+    days_overdue: int | None = None
+
+
+class InvoiceAgingInvoicePage(BaseModel):
+    bucket: str
+    as_of: datetime
+    items: list[InvoiceAgingInvoice]
+    next_cursor: str | None = None
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any
-
-from sqlalchemy import case, func, select
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Integer,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.core.config import settings
+from app.core.explain import estimate_row_count
 from app.core.storage import ReportStorage
 from app.models.invoice import Invoice
 from app.models.plan import Plan
 from app.models.report_export import ReportExport
+from app.models.report_rollup import RevenueMonthlyRollup, TenantMonthlyRollup
 from app.models.subscription import Subscription
 from app.models.tenant import Tenant
 from app.models.user import User
+from app.services.base import NULL_TIMESTAMP_FLOOR, apply_keyset, split_keyset_page
+from app.services.report_rollups import combine_with_rollup
 
 
 @dataclass(frozen=True)
@@ -54,6 +70,61 @@ REPORT_DEFINITIONS = {
 }
 
 
+REPORT_COLUMNS = {
+    "platform_overview": [],
+    "tenant_growth": [
+        {"key": "month", "label": "Month"},
+        {"key": "new_hotels", "label": "New Hotels"},
+    ],
+    "subscription_health": [
+        {"key": "hotel_name", "label": "Hotel"},
+        {"key": "plan_name", "label": "Plan"},
+        {"key": "status", "label": "Status"},
+        {"key": "period_end", "label": "Period End"},
+    ],
+    "revenue_snapshot": [
+        {"key": "month", "label": "Month"},
+        {"key": "total_billed", "label": "Total Billed (cents)"},
+        {"key": "total_paid", "label": "Total Paid (cents)"},
+        {"key": "total_outstanding", "label": "Outstanding (cents)"},
+    ],
+    "invoice_aging": [
+        {"key": "invoice_number", "label": "Invoice"},
+        {"key": "hotel_name", "label": "Hotel"},
+        {"key": "amount_cents", "label": "Amount (cents)"},
+        {"key": "status", "label": "Status"},
+        {"key": "due_at", "label": "Due Date"},
+        {"key": "days_overdue", "label": "Days Overdue"},
+        {"key": "aging_bucket", "label": "Aging Bucket"},
+    ],
+}
+
+
+@dataclass(frozen=True)
+class AgingBucket:
+    """Unpaid invoices whose whole days overdue fall in ``[min_days, max_days)``."""
+
+    code: str
+    label: str
+    min_days: int | None
+    max_days: int | None
+
+
+INVOICE_AGING_BUCKETS = (
+    AgingBucket(code="current", label="Current", min_days=None, max_days=1),
+    AgingBucket(code="1_30", label="1-30 days", min_days=1, max_days=31),
+    AgingBucket(code="31_60", label="31-60 days", min_days=31, max_days=61),
+    AgingBucket(code="61_90", label="61-90 days", min_days=61, max_days=91),
+    AgingBucket(code="90_plus", label="90+ days", min_days=91, max_days=None),
+)
+
+AGING_BUCKETS_BY_CODE = {bucket.code: bucket for bucket in INVOICE_AGING_BUCKETS}
+
+# Inlined rather than bound so the planner can prove the unpaid-invoice partial
+# indexes apply; a bind parameter would hide the value from it.
+UNPAID_INVOICE = Invoice.status != literal_column("'paid'")
+
+
 def apply_date_filter(stmt, column, date_from: datetime | None, date_to: datetime | None):
     if date_from:
         stmt = stmt.where(column >= date_from)
@@ -62,6 +133,33 @@ def apply_date_filter(stmt, column, date_from: datetime | None, date_to: datetim
     return stmt
 
 
+def aging_bucket_clause(bucket: AgingBucket, now: datetime):
+    """Sargable ``due_at`` range for ``bucket``; invoices without a due date count as current."""
+    conditions = [UNPAID_INVOICE]
+    if bucket.min_days is not None:
+        conditions.append(Invoice.due_at <= now - timedelta(days=bucket.min_days))
+    if bucket.max_days is not None:
+        upper = Invoice.due_at > now - timedelta(days=bucket.max_days)
+        conditions.append(or_(Invoice.due_at.is_(None), upper) if bucket.min_days is None else upper)
+    return and_(*conditions)
+
+
+def days_overdue_expr(now: datetime):
+    now_value = literal(now, DateTime(timezone=True))
+    days = cast(func.floor(func.extract("epoch", now_value - Invoice.due_at) / 86400), Integer)
+    return case((and_(UNPAID_INVOICE, Invoice.due_at < now_value), days), else_=None)
+
+
+def aging_bucket_expr(now: datetime):
+    # Oldest first, so each branch only needs its lower bound.
+    whens = [
+        (Invoice.due_at <= now - timedelta(days=bucket.min_days), bucket.label)
+        for bucket in reversed(INVOICE_AGING_BUCKETS)
+        if bucket.min_days is not None
+    ]
+    return case((~UNPAID_INVOICE, None), *whens, else_=INVOICE_AGING_BUCKETS[0].label)
+
+
 class ReportService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -115,7 +213,15 @@ class ReportService:
         date_from: datetime | None = None,
         date_to: datetime | None = None,
         status: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
+        """Build a report detail.
+
+        Without ``limit`` every row is returned (used by exports). With ``limit``
+        the rows are one keyset page and ``next_cursor`` resumes after it; the
+        summary is only computed for the first page.
+        """
         definition = REPORT_DEFINITIONS.get(report_code)
         if not definition:
             raise ValueError("Unknown report")
@@ -126,96 +232,119 @@ class ReportService:
             "status": status,
         }
 
-        if report_code == "platform_overview":
-            summary = await self._overview_metrics(date_from, date_to)
-            return {
-                "code": definition.code,
-                "title": definition.title,
-                "description": definition.description,
-                "filters": filters,
-                "summary": summary,
-                "columns": [],
-                "rows": [],
-            }
+        summary: list[dict[str, Any]] = []
+        if cursor is None:
+            summary = await self.get_report_summary(report_code, date_from, date_to)
 
-        if report_code == "tenant_growth":
-            summary = await self._tenant_metrics(date_from, date_to)
-            rows = await self._tenant_growth_rows(date_from, date_to)
-            columns = [
-                {"key": "month", "label": "Month"},
-                {"key": "new_hotels", "label": "New Hotels"},
-            ]
-            return {
-                "code": definition.code,
-                "title": definition.title,
-                "description": definition.description,
-                "filters": filters,
-                "summary": summary,
-                "columns": columns,
-                "rows": rows,
-            }
+        rows: list[dict[str, Any]] = []
+        next_cursor = None
+        if REPORT_COLUMNS[report_code]:
+            rows, next_cursor = await self._report_rows(
+                report_code, date_from, date_to, status, limit, cursor
+            )
+        return {
+            "code": definition.code,
+            "title": definition.title,
+            "description": definition.description,
+            "filters": filters,
+            "summary": summary,
+            "columns": REPORT_COLUMNS[report_code],
+            "rows": rows,
+            "next_cursor": next_cursor,
+        }
 
+    async def get_report_summary(
+        self,
+        report_code: str,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        if report_code == "platform_overview":
+            return await self._overview_metrics(date_from, date_to)
+        if report_code == "tenant_growth":
+            return await self._tenant_metrics(date_from, date_to)
         if report_code == "subscription_health":
-            summary = await self._subscription_metrics()
-            rows = await self._subscription_rows(date_from, date_to, status)
-            columns = [
-                {"key": "hotel_name", "label": "Hotel"},
-                {"key": "plan_name", "label": "Plan"},
-                {"key": "status", "label": "Status"},
-                {"key": "period_end", "label": "Period End"},
-            ]
-            return {
-                "code": definition.code,
-                "title": definition.title,
-                "description": definition.description,
-                "filters": filters,
-                "summary": summary,
-                "columns": columns,
-                "rows": rows,
-            }
-
+            return await self._subscription_metrics()
         if report_code == "revenue_snapshot":
-            summary = await self._revenue_metrics(date_from, date_to)
-            rows = await self._revenue_rows(date_from, date_to)
-            columns = [
-                {"key": "month", "label": "Month"},
-                {"key": "total_billed", "label": "Total Billed (cents)"},
-                {"key": "total_paid", "label": "Total Paid (cents)"},
-                {"key": "total_outstanding", "label": "Outstanding (cents)"},
-            ]
-            return {
-                "code": definition.code,
-                "title": definition.title,
-                "description": definition.description,
-                "filters": filters,
-                "summary": summary,
-                "columns": columns,
-                "rows": rows,
-            }
-
+            return await self._revenue_metrics(date_from, date_to)
         if report_code == "invoice_aging":
-            summary = await self._invoice_metrics(date_from, date_to)
-            rows = await self._invoice_rows(date_from, date_to)
-            columns = [
-                {"key": "invoice_number", "label": "Invoice"},
-                {"key": "hotel_name", "label": "Hotel"},
-                {"key": "amount_cents", "label": "Amount (cents)"},
-                {"key": "status", "label": "Status"},
-                {"key": "due_at", "label": "Due Date"},
-                {"key": "days_overdue", "label": "Days Overdue"},
-            ]
-            return {
-                "code": definition.code,
-                "title": definition.title,
-                "description": definition.description,
-                "filters": filters,
-                "summary": summary,
-                "columns": columns,
-                "rows": rows,
-            }
-
+            return await self._invoice_metrics(date_from, date_to)
         raise ValueError("Unknown report")
 
+    async def get_invoice_aging(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> dict[str, Any]:
+        """Outstanding amounts per tenant and aging bucket, from one grouped query."""
+        now = datetime.now(timezone.utc)
+        stmt = apply_keyset(
+            self._aging_by_tenant_stmt(now),
+            (Tenant.name, Tenant.id),
+            descending=False,
+            cursor=cursor,
+            limit=limit,
+        )
+        result = await self.session.execute(stmt)
+        page, next_cursor = split_keyset_page(result.all(), limit, 2)
+        return {
+            "as_of": now,
+            "buckets": [{"code": bucket.code, "label": bucket.label} for bucket in INVOICE_AGING_BUCKETS],
+            "tenants": [self._aging_tenant_row(row) for row in page],
+            "next_cursor": next_cursor,
+        }
+
+    async def list_aging_invoices(
+        self,
+        bucket_code: str,
+        tenant_id: UUID | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """Page the unpaid invoices in one aging bucket, oldest due date first."""
+        bucket = AGING_BUCKETS_BY_CODE.get(bucket_code)
+        if bucket is None:
+            raise ValueError("Unknown aging bucket")
+
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(
+                Invoice.id,
+                Invoice.tenant_id,
+                Invoice.invoice_number,
+                Tenant.name.label("hotel_name"),
+                Invoice.amount_cents,
+                Invoice.status,
+                Invoice.due_at,
+                days_overdue_expr(now).label("days_overdue"),
+            )
+            .join(Tenant, Tenant.id == Invoice.tenant_id)
+            .where(aging_bucket_clause(bucket, now))
+        )
+        if tenant_id:
+            stmt = stmt.where(Invoice.tenant_id == tenant_id)
+
+        # Overdue buckets never hold NULL due dates, so they can walk the partial index directly.
+        if bucket.min_days is None:
+            sort_keys = (func.coalesce(Invoice.due_at, NULL_TIMESTAMP_FLOOR), Invoice.id)
+        else:
+            sort_keys = (Invoice.due_at, Invoice.id)
+        stmt = apply_keyset(stmt, sort_keys, descending=False, cursor=cursor, limit=limit)
+        result = await self.session.execute(stmt)
+        page, next_cursor = split_keyset_page(result.all(), limit, len(sort_keys))
+        items = [
+            {
+                "id": row.id,
+                "tenant_id": row.tenant_id,
+                "invoice_number": row.invoice_number,
+                "hotel_name": row.hotel_name,
+                "amount_cents": row.amount_cents,
+                "status": row.status,
+                "due_at": row.due_at,
+                "days_overdue": row.days_overdue,
+            }
+            for row in page
+        ]
+        return {"bucket": bucket.code, "as_of": now, "items": items, "next_cursor": next_cursor}
+
     async def export_report(
         self,
         report_code: str,
@@ -227,7 +356,7 @@ class ReportService:
         status_filter: str | None = None,
     ) -> ReportExport:
         export_format = export_format.lower()
-        if export_format not in {"csv", "pdf", "excel"}:
+        if export_format not in {"csv", "ndjson", "parquet", "pdf", "excel"}:
             raise ValueError("Unsupported export format")
         if report_code not in REPORT_DEFINITIONS:
             raise ValueError("Unknown report")
@@ -253,6 +382,35 @@ class ReportService:
     async def get_export(self, export_id: UUID) -> ReportExport | None:
         return await self.session.get(ReportExport, export_id)
 
+    async def get_exports(self, export_ids: list[UUID]) -> list[ReportExport]:
+        stmt = select(ReportExport).where(ReportExport.id.in_(export_ids))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def estimate_report_rows(
+        self,
+        report_code: str,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        status: str | None = None,
+    ) -> int:
+        stmt, _, _ = self._ordered_rows_stmt(report_code, date_from, date_to, status)
+        return await estimate_row_count(self.session, stmt)
+
+    async def stream_report_rows(
+        self,
+        report_code: str,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        status: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield report rows from a server-side cursor without materializing the result."""
+        stmt, mapper, _ = self._ordered_rows_stmt(report_code, date_from, date_to, status)
+        stmt = stmt.execution_options(yield_per=settings.report_stream_fetch_size)
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield mapper(row)
+
     async def _overview_metrics(self, date_from: datetime | None, date_to: datetime | None) -> list[dict[str, Any]]:
         total_hotels = await self.session.scalar(select(func.count()).select_from(Tenant))
         total_admins = await self.session.scalar(
@@ -265,9 +423,8 @@ class ReportService:
             select(func.count()).select_from(Subscription).where(Subscription.status == "active")
         )
 
-        revenue_stmt = select(func.coalesce(func.sum(Invoice.amount_cents), 0)).select_from(Invoice)
-        revenue_stmt = apply_date_filter(revenue_stmt, Invoice.issued_at, date_from, date_to)
-        revenue_total = await self.session.scalar(revenue_stmt)
+        monthly = self._revenue_rows_stmt(date_from, date_to).subquery()
+        revenue_total = await self.session.scalar(select(func.coalesce(func.sum(monthly.c.total_billed), 0)))
 
         return [
             {"label": "Hotels", "value": int(total_hotels or 0)},
@@ -278,9 +435,8 @@ class ReportService:
         ]
 
     async def _tenant_metrics(self, date_from: datetime | None, date_to: datetime | None) -> list[dict[str, Any]]:
-        stmt = select(func.count()).select_from(Tenant)
-        stmt = apply_date_filter(stmt, Tenant.created_at, date_from, date_to)
-        new_hotels = await self.session.scalar(stmt)
+        monthly = self._tenant_growth_rows_stmt(date_from, date_to).subquery()
+        new_hotels = await self.session.scalar(select(func.coalesce(func.sum(monthly.c.new_hotels), 0)))
         return [{"label": "New Hotels", "value": int(new_hotels or 0)}]
 
     async def _subscription_metrics(self) -> list[dict[str, Any]]:
@@ -298,33 +454,35 @@ class ReportService:
         ]
 
     async def _invoice_metrics(self, date_from: datetime | None, date_to: datetime | None) -> list[dict[str, Any]]:
-        stmt = select(func.count()).select_from(Invoice)
-        stmt = apply_date_filter(stmt, Invoice.issued_at, date_from, date_to)
-        total = await self.session.scalar(stmt)
-
-        overdue_stmt = select(func.count()).select_from(Invoice).where(
-            Invoice.due_at.is_not(None),
-            Invoice.status != "paid",
-            Invoice.due_at < datetime.now(timezone.utc),
+        now = datetime.now(timezone.utc)
+        # Two statements so each filter sits in a WHERE the planner can use: the
+        # issued_at range for the count, and the unpaid partial indexes for the rest.
+        total_stmt = apply_date_filter(
+            select(func.count()).select_from(Invoice), Invoice.issued_at, date_from, date_to
+        )
+        total = await self.session.scalar(total_stmt)
+        unpaid_stmt = (
+            select(
+                func.count().filter(Invoice.due_at < now),
+                func.coalesce(func.sum(Invoice.amount_cents), 0),
+            )
+            .select_from(Invoice)
+            .where(UNPAID_INVOICE)
         )
-        overdue = await self.session.scalar(overdue_stmt)
+        overdue, outstanding = (await self.session.execute(unpaid_stmt)).one()
         return [
             {"label": "Invoices", "value": int(total or 0)},
             {"label": "Overdue", "value": int(overdue or 0)},
+            {"label": "Outstanding (cents)", "value": int(outstanding or 0)},
         ]
 
     async def _revenue_metrics(self, date_from: datetime | None, date_to: datetime | None) -> list[dict[str, Any]]:
-        billed_stmt = select(func.coalesce(func.sum(Invoice.amount_cents), 0)).select_from(Invoice)
-        billed_stmt = apply_date_filter(billed_stmt, Invoice.issued_at, date_from, date_to)
-        total_billed = await self.session.scalar(billed_stmt)
-
-        paid_stmt = (
-            select(func.coalesce(func.sum(Invoice.amount_cents), 0))
-            .select_from(Invoice)
-            .where(Invoice.status == "paid")
+        monthly = self._revenue_rows_stmt(date_from, date_to).subquery()
+        totals_stmt = select(
+            func.coalesce(func.sum(monthly.c.total_billed), 0),
+            func.coalesce(func.sum(monthly.c.total_paid), 0),
         )
-        paid_stmt = apply_date_filter(paid_stmt, Invoice.issued_at, date_from, date_to)
-        total_paid = await self.session.scalar(paid_stmt)
+        total_billed, total_paid = (await self.session.execute(totals_stmt)).one()
 
         outstanding = int(total_billed or 0) - int(total_paid or 0)
         return [
@@ -333,98 +491,205 @@ class ReportService:
             {"label": "Outstanding (cents)", "value": outstanding},
         ]
 
-    async def _tenant_growth_rows(
-        self, date_from: datetime | None, date_to: datetime | None
-    ) -> list[dict[str, Any]]:
-        stmt = select(
-            func.date_trunc("month", Tenant.created_at).label("month"),
-            func.count().label("count"),
+    def _row_source(
+        self,
+        report_code: str,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        status: str | None,
+    ) -> tuple[Any, Callable[[Any], dict[str, Any]], tuple[Any, ...], bool]:
+        """Return ``(stmt, mapper, sort_keys, descending)`` for a report's rows.
+
+        Sort keys end with a unique column so keyset pages are stable. Monthly
+        aggregates are wrapped in a subquery so the month can act as the key.
+        """
+        if report_code == "tenant_growth":
+            monthly = self._tenant_growth_rows_stmt(date_from, date_to).subquery()
+            return select(monthly), self._tenant_growth_row, (monthly.c.month,), False
+        if report_code == "subscription_health":
+            sort_keys = (
+                func.coalesce(Subscription.current_period_end, NULL_TIMESTAMP_FLOOR),
+                Subscription.id,
+            )
+            stmt = self._subscription_rows_stmt(date_from, date_to, status)
+            return stmt, self._subscription_row, sort_keys, True
+        if report_code == "revenue_snapshot":
+            monthly = self._revenue_rows_stmt(date_from, date_to).subquery()
+            return select(monthly), self._revenue_row, (monthly.c.month,), False
+        if report_code == "invoice_aging":
+            sort_keys = (func.coalesce(Invoice.due_at, NULL_TIMESTAMP_FLOOR), Invoice.id)
+            stmt = self._invoice_rows_stmt(date_from, date_to, datetime.now(timezone.utc))
+            return stmt, self._invoice_row, sort_keys, True
+        if report_code in REPORT_DEFINITIONS:
+            raise ValueError("Report has no tabular rows")
+        raise ValueError("Unknown report")
+
+    def _ordered_rows_stmt(
+        self,
+        report_code: str,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        status: str | None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[Any, Callable[[Any], dict[str, Any]], int]:
+        stmt, mapper, sort_keys, descending = self._row_source(report_code, date_from, date_to, status)
+        stmt = apply_keyset(stmt, sort_keys, descending=descending, cursor=cursor, limit=limit)
+        return stmt, mapper, len(sort_keys)
+
+    async def _report_rows(
+        self,
+        report_code: str,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        status: str | None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        stmt, mapper, key_count = self._ordered_rows_stmt(
+            report_code, date_from, date_to, status, limit, cursor
         )
-        stmt = apply_date_filter(stmt, Tenant.created_at, date_from, date_to)
-        stmt = stmt.group_by("month").order_by("month")
         result = await self.session.execute(stmt)
-        rows = []
-        for month, count in result.all():
-            month_label = month.strftime("%Y-%m") if month else "unknown"
-            rows.append({"month": month_label, "new_hotels": int(count or 0)})
-        return rows
+        page, next_cursor = split_keyset_page(result.all(), limit, key_count)
+        return [mapper(row) for row in page], next_cursor
+
+    def _tenant_growth_rows_stmt(self, date_from: datetime | None, date_to: datetime | None):
+        rollup_stmt = select(
+            TenantMonthlyRollup.month.label("month"),
+            TenantMonthlyRollup.new_hotels.label("new_hotels"),
+        ).where(TenantMonthlyRollup.new_hotels > 0)
+        live_stmt = select(
+            self._utc_month(Tenant.created_at).label("month"),
+            func.count().label("new_hotels"),
+        )
+        live_stmt = apply_date_filter(live_stmt, Tenant.created_at, date_from, date_to).group_by("month")
+        return combine_with_rollup(
+            rollup_stmt, TenantMonthlyRollup.month, live_stmt, Tenant.created_at, date_from, date_to
+        )
+
+    @staticmethod
+    def _tenant_growth_row(row) -> dict[str, Any]:
+        month_label = row.month.strftime("%Y-%m") if row.month else "unknown"
+        return {"month": month_label, "new_hotels": int(row.new_hotels or 0)}
 
-    async def _subscription_rows(
+    def _subscription_rows_stmt(
         self, date_from: datetime | None, date_to: datetime | None, status: str | None
-    ) -> list[dict[str, Any]]:
+    ):
         stmt = (
-            select(Subscription, Tenant.name, Plan.name)
+            select(
+                Tenant.name.label("hotel_name"),
+                Plan.name.label("plan_name"),
+                Subscription.status,
+                Subscription.current_period_end,
+            )
+            .select_from(Subscription)
             .join(Tenant, Tenant.id == Subscription.tenant_id)
             .join(Plan, Plan.id == Subscription.plan_id)
-            .order_by(Subscription.current_period_end.desc())
         )
         if status:
             stmt = stmt.where(Subscription.status == status)
         if date_from or date_to:
             stmt = apply_date_filter(stmt, Subscription.current_period_end, date_from, date_to)
-        result = await self.session.execute(stmt)
-        rows = []
-        for subscription, tenant_name, plan_name in result.all():
-            rows.append(
-                {
-                    "hotel_name": tenant_name,
-                    "plan_name": plan_name,
-                    "status": subscription.status,
-                    "period_end": subscription.current_period_end,
-                }
-            )
-        return rows
+        return stmt
+
+    @staticmethod
+    def _subscription_row(row) -> dict[str, Any]:
+        return {
+            "hotel_name": row.hotel_name,
+            "plan_name": row.plan_name,
+            "status": row.status,
+            "period_end": row.current_period_end,
+        }
 
-    async def _revenue_rows(
-        self, date_from: datetime | None, date_to: datetime | None
-    ) -> list[dict[str, Any]]:
-        stmt = select(
-            func.date_trunc("month", Invoice.issued_at).label("month"),
+    def _revenue_rows_stmt(self, date_from: datetime | None, date_to: datetime | None):
+        rollup_stmt = select(
+            RevenueMonthlyRollup.month.label("month"),
+            RevenueMonthlyRollup.billed_cents.label("total_billed"),
+            RevenueMonthlyRollup.paid_cents.label("total_paid"),
+        ).where(RevenueMonthlyRollup.invoice_count > 0)
+        live_stmt = select(
+            self._utc_month(Invoice.issued_at).label("month"),
             func.coalesce(func.sum(Invoice.amount_cents), 0).label("total_billed"),
             func.coalesce(
                 func.sum(case((Invoice.status == "paid", Invoice.amount_cents), else_=0)), 0
             ).label("total_paid"),
+        ).where(Invoice.issued_at.is_not(None))
+        live_stmt = apply_date_filter(live_stmt, Invoice.issued_at, date_from, date_to).group_by("month")
+        return combine_with_rollup(
+            rollup_stmt, RevenueMonthlyRollup.month, live_stmt, Invoice.issued_at, date_from, date_to
         )
-        stmt = apply_date_filter(stmt, Invoice.issued_at, date_from, date_to)
-        stmt = stmt.group_by("month").order_by("month")
-        result = await self.session.execute(stmt)
-        rows = []
-        for month, total_billed, total_paid in result.all():
-            month_label = month.strftime("%Y-%m") if month else "unknown"
-            billed = int(total_billed or 0)
-            paid = int(total_paid or 0)
-            rows.append(
-                {
-                    "month": month_label,
-                    "total_billed": billed,
-                    "total_paid": paid,
-                    "total_outstanding": billed - paid,
-                }
-            )
-        return rows
 
-    async def _invoice_rows(
-        self, date_from: datetime | None, date_to: datetime | None
-    ) -> list[dict[str, Any]]:
-        stmt = select(Invoice, Tenant.name).join(Tenant, Tenant.id == Invoice.tenant_id)
+    @staticmethod
+    def _utc_month(column):
+        # Same bucketing as the rollup triggers: calendar months in UTC.
+        return cast(func.date_trunc("month", func.timezone("UTC", column)), Date)
+
+    @staticmethod
+    def _revenue_row(row) -> dict[str, Any]:
+        month_label = row.month.strftime("%Y-%m") if row.month else "unknown"
+        billed = int(row.total_billed or 0)
+        paid = int(row.total_paid or 0)
+        return {
+            "month": month_label,
+            "total_billed": billed,
+            "total_paid": paid,
+            "total_outstanding": billed - paid,
+        }
+
+    def _invoice_rows_stmt(self, date_from: datetime | None, date_to: datetime | None, now: datetime):
+        stmt = select(
+            Invoice.invoice_number,
+            Tenant.name.label("hotel_name"),
+            Invoice.amount_cents,
+            Invoice.status,
+            Invoice.due_at,
+            days_overdue_expr(now).label("days_overdue"),
+            aging_bucket_expr(now).label("aging_bucket"),
+        ).join(Tenant, Tenant.id == Invoice.tenant_id)
         stmt = apply_date_filter(stmt, Invoice.issued_at, date_from, date_to)
-        stmt = stmt.order_by(Invoice.due_at.desc().nullslast())
-        result = await self.session.execute(stmt)
-        now = datetime.now(timezone.utc)
-        rows = []
-        for invoice, tenant_name in result.all():
-            days_overdue = None
-            if invoice.due_at and invoice.status != "paid" and invoice.due_at < now:
-                days_overdue = (now - invoice.due_at).days
-            rows.append(
-                {
-                    "invoice_number": invoice.invoice_number,
-                    "hotel_name": tenant_name,
-                    "amount_cents": invoice.amount_cents,
-                    "status": invoice.status,
-                    "due_at": invoice.due_at,
-                    "days_overdue": days_overdue,
-                }
+        return stmt
+
+    @staticmethod
+    def _invoice_row(row) -> dict[str, Any]:
+        return {
+            "invoice_number": row.invoice_number,
+            "hotel_name": row.hotel_name,
+            "amount_cents": row.amount_cents,
+            "status": row.status,
+            "due_at": row.due_at,
+            "days_overdue": row.days_overdue,
+            "aging_bucket": row.aging_bucket,
+        }
+
+    def _aging_by_tenant_stmt(self, now: datetime):
+        columns = []
+        for bucket in INVOICE_AGING_BUCKETS:
+            clause = aging_bucket_clause(bucket, now)
+            columns.append(func.count().filter(clause).label(f"count_{bucket.code}"))
+            columns.append(
+                func.coalesce(func.sum(Invoice.amount_cents).filter(clause), 0).label(f"cents_{bucket.code}")
             )
-        return rows
+        return (
+            select(Tenant.id.label("tenant_id"), Tenant.name.label("hotel_name"), *columns)
+            .select_from(Invoice)
+            .join(Tenant, Tenant.id == Invoice.tenant_id)
+            .where(UNPAID_INVOICE)
+            .group_by(Tenant.id, Tenant.name)
+        )
 
+    @staticmethod
+    def _aging_tenant_row(row) -> dict[str, Any]:
+        values = row._mapping
+        buckets = {
+            bucket.code: {
+                "count": int(values[f"count_{bucket.code}"] or 0),
+                "amount_cents": int(values[f"cents_{bucket.code}"] or 0),
+            }
+            for bucket in INVOICE_AGING_BUCKETS
+        }
+        return {
+            "tenant_id": row.tenant_id,
+            "hotel_name": row.hotel_name,
+            "buckets": buckets,
+            "total_outstanding_cents": sum(item["amount_cents"] for item in buckets.values()),
+        }
@@ -1,8 +1,9 @@
-﻿from sqlalchemy import select
+﻿from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.models.rbac import Permission, Role, RolePermission
+from app.services.base import insert_returning
 
 
 class AdminRoleService:
@@ -67,22 +68,27 @@ class AdminRoleService:
 
         permissions = await self._validate_permissions(payload.permissions)
 
-        role = Role(
-            name=payload.name,
-            display_name=payload.display_name,
-            description=payload.description,
-            role_type="admin",
-            is_system=False,
-            tenant_id=None,
+        # unique_role_per_context treats the NULL tenant_id of platform roles as
+        # distinct, so the name check above cannot be left to the constraint.
+        role = await insert_returning(
+            self.session,
+            Role,
+            {
+                "name": payload.name,
+                "display_name": payload.display_name,
+                "description": payload.description,
+                "role_type": "admin",
+                "is_system": False,
+                "tenant_id": None,
+            },
         )
-        self.session.add(role)
-        await self.session.flush()
-
-        for perm in permissions:
-            self.session.add(RolePermission(role_id=role.id, permission_id=perm.id))
+        if permissions:
+            await self.session.execute(
+                insert(RolePermission),
+                [{"role_id": role.id, "permission_id": perm.id} for perm in permissions],
+            )
 
         await self.session.commit()
-        await self.session.refresh(role)
         return role
 
     async def update(self, role: Role, payload) -> Role:
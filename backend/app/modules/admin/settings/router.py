@@ -12,6 +12,7 @@ from app.modules.admin.settings.schemas import (
     Pagination,
 )
 from app.modules.admin.settings.service import SettingsService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -25,13 +26,24 @@ router = APIRouter()
 async def list_settings(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     session: AsyncSession = Depends(get_session),
 ) -> SettingListResponse:
     service = SettingsService(session)
-    items, total = await service.list(page, limit)
+    try:
+        listing = await service.list(page, limit, cursor=cursor, include_total=include_total)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return SettingListResponse(
-        items=[SettingOut.model_validate(item) for item in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[SettingOut.model_validate(item) for item in listing.items],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
@@ -89,11 +101,9 @@ async def update_setting(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid setting id") from exc
 
-    setting = await service.get(setting_uuid)
-    if not setting:
+    updated = await service.update(setting_uuid, payload, updated_by=current_user.id)
+    if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Setting not found")
-
-    updated = await service.update(setting, payload, updated_by=current_user.id)
     return SettingOut.model_validate(updated)
 
 
@@ -32,7 +32,9 @@ class SettingOut(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class SettingListResponse(BaseModel):
@@ -1,60 +1,70 @@
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.platform_setting import PlatformSetting
+from app.services.base import (
+    ListPage,
+    changed_fields,
+    insert_returning,
+    paginate,
+    update_returning,
+)
+
+
+SETTING_CONSTRAINT_ERRORS = {"ix_platform_settings_key": "Setting key already exists"}
 
 
 class SettingsService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def list(self, page: int, limit: int) -> tuple[list[PlatformSetting], int]:
+    async def list(
+        self,
+        page: int,
+        limit: int,
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> ListPage:
         page = max(page, 1)
         limit = max(min(limit, 100), 1)
 
-        total = await self.session.scalar(select(func.count()).select_from(PlatformSetting))
-        stmt = (
-            select(PlatformSetting)
-            .order_by(PlatformSetting.updated_at.desc())
-            .offset((page - 1) * limit)
-            .limit(limit)
+        return await paginate(
+            self.session,
+            select(PlatformSetting),
+            (PlatformSetting.updated_at, PlatformSetting.id),
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            include_total=include_total,
+            count_key=("platform_settings",),
         )
-        result = await self.session.execute(stmt)
-        items = result.scalars().all()
-        return items, int(total or 0)
 
     async def get(self, setting_id) -> PlatformSetting | None:
         return await self.session.get(PlatformSetting, setting_id)
 
     async def create(self, payload, updated_by=None) -> PlatformSetting:
-        existing = await self.session.scalar(
-            select(PlatformSetting).where(PlatformSetting.key == payload.key)
+        setting = await insert_returning(
+            self.session,
+            PlatformSetting,
+            {
+                "key": payload.key,
+                "value": payload.value,
+                "description": payload.description,
+                "updated_by": updated_by,
+            },
+            SETTING_CONSTRAINT_ERRORS,
         )
-        if existing:
-            raise ValueError("Setting key already exists")
-
-        setting = PlatformSetting(
-            key=payload.key,
-            value=payload.value,
-            description=payload.description,
-            updated_by=updated_by,
-        )
-        self.session.add(setting)
         await self.session.commit()
-        await self.session.refresh(setting)
         return setting
 
-    async def update(self, setting: PlatformSetting, payload, updated_by=None) -> PlatformSetting:
-        if payload.value is not None:
-            setting.value = payload.value
-        if payload.description is not None:
-            setting.description = payload.description
+    async def update(self, setting_id, payload, updated_by=None) -> PlatformSetting | None:
+        values = changed_fields(payload)
         if updated_by is not None:
-            setting.updated_by = updated_by
+            values["updated_by"] = updated_by
 
-        self.session.add(setting)
-        await self.session.commit()
-        await self.session.refresh(setting)
+        setting = await update_returning(self.session, PlatformSetting, setting_id, values)
+        if setting is not None and values:
+            await self.session.commit()
         return setting
 
     async def delete(self, setting: PlatformSetting) -> None:
@@ -12,6 +12,7 @@ from app.modules.admin.subscriptions.schemas import (
     Pagination,
 )
 from app.modules.admin.subscriptions.service import SubscriptionService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -37,16 +38,29 @@ def build_out(
 async def list_subscriptions(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     session: AsyncSession = Depends(get_session),
 ) -> SubscriptionListResponse:
     service = SubscriptionService(session)
-    items, total = await service.list_subscriptions(page, limit)
+    try:
+        listing = await service.list_subscriptions(
+            page, limit, cursor=cursor, include_total=include_total
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return SubscriptionListResponse(
         items=[
             build_out(subscription, tenant_name, plan_name, plan_code)
-            for subscription, tenant_name, plan_name, plan_code in items
+            for subscription, tenant_name, plan_name, plan_code in listing.items
         ],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
@@ -116,18 +130,16 @@ async def update_subscription(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid subscription id"
         ) from exc
 
-    subscription = await service.get(sub_uuid)
-    if not subscription:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Subscription not found"
-        )
-
     try:
-        updated = await service.update(subscription, payload)
+        updated = await service.update(sub_uuid, payload)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Subscription not found"
+        )
 
     tenant_name, plan_name, plan_code = await service.get_names(updated)
     return build_out(updated, tenant_name, plan_name, plan_code)
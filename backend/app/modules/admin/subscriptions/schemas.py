@@ -43,7 +43,9 @@ class SubscriptionOut(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class SubscriptionListResponse(BaseModel):
@@ -6,6 +6,13 @@ from uuid import UUID
 from app.models.plan import Plan
 from app.models.subscription import Subscription
 from app.models.tenant import Tenant
+from app.services.base import ListPage, changed_fields, paginate, update_returning
+
+
+SUBSCRIPTION_CONSTRAINT_ERRORS = {
+    "subscriptions_tenant_id_fkey": "Tenant not found",
+    "subscriptions_plan_id_fkey": "Plan not found",
+}
 
 
 class SubscriptionService:
@@ -13,25 +20,26 @@ class SubscriptionService:
         self.session = session
 
     async def list_subscriptions(
-        self, page: int, limit: int
-    ) -> tuple[list[tuple[Subscription, str | None, str | None, str | None]], int]:
+        self, page: int, limit: int, cursor: str | None = None, include_total: bool = True
+    ) -> ListPage:
         page = max(page, 1)
         limit = max(min(limit, 100), 1)
 
-        total = await self.session.scalar(
-            select(func.count()).select_from(Subscription)
-        )
         stmt = (
             select(Subscription, Tenant.name, Plan.name, Plan.code)
             .join(Tenant, Tenant.id == Subscription.tenant_id)
             .join(Plan, Plan.id == Subscription.plan_id)
-            .order_by(Subscription.created_at.desc())
-            .offset((page - 1) * limit)
-            .limit(limit)
         )
-        result = await self.session.execute(stmt)
-        items = result.all()
-        return items, int(total or 0)
+        return await paginate(
+            self.session,
+            stmt,
+            (Subscription.created_at, Subscription.id),
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            include_total=include_total,
+            count_key=("admin_subscriptions",),
+        )
 
     async def get(self, subscription_id: UUID) -> Subscription | None:
         return await self.session.get(Subscription, subscription_id)
@@ -77,37 +85,25 @@ class SubscriptionService:
         await self.session.refresh(subscription)
         return subscription
 
-    async def update(self, subscription: Subscription, payload) -> Subscription:
-        if payload.tenant_id is not None:
-            tenant = await self.session.get(Tenant, payload.tenant_id)
-            if not tenant:
-                raise ValueError("Tenant not found")
-            subscription.tenant_id = tenant.id
-
-        if payload.plan_id is not None:
-            plan = await self.session.get(Plan, payload.plan_id)
-            if not plan:
-                raise ValueError("Plan not found")
-            subscription.plan_id = plan.id
-
-        if payload.status is not None:
-            subscription.status = payload.status
-            if (
-                payload.status.lower() == "canceled"
-                and subscription.canceled_at is None
-            ):
-                subscription.canceled_at = datetime.now(timezone.utc)
-
-        if payload.current_period_end is not None:
-            subscription.current_period_end = payload.current_period_end
-        if payload.cancel_at is not None:
-            subscription.cancel_at = payload.cancel_at
-        if payload.canceled_at is not None:
-            subscription.canceled_at = payload.canceled_at
-
-        self.session.add(subscription)
-        await self.session.commit()
-        await self.session.refresh(subscription)
+    async def update(self, subscription_id: UUID, payload) -> Subscription | None:
+        values = changed_fields(payload)
+        if (
+            payload.status is not None
+            and payload.status.lower() == "canceled"
+            and "canceled_at" not in values
+        ):
+            values["canceled_at"] = func.coalesce(Subscription.canceled_at, func.now())
+
+        # Unknown tenants and plans surface as foreign key violations.
+        subscription = await update_returning(
+            self.session,
+            Subscription,
+            subscription_id,
+            values,
+            constraint_errors=SUBSCRIPTION_CONSTRAINT_ERRORS,
+        )
+        if subscription is not None and values:
+            await self.session.commit()
         return subscription
 
     async def delete(self, subscription: Subscription) -> None:
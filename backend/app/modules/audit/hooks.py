@@ -18,6 +18,7 @@ async def audit_event_stub(
     tenant_id: UUID | None = None,
     actor_user_id: UUID | None = None,
     acting_as_user_id: UUID | None = None,
+    critical: bool = False,
 ) -> None:
     """Emit an audit log entry using the current request's context.
     
@@ -38,19 +39,19 @@ async def audit_event_stub(
     - user_agent
     
     HMS-specific fields (resource_type, resource_id) are passed explicitly.
+    
+    While the AuditWriter runs, events are queued and inserted in batches
+    outside the caller's transaction. Pass ``critical=True`` for security-critical
+    events: they are flushed in the caller's session and commit or roll back
+    with its changes. A full queue falls back to the same in-transaction insert.
     """
     ctx = get_audit_runtime_context()
     effective_session = session or (ctx.session if ctx else None)
-    
-    if effective_session is None:
-        # Not in a request context — silently skip.
-        # This allows audit calls in tests or CLI without crashing.
-        return
 
-    from app.modules.audit.service import append_audit_log
+    from app.modules.audit.service import append_audit_log, audit_log_values
+    from app.modules.audit.writer import audit_writer
 
-    await append_audit_log(
-        session=effective_session,
+    fields = dict(
         action=action,
         tenant_id=tenant_id or (ctx.tenant_id if ctx else None),
         actor_user_id=actor_user_id or (ctx.actor_user_id if ctx else None),
@@ -61,3 +62,12 @@ async def audit_event_stub(
         ip_address=ctx.ip_address if ctx else None,
         user_agent=ctx.user_agent if ctx else None,
     )
+    if not critical and audit_writer.enqueue(audit_log_values(**fields)):
+        return
+
+    if effective_session is None:
+        # Not in a request context — silently skip.
+        # This allows audit calls in tests or CLI without crashing.
+        return
+
+    await append_audit_log(session=effective_session, **fields)
@@ -9,8 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.audit import AuditLog
 
 
-async def append_audit_log(
-    session: AsyncSession,
+def audit_log_values(
     *,
     action: str,
     tenant_id: UUID | None = None,
@@ -21,35 +20,66 @@ async def append_audit_log(
     resource_id: str | None = None,
     ip_address: str | None = None,
     user_agent: str | None = None,
-) -> AuditLog:
-    """Insert a single audit log row.
+) -> dict[str, Any]:
+    """Column values for one audit log row, keyed by AuditLog attribute name.
     
-    This function uses HMS's existing AuditLog model. It maps the AuthModule-style
-    field names (actor_user_id, acting_as_user_id, metadata) to the current HMS model
-    field names (user_id, impersonated_by, changes) until PR 5's migration is applied.
+    Maps the AuthModule-style field names (actor_user_id, acting_as_user_id, metadata)
+    to the HMS model's columns (actor_user_id, impersonated_by, metadata_json).
+    Shared by the in-transaction path below and the batched AuditWriter.
     """
-    # Build kwargs, mapping new names to old column names in the model
-    kwargs: dict[str, Any] = {
+    values: dict[str, Any] = {
         "action": action,
-        "changes": metadata if metadata is not None else {},  # Map metadata -> changes
+        "metadata_json": metadata if metadata is not None else {},
     }
-    
     if tenant_id is not None:
-        kwargs["tenant_id"] = tenant_id
+        values["tenant_id"] = tenant_id
     if actor_user_id is not None:
-        kwargs["user_id"] = actor_user_id  # Map actor_user_id -> user_id
+        values["actor_user_id"] = actor_user_id
     if acting_as_user_id is not None:
-        kwargs["impersonated_by"] = acting_as_user_id  # Map acting_as_user_id -> impersonated_by
+        values["impersonated_by"] = acting_as_user_id
     if ip_address is not None:
-        kwargs["ip_address"] = ip_address
+        values["ip_address"] = ip_address
     if user_agent is not None:
-        kwargs["user_agent"] = user_agent
+        values["user_agent"] = user_agent
     if resource_type is not None:
-        kwargs["resource_type"] = resource_type
+        values["resource_type"] = resource_type
     if resource_id is not None:
-        kwargs["resource_id"] = resource_id
+        values["resource_id"] = resource_id
+    return values
+
 
-    entry = AuditLog(**kwargs)
+async def append_audit_log(
+    session: AsyncSession,
+    *,
+    action: str,
+    tenant_id: UUID | None = None,
+    actor_user_id: UUID | None = None,
+    acting_as_user_id: UUID | None = None,
+    metadata: dict[str, Any] | None = None,
+    resource_type: str | None = None,
+    resource_id: str | None = None,
+    ip_address: str | None = None,
+    user_agent: str | None = None,
+) -> AuditLog:
+    """Insert a single audit log row inside the caller's transaction.
+    
+    The row commits or rolls back together with the caller's changes; use this
+    for security-critical events. Everything else can go through the batched
+    AuditWriter (see ``audit_event_stub``).
+    """
+    entry = AuditLog(
+        **audit_log_values(
+            action=action,
+            tenant_id=tenant_id,
+            actor_user_id=actor_user_id,
+            acting_as_user_id=acting_as_user_id,
+            metadata=metadata,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
+    )
     session.add(entry)
     await session.flush()
     return entry
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.models.audit import AuditLog
+
+logger = logging.getLogger(__name__)
+
+# Every queued row carries the same keys so a batch renders as one multi-row INSERT.
+ROW_KEYS = (
+    "id",
+    "tenant_id",
+    "actor_user_id",
+    "impersonated_by",
+    "action",
+    "resource_type",
+    "resource_id",
+    "metadata_json",
+    "ip_address",
+    "user_agent",
+    "created_at",
+)
+
+_STOP = object()
+
+
+class AuditWriter:
+    """Buffers audit rows in a bounded queue and inserts them in batches.
+
+    A batch is written once it holds ``batch_size`` rows or ``flush_seconds``
+    after its first row arrived, whichever comes first, in its own session and
+    transaction. Rows get their id and ``created_at`` when queued, so ordering
+    and partition routing reflect when the event happened, not when it was written.
+    A failed batch is retried with backoff, then written row by row.
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        *,
+        queue_size: int | None = None,
+        batch_size: int | None = None,
+        flush_seconds: float | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self.queue_size = queue_size or settings.audit_writer_queue_size
+        self.batch_size = max(batch_size or settings.audit_writer_batch_size, 1)
+        self.flush_seconds = flush_seconds or settings.audit_writer_flush_seconds
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        # created_at of every queued or in-flight row, oldest first.
+        self._unflushed: deque[datetime] = deque()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        if self._session_factory is None:
+            from app.core.database import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._unflushed.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop accepting rows and write everything still queued."""
+        task, queue = self._task, self._queue
+        if task is None or queue is None:
+            return
+        self._task = None
+        if not task.done():
+            await queue.put(_STOP)
+            await task
+        self._queue = None
+
+    def enqueue(self, values: dict[str, Any]) -> bool:
+        """Queue one row built by ``audit_log_values``; False when not running or full."""
+        if not self.running or self._queue is None:
+            return False
+        row = {key: values.get(key) for key in ROW_KEYS}
+        row["id"] = row["id"] or uuid.uuid4()
+        row["created_at"] = row["created_at"] or datetime.now(timezone.utc)
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            return False
+        self._unflushed.append(row["created_at"])
+        return True
+
+    def oldest_unflushed(self) -> datetime | None:
+        """``created_at`` of the oldest row queued but not yet written, if any."""
+        return self._unflushed[0] if self._unflushed else None
+
+    async def _run(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            batch: list[dict[str, Any]] = []
+            if item is _STOP:
+                stopping = True
+            else:
+                batch.append(item)
+            deadline = loop.time() + self.flush_seconds
+            while not stopping and len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            if stopping:
+                while not queue.empty():
+                    item = queue.get_nowait()
+                    if item is not _STOP:
+                        batch.append(item)
+            for start in range(0, len(batch), self.batch_size):
+                await self._write(batch[start : start + self.batch_size])
+
+    async def _write(self, rows: list[dict[str, Any]]) -> None:
+        attempts = max(settings.audit_writer_retry_attempts, 1)
+        try:
+            for attempt in range(attempts):
+                try:
+                    await self._insert(rows)
+                    return
+                except Exception:
+                    logger.warning(
+                        "Failed to write %d queued audit log rows (attempt %d of %d)",
+                        len(rows),
+                        attempt + 1,
+                        attempts,
+                        exc_info=True,
+                    )
+                if attempt + 1 < attempts:
+                    await asyncio.sleep(settings.audit_writer_retry_seconds * 2**attempt)
+            for row in rows:
+                try:
+                    await self._insert([row])
+                except Exception:
+                    logger.exception("Dropped audit log row %s (%s)", row["id"], row["action"])
+        finally:
+            for _ in rows:
+                self._unflushed.popleft()
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> None:
+        async with self._session_factory() as session:
+            await session.execute(insert(AuditLog), rows)
+            await session.commit()
+
+
+audit_writer = AuditWriter()
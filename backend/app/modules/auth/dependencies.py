@@ -30,6 +30,11 @@ async def get_current_user(
     request: Request,
     session: AsyncSession = Depends(get_session),
 ) -> CurrentUser:
+    # Batch sub-requests inherit the user resolved by the enclosing request.
+    cached = getattr(request.state, "current_user", None)
+    if cached is not None:
+        return cached
+
     payload = request.state.token_payload
     if not payload:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
@@ -56,7 +61,7 @@ async def get_current_user(
         if user.tenant_id and str(user.tenant_id) != str(tenant_id):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context mismatch")
 
-    return CurrentUser(
+    current_user = CurrentUser(
         id=user.id,
         email=user.email,
         first_name=user.first_name,
@@ -68,6 +73,8 @@ async def get_current_user(
         permissions=permissions,
         impersonation=impersonation,
     )
+    request.state.current_user = current_user
+    return current_user
 
 
 def require_permission(permission_code: str):
@@ -193,10 +193,11 @@ async def change_password(
     await audit_event_stub(
         action="password.changed",
         session=session,
+        critical=True,
         metadata={"user_id": str(current_user.id)},
     )
 
-    # audit_event_stub only flushes; commit so the audit row persists.
+    # Critical events are only flushed; commit so the audit row persists.
     await session.commit()
     
     return PasswordChangeResponse()
@@ -220,13 +221,14 @@ async def reset_password(
     await audit_event_stub(
         action="password.reset",
         session=session,
+        critical=True,
         metadata={
             "target_user_id": str(payload.user_id),
             "reset_by": str(current_user.id),
         },
     )
 
-    # audit_event_stub only flushes; commit so the audit row persists.
+    # Critical events are only flushed; commit so the audit row persists.
     await session.commit()
     
     return PasswordResetResponse(temporary_password=temp_password)
@@ -252,6 +254,7 @@ async def invite_user(
     await audit_event_stub(
         action="user.invited",
         session=session,
+        critical=True,
         metadata={
             "invited_user_id": str(user.id),
             "email": payload.email,
@@ -260,7 +263,7 @@ async def invite_user(
         },
     )
 
-    # audit_event_stub only flushes; commit so the audit row persists.
+    # Critical events are only flushed; commit so the audit row persists.
     await session.commit()
     
     return InviteUserResponse(
@@ -0,0 +1 @@
+# batch module
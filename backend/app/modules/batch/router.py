@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_session
+from app.modules.auth.dependencies import CurrentUser, get_current_user
+from app.modules.batch.schemas import BatchRequest, BatchResponseItem
+from app.modules.batch.service import dispatch_batch
+
+
+router = APIRouter()
+
+
+@router.post("", response_model=list[BatchResponseItem])
+async def run_batch(
+    payload: BatchRequest,
+    request: Request,
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> list[BatchResponseItem]:
+    if len(payload.requests) > settings.batch_max_requests:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.batch_max_requests} requests per batch",
+        )
+    # get_current_user stored the user on request.state, which each
+    # sub-request scope copies, so permissions are resolved once per batch.
+    results = await dispatch_batch(
+        request.app.router,
+        request.scope,
+        session,
+        [item.path for item in payload.requests],
+    )
+    return [BatchResponseItem(**result) for result in results]
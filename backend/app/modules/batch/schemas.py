@@ -0,0 +1,34 @@
+from typing import Any, Literal
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, Field, field_validator
+
+
+API_PREFIX = "/api"
+
+
+class BatchRequestItem(BaseModel):
+    method: Literal["GET"] = "GET"
+    # Relative to the API root like the frontend client's paths, with an
+    # optional query string, e.g. "/hotel/rooms?limit=20".
+    path: str = Field(min_length=1, max_length=2048)
+
+    @field_validator("path")
+    @classmethod
+    def validate_path(cls, value: str) -> str:
+        parts = urlsplit(value)
+        if parts.scheme or parts.netloc or not parts.path.startswith("/"):
+            raise ValueError("Path must be relative to the API root")
+        if parts.path.rstrip("/") == "/batch":
+            raise ValueError("Batch requests cannot be nested")
+        return value
+
+
+class BatchRequest(BaseModel):
+    requests: list[BatchRequestItem] = Field(min_length=1)
+
+
+class BatchResponseItem(BaseModel):
+    status: int
+    headers: dict[str, str] = {}
+    body: Any = None
@@ -0,0 +1,141 @@
+import asyncio
+import json
+import logging
+from contextlib import AsyncExitStack
+from typing import Any
+from urllib.parse import urlsplit
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Scope
+
+from app.core.database import shared_session
+from app.modules.batch.schemas import API_PREFIX
+
+
+logger = logging.getLogger(__name__)
+
+# Scope keys a sub-request inherits from the batch request. Everything else
+# (method, path, query string, per-request stacks) is rebuilt.
+INHERITED_SCOPE_KEYS = (
+    "type",
+    "asgi",
+    "http_version",
+    "scheme",
+    "server",
+    "client",
+    "root_path",
+    "app",
+    "starlette.exception_handlers",
+)
+DROPPED_HEADERS = {b"content-length", b"content-type"}
+DROPPED_RESPONSE_HEADERS = {"content-length", "content-type", "set-cookie"}
+
+
+class UnsupportedResponse(Exception):
+    """Raised when a sub-request answers with something other than JSON."""
+
+
+def sub_request_scope(parent: Scope, path: str) -> Scope:
+    parts = urlsplit(path)
+    root_path = parent.get("root_path", "")
+    full_path = root_path + API_PREFIX + parts.path
+    scope = {key: parent[key] for key in INHERITED_SCOPE_KEYS if key in parent}
+    scope.update(
+        method="GET",
+        path=full_path,
+        raw_path=full_path.encode("utf-8"),
+        query_string=parts.query.encode("latin-1"),
+        headers=[(name, value) for name, value in parent["headers"] if name not in DROPPED_HEADERS],
+        # A copy, so sub-requests see the token payload and resolved user but
+        # cannot leak state into each other.
+        state=dict(parent.get("state", {})),
+    )
+    return scope
+
+
+def _is_json(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+async def run_sub_request(app: ASGIApp, scope: Scope) -> dict[str, Any]:
+    """Run one GET through ``app`` and collect its JSON response."""
+    status_code = 500
+    headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+    request_sent = False
+    finished = asyncio.Event()
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            for raw_name, raw_value in message.get("headers", []):
+                headers[raw_name.decode("latin-1").lower()] = raw_value.decode("latin-1")
+            content_type = headers.get("content-type", "")
+            if content_type and not _is_json(content_type):
+                raise UnsupportedResponse(content_type)
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        # Normally provided by FastAPI's outer middleware, which sub-requests skip.
+        async with AsyncExitStack() as stack:
+            scope["fastapi_middleware_astack"] = stack
+            await app(scope, receive, send)
+    except HTTPException as exc:
+        # Raised by the router itself, e.g. for an unknown path.
+        return {"status": exc.status_code, "headers": {}, "body": {"detail": exc.detail}}
+    finally:
+        finished.set()
+
+    body = b"".join(chunks)
+    return {
+        "status": status_code,
+        "headers": {
+            name: value for name, value in headers.items() if name not in DROPPED_RESPONSE_HEADERS
+        },
+        "body": json.loads(body) if body else None,
+    }
+
+
+async def dispatch_batch(
+    app: ASGIApp,
+    parent_scope: Scope,
+    session: AsyncSession,
+    paths: list[str],
+) -> list[dict[str, Any]]:
+    """Run GET sub-requests in order against ``app``, all on ``session``.
+
+    Sub-requests run one at a time because they share the session; a failure
+    is reported in its slot and does not stop the rest of the batch.
+    """
+    results = []
+    token = shared_session.set(session)
+    try:
+        for path in paths:
+            try:
+                result = await run_sub_request(app, sub_request_scope(parent_scope, path))
+            except UnsupportedResponse as exc:
+                result = {
+                    "status": 406,
+                    "headers": {},
+                    "body": {"detail": f"Unsupported response type: {exc}"},
+                }
+            except Exception:
+                logger.exception("Batch sub-request failed: GET %s", path)
+                await session.rollback()
+                result = {"status": 500, "headers": {}, "body": {"detail": "Internal Server Error"}}
+            results.append(result)
+    finally:
+        shared_session.reset(token)
+    return results
@@ -1,12 +1,18 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.core.database import get_session
+from app.core.database import AsyncSessionLocal, get_read_session, get_session
+from app.core.downloads import accepts_gzip
+from app.core.streaming import STREAM_MEDIA_TYPES, iter_gzip
 from app.modules.auth.dependencies import CurrentUser, get_current_user, require_permission
 from app.modules.hotel.audit.schemas import AuditLogListResponse, AuditLogOut, Pagination
 from app.modules.hotel.audit.service import HotelAuditLogService
+from app.services.audit_stream import iter_audit_ndjson, stream_upper_bound
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -20,12 +26,14 @@ router = APIRouter()
 async def list_audit_logs(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     action: str | None = Query(None),
     user_id: str | None = Query(None),
     date_from: datetime | None = Query(None),
     date_to: datetime | None = Query(None),
     current_user: CurrentUser = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> AuditLogListResponse:
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
@@ -38,21 +46,88 @@ async def list_audit_logs(
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid user id") from exc
 
-    items, total = await service.list_logs(
-        tenant_id=current_user.tenant_id,
-        page=page,
-        limit=limit,
-        action=action,
-        user_id=user_uuid,
-        date_from=date_from,
-        date_to=date_to,
-    )
+    try:
+        listing = await service.list_logs(
+            tenant_id=current_user.tenant_id,
+            page=page,
+            limit=limit,
+            action=action,
+            user_id=user_uuid,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return AuditLogListResponse(
-        items=[AuditLogOut.model_validate(item) for item in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[AuditLogOut.model_validate(item) for item in listing.items],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
+async def _stream_audit_body(
+    tenant_id: UUID,
+    until: datetime,
+    since: datetime | None,
+    since_id: UUID | None,
+) -> AsyncIterator[str]:
+    # The stream outlives the request-scoped session, so it owns its own. It reads the
+    # primary: replica lag could exceed the settle window and skip rows past a watermark.
+    async with AsyncSessionLocal() as session:
+        rows = HotelAuditLogService(session).stream_logs(tenant_id, until, since, since_id)
+        async for chunk in iter_audit_ndjson(rows):
+            yield chunk
+
+
+@router.get(
+    "/stream",
+    response_model=None,
+    dependencies=[Depends(require_permission("hotel:audit:read"))],
+)
+async def stream_audit_logs(
+    request: Request,
+    since: datetime | None = Query(None),
+    since_id: str | None = Query(None),
+    gzip: bool = Query(False),
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """Stream the tenant's audit logs as NDJSON, oldest first.
+
+    Resume by passing the last record's ``created_at`` and ``id`` as ``since``
+    and ``since_id``. ``X-Audit-Until`` reports the upper bound of this pull.
+    """
+    if current_user.tenant_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
+    try:
+        since_uuid = UUID(since_id) if since_id else None
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid audit id") from exc
+    if since_uuid is not None and since is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="since_id requires since")
+
+    until = stream_upper_bound()
+    # The stream can run for a long time; release the auth lookup's connection now.
+    await session.close()
+    body = _stream_audit_body(current_user.tenant_id, until, since, since_uuid)
+    headers = {
+        "X-Accel-Buffering": "no",
+        "X-Audit-Until": until.isoformat(),
+        "Vary": "Accept-Encoding",
+    }
+    if gzip and accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        body = iter_gzip(body)
+    return StreamingResponse(body, media_type=STREAM_MEDIA_TYPES["ndjson"], headers=headers)
+
+
 @router.get(
     "/{audit_id}",
     response_model=AuditLogOut,
@@ -61,7 +136,7 @@ async def list_audit_logs(
 async def get_audit_log(
     audit_id: str,
     current_user: CurrentUser = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> AuditLogOut:
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
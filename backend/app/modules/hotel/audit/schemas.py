@@ -30,7 +30,9 @@ class AuditLogOut(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class AuditLogListResponse(BaseModel):
@@ -1,9 +1,13 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.models.audit import AuditLog
+from app.services.audit_stream import audit_stream_stmt, stream_audit_rows
+from app.services.base import ListPage, paginate
+from app.services.search import contains_term
 
 
 class HotelAuditLogService:
@@ -19,35 +23,46 @@ class HotelAuditLogService:
         user_id: UUID | None = None,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
-    ) -> tuple[list[AuditLog], int]:
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> ListPage:
         page = max(page, 1)
         limit = max(min(limit, 100), 1)
 
         stmt = select(AuditLog).where(AuditLog.tenant_id == tenant_id)
-        count_stmt = select(func.count()).select_from(AuditLog).where(AuditLog.tenant_id == tenant_id)
 
         if action:
-            stmt = stmt.where(AuditLog.action.ilike(f"%{action}%"))
-            count_stmt = count_stmt.where(AuditLog.action.ilike(f"%{action}%"))
+            stmt = stmt.where(contains_term(AuditLog.action, action))
         if user_id:
             stmt = stmt.where(AuditLog.user_id == user_id)
-            count_stmt = count_stmt.where(AuditLog.user_id == user_id)
         if date_from:
             stmt = stmt.where(AuditLog.created_at >= date_from)
-            count_stmt = count_stmt.where(AuditLog.created_at >= date_from)
         if date_to:
             stmt = stmt.where(AuditLog.created_at <= date_to)
-            count_stmt = count_stmt.where(AuditLog.created_at <= date_to)
 
-        total = await self.session.scalar(count_stmt)
-        stmt = (
-            stmt.order_by(AuditLog.created_at.desc())
-            .offset((page - 1) * limit)
-            .limit(limit)
+        filters = (action, user_id, date_from, date_to)
+        return await paginate(
+            self.session,
+            stmt,
+            (AuditLog.created_at, AuditLog.id),
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            include_total=include_total,
+            count_key=("hotel_audit", tenant_id, *filters),
+            filtered=any(value is not None for value in filters),
         )
-        result = await self.session.execute(stmt)
-        items = result.scalars().all()
-        return items, int(total or 0)
+
+    def stream_logs(
+        self,
+        tenant_id: UUID,
+        until: datetime,
+        since: datetime | None = None,
+        since_id: UUID | None = None,
+    ) -> AsyncIterator:
+        stmt = audit_stream_stmt(until, since, since_id)
+        stmt = stmt.where(AuditLog.tenant_id == tenant_id)
+        return stream_audit_rows(self.session, stmt)
 
     async def get(self, tenant_id: UUID, audit_id: UUID) -> AuditLog | None:
         stmt = select(AuditLog).where(AuditLog.id == audit_id, AuditLog.tenant_id == tenant_id)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_session
+from app.core.database import get_read_session
 from app.modules.auth.dependencies import CurrentUser, get_current_user, require_permission
 from app.modules.hotel.dashboard.schemas import HotelDashboardSummaryOut
 from app.modules.hotel.dashboard.service import HotelDashboardService
@@ -17,7 +17,7 @@ router = APIRouter()
 )
 async def get_dashboard_summary(
     current_user: CurrentUser = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> HotelDashboardSummaryOut:
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
@@ -6,16 +6,24 @@ from app.core.database import get_session
 from app.modules.auth.dependencies import CurrentUser, get_current_user, require_permission
 from app.modules.hotel.guests.schemas import (
     GuestCreate,
+    GuestImportOut,
     GuestListResponse,
     GuestOut,
     GuestUpdate,
     Pagination,
 )
-from app.modules.hotel.guests.service import GuestService
+from app.modules.hotel.guests.service import GuestImportService, GuestService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
 
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
 
 @router.get(
     "/",
@@ -25,6 +33,8 @@ router = APIRouter()
 async def list_guests(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     search: str | None = Query(None),
     current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
@@ -32,13 +42,81 @@ async def list_guests(
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
     service = GuestService(session)
-    items, total = await service.list(current_user.tenant_id, page, limit, search)
+    try:
+        listing = await service.list(
+            current_user.tenant_id, page, limit, search, cursor=cursor, include_total=include_total
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return GuestListResponse(
-        items=[GuestOut.model_validate(item) for item in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[GuestOut.model_validate(item) for item in listing.items],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
+@router.post(
+    "/import",
+    response_model=GuestImportOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(require_permission("hotel:guests:create"))],
+)
+async def import_guests(
+    request: Request,
+    import_format: str | None = Query(None, alias="format"),
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> GuestImportOut:
+    """Queue a bulk import of the CSV or NDJSON request body.
+
+    The body is the file itself (not multipart); its format comes from
+    ``format`` or the Content-Type. Poll the returned job for progress.
+    """
+    if current_user.tenant_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    import_format = import_format or IMPORT_CONTENT_TYPES.get(content_type)
+    if import_format is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported import format")
+
+    service = GuestImportService(session)
+    try:
+        job = await service.create(
+            current_user.tenant_id, current_user.id, import_format, request.stream()
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return GuestImportOut.model_validate(job)
+
+
+@router.get(
+    "/imports/{import_id}",
+    response_model=GuestImportOut,
+    dependencies=[Depends(require_permission("hotel:guests:create"))],
+)
+async def get_guest_import(
+    import_id: str,
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> GuestImportOut:
+    if current_user.tenant_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
+    try:
+        import_uuid = UUID(import_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid import id") from exc
+
+    job = await GuestImportService(session).get(current_user.tenant_id, import_uuid)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Guest import not found")
+    return GuestImportOut.model_validate(job)
+
+
 @router.get(
     "/{guest_id}",
     response_model=GuestOut,
@@ -103,14 +181,12 @@ async def update_guest(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid guest id") from exc
 
-    guest = await service.get(current_user.tenant_id, guest_uuid)
-    if not guest:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Guest not found")
-
     try:
-        updated = await service.update(guest, payload)
+        updated = await service.update(current_user.tenant_id, guest_uuid, payload)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if not updated:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Guest not found")
     return GuestOut.model_validate(updated)
 
 
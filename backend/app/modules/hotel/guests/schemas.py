@@ -45,9 +45,32 @@ class GuestOut(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class GuestListResponse(BaseModel):
     items: list[GuestOut]
     pagination: Pagination
+
+
+class GuestImportError(BaseModel):
+    row: int
+    message: str
+
+
+class GuestImportOut(BaseModel):
+    id: UUID
+    status: str
+    import_format: str
+    file_size: int | None = None
+    rows_processed: int = 0
+    rows_imported: int = 0
+    rows_failed: int = 0
+    errors: list[GuestImportError] | None = None
+    error_message: str | None = None
+    created_at: datetime | None = None
+    completed_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,8 +1,96 @@
-from sqlalchemy import func, or_, select
+import csv
+import json
+from collections.abc import AsyncIterable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import column, exists, insert, literal, or_, select, table, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from uuid import UUID
 
+from app.core.config import settings
 from app.models.guest import Guest
+from app.models.guest_import import GuestImport
+from app.modules.hotel.guests.schemas import GuestCreate
+from app.services.base import ListPage, changed_fields, insert_returning, paginate, update_returning
+from app.services.search import (
+    GUEST_DOCUMENT,
+    index_document,
+    index_documents,
+    ranked_search,
+    remove_document,
+)
+
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Each import batch is COPY-ed into this temp table, then merged into guests.
+STAGING_COLUMNS = (
+    ("row_number", "bigint"),
+    ("id", "uuid"),
+    ("first_name", "varchar(100)"),
+    ("last_name", "varchar(100)"),
+    ("email", "varchar(255)"),
+    ("phone", "varchar(40)"),
+    ("status", "varchar(30)"),
+    ("check_in_at", "timestamptz"),
+    ("check_out_at", "timestamptz"),
+    ("notes", "text"),
+)
+GUEST_FIELDS = tuple(name for name, _ in STAGING_COLUMNS[2:])
+STAGING_TABLE = table("guest_import_staging", *(column(name) for name, _ in STAGING_COLUMNS))
+# Dropped at commit, so a pooled connection never carries it into another request.
+STAGING_DDL = text(
+    "CREATE TEMP TABLE guest_import_staging ("
+    + ", ".join(f"{name} {sql_type}" for name, sql_type in STAGING_COLUMNS)
+    + ") ON COMMIT DROP"
+)
+
+
+def read_import_records(path: str, import_format: str) -> Iterator[tuple[int, Any]]:
+    """Yield ``(row, record)`` pairs from an upload without loading it whole.
+
+    Rows are 1-based: data rows after the header for CSV, lines for NDJSON.
+    Records that cannot be parsed are yielded as an error message string.
+    """
+    if import_format == "csv":
+        with open(path, newline="", encoding="utf-8-sig") as handle:
+            for row, record in enumerate(csv.DictReader(handle), start=1):
+                yield row, {
+                    key.strip(): value or None for key, value in record.items() if key
+                }
+        return
+    with open(path, encoding="utf-8-sig") as handle:
+        for row, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield row, "Invalid JSON"
+                continue
+            yield row, record if isinstance(record, dict) else "Expected a JSON object"
+
+
+def validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+def staging_record(row: int, record: Any) -> tuple | str:
+    """Validate one record against GuestCreate; returns a staging tuple or an error."""
+    if isinstance(record, str):
+        return record
+    try:
+        payload = GuestCreate.model_validate(record)
+    except ValidationError as exc:
+        return validation_message(exc)
+    return (row, uuid4(), *(getattr(payload, field) for field in GUEST_FIELDS))
 
 
 class GuestService:
@@ -15,34 +103,28 @@ class GuestService:
         page: int,
         limit: int,
         search: str | None = None,
-    ) -> tuple[list[Guest], int]:
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> ListPage:
         page = max(page, 1)
         limit = max(min(limit, 100), 1)
 
-        total_stmt = select(func.count()).select_from(Guest).where(Guest.tenant_id == tenant_id)
         stmt = select(Guest).where(Guest.tenant_id == tenant_id)
-
+        sort_keys = (Guest.created_at, Guest.id)
         if search:
-            like = f"%{search.strip()}%"
-            total_stmt = total_stmt.where(
-                or_(
-                    Guest.first_name.ilike(like),
-                    Guest.last_name.ilike(like),
-                    Guest.email.ilike(like),
-                )
-            )
-            stmt = stmt.where(
-                or_(
-                    Guest.first_name.ilike(like),
-                    Guest.last_name.ilike(like),
-                    Guest.email.ilike(like),
-                )
-            )
+            stmt, sort_keys = ranked_search(stmt, GUEST_DOCUMENT, search, sort_keys)
 
-        total = await self.session.scalar(total_stmt)
-        stmt = stmt.order_by(Guest.created_at.desc()).offset((page - 1) * limit).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all(), int(total or 0)
+        return await paginate(
+            self.session,
+            stmt,
+            sort_keys,
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            include_total=include_total,
+            count_key=("guests", tenant_id, search),
+            filtered=bool(search),
+        )
 
     async def get(self, tenant_id: UUID, guest_id: UUID) -> Guest | None:
         stmt = select(Guest).where(Guest.id == guest_id, Guest.tenant_id == tenant_id)
@@ -56,55 +138,184 @@ class GuestService:
             if existing:
                 raise ValueError("Guest email already exists")
 
-        guest = Guest(
-            tenant_id=tenant_id,
-            first_name=payload.first_name,
-            last_name=payload.last_name,
-            email=payload.email,
-            phone=payload.phone,
-            status=payload.status,
-            check_in_at=payload.check_in_at,
-            check_out_at=payload.check_out_at,
-            notes=payload.notes,
+        # guests has no unique constraint on email (imports may carry duplicates
+        # from older data), so the check above stays.
+        guest = await insert_returning(
+            self.session,
+            Guest,
+            {
+                "tenant_id": tenant_id,
+                "first_name": payload.first_name,
+                "last_name": payload.last_name,
+                "email": payload.email,
+                "phone": payload.phone,
+                "status": payload.status,
+                "check_in_at": payload.check_in_at,
+                "check_out_at": payload.check_out_at,
+                "notes": payload.notes,
+            },
         )
-        self.session.add(guest)
+        await index_document(self.session, guest)
         await self.session.commit()
-        await self.session.refresh(guest)
         return guest
 
-    async def update(self, guest: Guest, payload) -> Guest:
-        if payload.first_name is not None:
-            guest.first_name = payload.first_name
-        if payload.last_name is not None:
-            guest.last_name = payload.last_name
-        if payload.email is not None:
-            if payload.email:
-                existing = await self.session.scalar(
-                    select(Guest).where(
-                        Guest.tenant_id == guest.tenant_id,
-                        Guest.email == payload.email,
-                        Guest.id != guest.id,
-                    )
+    async def update(self, tenant_id: UUID, guest_id: UUID, payload) -> Guest | None:
+        values = changed_fields(payload)
+        if values.get("email"):
+            existing = await self.session.scalar(
+                select(Guest.id).where(
+                    Guest.tenant_id == tenant_id,
+                    Guest.email == values["email"],
+                    Guest.id != guest_id,
                 )
-                if existing:
-                    raise ValueError("Guest email already exists")
-            guest.email = payload.email
-        if payload.phone is not None:
-            guest.phone = payload.phone
-        if payload.status is not None:
-            guest.status = payload.status
-        if payload.check_in_at is not None:
-            guest.check_in_at = payload.check_in_at
-        if payload.check_out_at is not None:
-            guest.check_out_at = payload.check_out_at
-        if payload.notes is not None:
-            guest.notes = payload.notes
-
-        self.session.add(guest)
-        await self.session.commit()
-        await self.session.refresh(guest)
+            )
+            if existing:
+                raise ValueError("Guest email already exists")
+
+        guest = await update_returning(self.session, Guest, guest_id, values, tenant_id=tenant_id)
+        if guest is not None and values:
+            await index_document(self.session, guest)
+            await self.session.commit()
         return guest
 
     async def delete(self, guest: Guest) -> None:
+        await remove_document(self.session, guest)
         await self.session.delete(guest)
         await self.session.commit()
+
+
+class GuestImportService:
+    """Bulk guest onboarding from CSV or NDJSON uploads.
+
+    The upload is spooled to disk and a worker loads it in batches: each batch
+    is validated against GuestCreate, COPY-ed into a temp staging table and
+    merged into guests with one INSERT ... SELECT. Rows whose email already
+    exists for the tenant, or earlier in the file, are reported like the
+    single-guest endpoint would. Progress and the batch's guests commit together.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def create(
+        self,
+        tenant_id: UUID,
+        requested_by: UUID | None,
+        import_format: str,
+        chunks: AsyncIterable[bytes],
+    ) -> GuestImport:
+        if import_format not in IMPORT_FORMATS:
+            raise ValueError("Unsupported import format")
+
+        job = GuestImport(
+            id=uuid4(),
+            tenant_id=tenant_id,
+            requested_by=requested_by,
+            import_format=import_format,
+            status="pending",
+        )
+        directory = Path(settings.guest_imports_storage_path) / str(tenant_id)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{job.id}.{import_format}"
+        size = 0
+        try:
+            with path.open("wb") as handle:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > settings.guest_import_max_bytes:
+                        raise ValueError("Import file too large")
+                    handle.write(chunk)
+            if size == 0:
+                raise ValueError("Import file is empty")
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+
+        job.file_path = str(path)
+        job.file_size = size
+        self.session.add(job)
+        await self.session.commit()
+        await self.session.refresh(job)
+        return job
+
+    async def get(self, tenant_id: UUID, import_id: UUID) -> GuestImport | None:
+        stmt = select(GuestImport).where(
+            GuestImport.id == import_id, GuestImport.tenant_id == tenant_id
+        )
+        return await self.session.scalar(stmt)
+
+    async def run(self, job: GuestImport) -> None:
+        batch_size = max(settings.guest_import_batch_size, 1)
+        rows: list[tuple] = []
+        errors: list[dict[str, Any]] = []
+        for row, record in read_import_records(job.file_path, job.import_format):
+            staged = staging_record(row, record)
+            if isinstance(staged, str):
+                errors.append({"row": row, "message": staged})
+            else:
+                rows.append(staged)
+            if len(rows) + len(errors) >= batch_size:
+                await self._load_batch(job, rows, errors)
+                rows, errors = [], []
+        await self._load_batch(job, rows, errors)
+
+        job.status = "completed"
+        job.completed_at = datetime.now(timezone.utc)
+        self.session.add(job)
+        await self.session.commit()
+        Path(job.file_path).unlink(missing_ok=True)
+
+    async def _load_guests(self, tenant_id: UUID, rows: list[tuple]) -> list[int]:
+        """COPY ``rows`` into staging and insert the new guests; returns duplicate rows."""
+        await self.session.execute(STAGING_DDL)
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            STAGING_TABLE.name,
+            records=rows,
+            columns=[name for name, _ in STAGING_COLUMNS],
+        )
+
+        staged = STAGING_TABLE.alias("staged")
+        earlier = STAGING_TABLE.alias("earlier")
+        duplicates = select(staged.c.row_number).where(
+            staged.c.email.is_not(None),
+            or_(
+                exists().where(Guest.tenant_id == tenant_id, Guest.email == staged.c.email),
+                exists().where(
+                    earlier.c.email == staged.c.email,
+                    earlier.c.row_number < staged.c.row_number,
+                ),
+            ),
+        )
+        duplicate_rows = list((await self.session.execute(duplicates)).scalars().all())
+
+        fresh = select(
+            staged.c.id,
+            literal(tenant_id, PG_UUID(as_uuid=True)),
+            *(staged.c[field] for field in GUEST_FIELDS),
+        ).where(staged.c.row_number.not_in(duplicates))
+        await self.session.execute(
+            insert(Guest.__table__).from_select(["id", "tenant_id", *GUEST_FIELDS], fresh)
+        )
+        await index_documents(self.session, Guest, select(STAGING_TABLE.c.id))
+        return duplicate_rows
+
+    async def _load_batch(
+        self, job: GuestImport, rows: list[tuple], errors: list[dict[str, Any]]
+    ) -> None:
+        if not rows and not errors:
+            return
+        duplicate_rows = await self._load_guests(job.tenant_id, rows) if rows else []
+        job.rows_processed += len(rows) + len(errors)
+        job.rows_imported += len(rows) - len(duplicate_rows)
+        errors = sorted(
+            errors + [{"row": row, "message": "Guest email already exists"} for row in duplicate_rows],
+            key=lambda error: error["row"],
+        )
+        job.rows_failed += len(errors)
+        room = settings.guest_import_max_errors - len(job.errors or [])
+        if errors and room > 0:
+            job.errors = [*(job.errors or []), *errors[:room]]
+        self.session.add(job)
+        await self.session.commit()
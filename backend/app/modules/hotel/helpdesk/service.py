@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.models.helpdesk_ticket import HelpdeskTicket
+from app.services.search import index_document
 
 
 class HotelHelpdeskService:
@@ -31,6 +32,8 @@ class HotelHelpdeskService:
             priority=payload.priority,
         )
         self.session.add(ticket)
+        await self.session.flush()
+        await index_document(self.session, ticket)
         await self.session.commit()
         await self.session.refresh(ticket)
         return ticket
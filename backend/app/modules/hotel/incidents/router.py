@@ -12,6 +12,7 @@ from app.modules.hotel.incidents.schemas import (
     Pagination,
 )
 from app.modules.hotel.incidents.service import IncidentService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -25,6 +26,8 @@ router = APIRouter()
 async def list_incidents(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     search: str | None = Query(None),
     status_filter: str | None = Query(None, alias="status"),
     severity: str | None = Query(None),
@@ -34,12 +37,28 @@ async def list_incidents(
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
     service = IncidentService(session)
-    items, total = await service.list(
-        current_user.tenant_id, page, limit, search, status_filter, severity
-    )
+    try:
+        listing = await service.list(
+            current_user.tenant_id,
+            page,
+            limit,
+            search,
+            status_filter,
+            severity,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return IncidentListResponse(
-        items=[IncidentOut.model_validate(item) for item in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[IncidentOut.model_validate(item) for item in listing.items],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
@@ -107,14 +126,12 @@ async def update_incident(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid incident id") from exc
 
-    incident = await service.get(current_user.tenant_id, incident_uuid)
-    if not incident:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Incident not found")
-
     try:
-        updated = await service.update(incident, payload)
+        updated = await service.update(current_user.tenant_id, incident_uuid, payload)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if not updated:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Incident not found")
     return IncidentOut.model_validate(updated)
 
 
@@ -45,7 +45,9 @@ class IncidentOut(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class IncidentListResponse(BaseModel):
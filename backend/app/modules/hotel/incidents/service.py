@@ -1,10 +1,11 @@
-from datetime import datetime, timezone
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.models.incident import Incident
 from app.models.user import User
+from app.services.base import ListPage, changed_fields, paginate, update_returning
+from app.services.search import INCIDENT_DOCUMENT, index_document, ranked_search, remove_document
 
 
 class IncidentService:
@@ -19,32 +20,35 @@ class IncidentService:
         search: str | None = None,
         status: str | None = None,
         severity: str | None = None,
-    ) -> tuple[list[Incident], int]:
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> ListPage:
         page = max(page, 1)
         limit = max(min(limit, 100), 1)
 
-        total_stmt = select(func.count()).select_from(Incident).where(Incident.tenant_id == tenant_id)
         stmt = select(Incident).where(Incident.tenant_id == tenant_id)
+        sort_keys = (Incident.created_at, Incident.id)
 
         if search:
-            like = f"%{search.strip()}%"
-            total_stmt = total_stmt.where(
-                or_(Incident.title.ilike(like), Incident.description.ilike(like))
-            )
-            stmt = stmt.where(or_(Incident.title.ilike(like), Incident.description.ilike(like)))
+            stmt, sort_keys = ranked_search(stmt, INCIDENT_DOCUMENT, search, sort_keys)
 
         if status:
-            total_stmt = total_stmt.where(Incident.status == status)
             stmt = stmt.where(Incident.status == status)
 
         if severity:
-            total_stmt = total_stmt.where(Incident.severity == severity)
             stmt = stmt.where(Incident.severity == severity)
 
-        total = await self.session.scalar(total_stmt)
-        stmt = stmt.order_by(Incident.created_at.desc()).offset((page - 1) * limit).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all(), int(total or 0)
+        return await paginate(
+            self.session,
+            stmt,
+            sort_keys,
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            include_total=include_total,
+            count_key=("incidents", tenant_id, search, status, severity),
+            filtered=bool(search or status or severity),
+        )
 
     async def get(self, tenant_id: UUID, incident_id: UUID) -> Incident | None:
         stmt = select(Incident).where(Incident.id == incident_id, Incident.tenant_id == tenant_id)
@@ -68,40 +72,35 @@ class IncidentService:
             reported_by=payload.reported_by,
         )
         self.session.add(incident)
+        await self.session.flush()
+        await index_document(self.session, incident)
         await self.session.commit()
         await self.session.refresh(incident)
         return incident
 
-    async def update(self, incident: Incident, payload) -> Incident:
-        if payload.reported_by is not None:
-            if payload.reported_by:
-                user = await self.session.get(User, payload.reported_by)
-                if not user or user.tenant_id != incident.tenant_id:
-                    raise ValueError("Reported user not found")
-            incident.reported_by = payload.reported_by
-
-        if payload.title is not None:
-            incident.title = payload.title
-        if payload.description is not None:
-            incident.description = payload.description
-        if payload.status is not None:
-            incident.status = payload.status
-            if payload.status.lower() in {"closed", "resolved"} and incident.resolved_at is None:
-                incident.resolved_at = datetime.now(timezone.utc)
-        if payload.severity is not None:
-            incident.severity = payload.severity
-        if payload.category is not None:
-            incident.category = payload.category
-        if payload.occurred_at is not None:
-            incident.occurred_at = payload.occurred_at
-        if payload.resolved_at is not None:
-            incident.resolved_at = payload.resolved_at
-
-        self.session.add(incident)
-        await self.session.commit()
-        await self.session.refresh(incident)
+    async def update(self, tenant_id: UUID, incident_id: UUID, payload) -> Incident | None:
+        values = changed_fields(payload)
+        if payload.reported_by:
+            user = await self.session.get(User, payload.reported_by)
+            if not user or user.tenant_id != tenant_id:
+                raise ValueError("Reported user not found")
+        if (
+            payload.status is not None
+            and payload.status.lower() in {"closed", "resolved"}
+            and "resolved_at" not in values
+        ):
+            # Stamp the resolution time only once, without reading the row first.
+            values["resolved_at"] = func.coalesce(Incident.resolved_at, func.now())
+
+        incident = await update_returning(
+            self.session, Incident, incident_id, values, tenant_id=tenant_id
+        )
+        if incident is not None and values:
+            await index_document(self.session, incident)
+            await self.session.commit()
         return incident
 
     async def delete(self, incident: Incident) -> None:
+        await remove_document(self.session, incident)
         await self.session.delete(incident)
         await self.session.commit()
@@ -12,6 +12,7 @@ from app.modules.hotel.kiosk_settings.schemas import (
     Pagination,
 )
 from app.modules.hotel.kiosk_settings.service import KioskSettingsService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -29,16 +30,29 @@ def build_out(kiosk, issued_token: str | None = None) -> KioskSettingOut:
 async def list_kiosks(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> KioskSettingListResponse:
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
     service = KioskSettingsService(session)
-    items, total = await service.list(current_user.tenant_id, page, limit)
+    try:
+        listing = await service.list(
+            current_user.tenant_id, page, limit, cursor=cursor, include_total=include_total
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return KioskSettingListResponse(
-        items=[build_out(item) for item in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[build_out(item) for item in listing.items],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
@@ -106,14 +120,12 @@ async def update_kiosk(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid kiosk id") from exc
 
-    kiosk = await service.get(current_user.tenant_id, kiosk_uuid)
-    if not kiosk:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Kiosk not found")
-
     try:
-        updated, issued_token = await service.update(kiosk, payload)
+        updated, issued_token = await service.update(current_user.tenant_id, kiosk_uuid, payload)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if not updated:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Kiosk not found")
     return build_out(updated, issued_token=issued_token)
 
 
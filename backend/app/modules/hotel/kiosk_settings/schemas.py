@@ -37,7 +37,9 @@ class KioskSettingOut(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class KioskSettingListResponse(BaseModel):
@@ -41,11 +41,10 @@ async def update_profile(
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
     service = ProfileService(session)
-    user = await service.get(current_user.id)
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     try:
-        updated = await service.update(user, payload)
+        updated = await service.update(current_user.id, payload)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if not updated:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return ProfileOut.model_validate(updated)
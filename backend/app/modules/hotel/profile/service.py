@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import hash_password, verify_password
 from app.models.user import User
+from app.services.base import changed_fields, update_returning
 
 
 class ProfileService:
@@ -11,20 +12,20 @@ class ProfileService:
     async def get(self, user_id) -> User | None:
         return await self.session.get(User, user_id)
 
-    async def update(self, user: User, payload) -> User:
-        if payload.first_name is not None:
-            user.first_name = payload.first_name
-        if payload.last_name is not None:
-            user.last_name = payload.last_name
-
+    async def update(self, user_id, payload) -> User | None:
+        values = changed_fields(payload, exclude={"current_password", "new_password"})
         if payload.new_password:
             if not payload.current_password:
                 raise ValueError("Current password required to change password")
+            # Verifying the current password is the one case that needs the row first.
+            user = await self.get(user_id)
+            if user is None:
+                return None
             if not verify_password(payload.current_password, user.password_hash):
                 raise ValueError("Current password is incorrect")
-            user.password_hash = hash_password(payload.new_password)
+            values["password_hash"] = hash_password(payload.new_password)
 
-        self.session.add(user)
-        await self.session.commit()
-        await self.session.refresh(user)
+        user = await update_returning(self.session, User, user_id, values)
+        if user is not None and values:
+            await self.session.commit()
         return user
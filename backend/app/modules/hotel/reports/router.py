@@ -1,25 +1,71 @@
-from datetime import datetime
+import os
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import FileResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 
-from app.core.database import get_session
+from app.core.config import settings
+from app.core.database import get_read_session, get_session, read_sessionmaker
+from app.core.downloads import export_file_response
+from app.core.events import iter_export_events
+from app.core.storage import ReportStorage
+from app.core.streaming import STREAM_MEDIA_TYPES, iter_stream
 from app.modules.auth.dependencies import CurrentUser, get_current_user, require_permission
 from app.modules.hotel.reports.schemas import (
     ReportCard,
     ReportDetail,
+    ReportExportBundleRequest,
     ReportExportOut,
     ReportExportRequest,
     ReportsListResponse,
+    ReportSummary,
+    StreamFormat,
 )
-from app.modules.hotel.reports.service import HotelReportService
+from app.modules.hotel.reports.service import REPORT_COLUMNS, REPORT_DEFINITIONS, HotelReportService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
 
 
+@router.get(
+    "/exports/events",
+    response_model=None,
+    dependencies=[Depends(require_permission("hotel:reports:export"))],
+)
+async def stream_export_events(
+    request: Request,
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    if current_user.tenant_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
+
+    tenant_id = str(current_user.tenant_id)
+
+    def render(event: dict) -> dict | None:
+        if event.get("scope") != "hotel" or event.get("tenant_id") != tenant_id:
+            return None
+        export = ReportExportOut.model_validate(event)
+        if export.status == "completed":
+            download_path = f"/hotel/reports/exports/{export.id}/download"
+            export = export.model_copy(update={"download_path": download_path})
+        return export.model_dump(mode="json")
+
+    # The stream stays open for a long time; release the auth lookup's connection now.
+    await session.close()
+    return StreamingResponse(
+        iter_export_events(request, str(current_user.id), render),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/exports/{export_id}",
     response_model=ReportExportOut,
@@ -56,9 +102,10 @@ async def get_export(
 )
 async def download_export(
     export_id: str,
+    request: Request,
     current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
-) -> FileResponse:
+) -> Response:
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
 
@@ -73,6 +120,8 @@ async def download_export(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export not found")
     if export.status in {"pending", "processing"}:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Export is still processing")
+    if export.status == "expired":
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Export has expired")
     if export.status == "failed":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -82,7 +131,59 @@ async def download_export(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export file not found")
 
     extension = export.export_format.lower()
-    return FileResponse(export.file_path, filename=export.file_name or f"report.{extension}")
+    try:
+        return export_file_response(
+            request,
+            export.file_path,
+            export.file_name or f"report.{extension}",
+            export.file_sha256,
+        )
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export file not found") from exc
+
+
+@router.post(
+    "/exports/bundle",
+    dependencies=[Depends(require_permission("hotel:reports:export"))],
+)
+async def download_export_bundle(
+    payload: ReportExportBundleRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> FileResponse:
+    if current_user.tenant_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
+
+    service = HotelReportService(session)
+    export_ids = list(dict.fromkeys(payload.export_ids))
+    exports = {export.id: export for export in await service.get_exports(current_user.tenant_id, export_ids)}
+    if len(exports) != len(export_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export not found")
+
+    entries = []
+    for export_id in export_ids:
+        export = exports[export_id]
+        if export.status != "completed" or not export.file_path:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Export {export.id} is not ready for download",
+            )
+        extension = export.export_format.lower()
+        entries.append((export.file_path, export.file_name or f"report-{export.id}.{extension}"))
+
+    storage = ReportStorage(settings.reports_storage_path)
+    try:
+        bundle_path = await run_in_threadpool(storage.build_bundle, entries)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export file not found") from exc
+
+    # The archive is a one-off artifact; drop it once it has been sent.
+    return FileResponse(
+        bundle_path,
+        media_type="application/zip",
+        filename=os.path.basename(bundle_path),
+        background=BackgroundTask(os.remove, bundle_path),
+    )
 
 
 @router.get(
@@ -94,7 +195,7 @@ async def list_reports(
     date_from: datetime | None = Query(None),
     date_to: datetime | None = Query(None),
     current_user: CurrentUser = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> ReportsListResponse:
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
@@ -114,8 +215,10 @@ async def get_report(
     date_from: datetime | None = Query(None),
     date_to: datetime | None = Query(None),
     status_filter: str | None = Query(None, alias="status"),
+    limit: int | None = Query(None, ge=1, le=500),
+    cursor: str | None = Query(None),
     current_user: CurrentUser = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> ReportDetail:
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
@@ -128,13 +231,130 @@ async def get_report(
             date_from=date_from,
             date_to=date_to,
             status=status_filter,
+            limit=limit,
+            cursor=cursor,
         )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
     return ReportDetail.model_validate(report)
 
 
+@router.get(
+    "/{report_code}/summary",
+    response_model=ReportSummary,
+    dependencies=[Depends(require_permission("hotel:reports:read"))],
+)
+async def get_report_summary(
+    report_code: str,
+    response: Response,
+    date_from: datetime | None = Query(None),
+    date_to: datetime | None = Query(None),
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session),
+) -> ReportSummary:
+    if current_user.tenant_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
+
+    service = HotelReportService(session)
+    try:
+        summary = await service.get_report_summary(
+            tenant_id=current_user.tenant_id,
+            report_code=report_code,
+            date_from=date_from,
+            date_to=date_to,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    response.headers["Cache-Control"] = f"private, max-age={settings.report_summary_max_age_seconds}"
+    return ReportSummary(code=report_code, summary=summary)
+
+
+async def _stream_report_body(
+    session_factory: async_sessionmaker[AsyncSession],
+    tenant_id: UUID,
+    report_code: str,
+    stream_format: str,
+    date_from: datetime | None,
+    date_to: datetime | None,
+    status_filter: str | None,
+) -> AsyncIterator[str]:
+    # The stream outlives the request-scoped session, so it owns its own.
+    async with session_factory() as session:
+        service = HotelReportService(session)
+        rows = service.stream_report_rows(
+            tenant_id=tenant_id,
+            report_code=report_code,
+            date_from=date_from,
+            date_to=date_to,
+            status=status_filter,
+        )
+        async for chunk in iter_stream(stream_format, REPORT_COLUMNS[report_code], rows):
+            yield chunk
+
+
+@router.get(
+    "/{report_code}/stream",
+    response_model=None,
+    dependencies=[Depends(require_permission("hotel:reports:export"))],
+)
+async def stream_report(
+    report_code: str,
+    request: Request,
+    stream_format: StreamFormat = Query("csv", alias="format"),
+    date_from: datetime | None = Query(None),
+    date_to: datetime | None = Query(None),
+    status_filter: str | None = Query(None, alias="status"),
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse | JSONResponse:
+    if current_user.tenant_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
+    if report_code not in REPORT_DEFINITIONS:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Unknown report")
+
+    service = HotelReportService(session)
+    estimated_rows = await service.estimate_report_rows(
+        tenant_id=current_user.tenant_id,
+        report_code=report_code,
+        date_from=date_from,
+        date_to=date_to,
+        status=status_filter,
+    )
+    if estimated_rows > settings.report_stream_max_rows:
+        export = await service.export_report(
+            tenant_id=current_user.tenant_id,
+            report_code=report_code,
+            export_format=stream_format,
+            date_from=date_from,
+            date_to=date_to,
+            requested_by=current_user.id,
+            status_filter=status_filter,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=ReportExportOut.model_validate(export).model_dump(mode="json"),
+            headers={"Location": f"/api/hotel/reports/exports/{export.id}"},
+        )
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    file_name = f"{report_code}-{timestamp}.{stream_format}"
+    return StreamingResponse(
+        _stream_report_body(
+            read_sessionmaker(request),
+            current_user.tenant_id, report_code, stream_format, date_from, date_to, status_filter
+        ),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{file_name}"',
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post(
     "/{report_code}/export",
     response_model=ReportExportOut,
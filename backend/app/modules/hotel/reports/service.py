@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, AsyncIterator, Callable
 from uuid import UUID
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.explain import estimate_row_count
 from app.core.storage import ReportStorage
 from app.models.guest import Guest
 from app.models.incident import Incident
@@ -16,6 +17,13 @@ from app.models.invoice import Invoice
 from app.models.kiosk import Kiosk
 from app.models.report_export import ReportExport
 from app.models.room import Room
+from app.services.base import (
+    NULL_TIMESTAMP_FLOOR,
+    DateShard,
+    apply_keyset,
+    plan_date_shards,
+    split_keyset_page,
+)
 
 
 @dataclass(frozen=True)
@@ -54,6 +62,44 @@ REPORT_DEFINITIONS = {
 }
 
 
+REPORT_COLUMNS = {
+    "guest_activity": [
+        {"key": "guest", "label": "Guest"},
+        {"key": "status", "label": "Status"},
+        {"key": "check_in_at", "label": "Check In"},
+        {"key": "check_out_at", "label": "Check Out"},
+        {"key": "email", "label": "Email"},
+    ],
+    "room_status": [
+        {"key": "room_number", "label": "Room"},
+        {"key": "room_type", "label": "Type"},
+        {"key": "status", "label": "Status"},
+        {"key": "floor", "label": "Floor"},
+        {"key": "rate_cents", "label": "Rate (cents)"},
+    ],
+    "incident_overview": [
+        {"key": "title", "label": "Incident"},
+        {"key": "status", "label": "Status"},
+        {"key": "severity", "label": "Severity"},
+        {"key": "occurred_at", "label": "Occurred"},
+        {"key": "resolved_at", "label": "Resolved"},
+    ],
+    "kiosk_health": [
+        {"key": "name", "label": "Kiosk"},
+        {"key": "location", "label": "Location"},
+        {"key": "status", "label": "Status"},
+        {"key": "last_seen_at", "label": "Last Seen"},
+    ],
+    "billing_snapshot": [
+        {"key": "invoice_number", "label": "Invoice"},
+        {"key": "status", "label": "Status"},
+        {"key": "amount_cents", "label": "Amount (cents)"},
+        {"key": "issued_at", "label": "Issued"},
+        {"key": "due_at", "label": "Due"},
+    ],
+}
+
+
 def apply_date_filter(stmt, column, date_from: datetime | None, date_to: datetime | None):
     if date_from:
         stmt = stmt.where(column >= date_from)
@@ -119,7 +165,15 @@ class HotelReportService:
         date_from: datetime | None = None,
         date_to: datetime | None = None,
         status: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
+        """Build a report detail.
+
+        Without ``limit`` every row is returned (used by exports). With ``limit``
+        the rows are one keyset page and ``next_cursor`` resumes after it; the
+        summary is only computed for the first page.
+        """
         definition = REPORT_DEFINITIONS.get(report_code)
         if not definition:
             raise ValueError("Unknown report")
@@ -130,105 +184,40 @@ class HotelReportService:
             "status": status,
         }
 
-        if report_code == "guest_activity":
-            summary = await self._guest_metrics(tenant_id, date_from, date_to)
-            rows = await self._guest_rows(tenant_id, date_from, date_to, status)
-            columns = [
-                {"key": "guest", "label": "Guest"},
-                {"key": "status", "label": "Status"},
-                {"key": "check_in_at", "label": "Check In"},
-                {"key": "check_out_at", "label": "Check Out"},
-                {"key": "email", "label": "Email"},
-            ]
-            return {
-                "code": definition.code,
-                "title": definition.title,
-                "description": definition.description,
-                "filters": filters,
-                "summary": summary,
-                "columns": columns,
-                "rows": rows,
-            }
+        summary: list[dict[str, Any]] = []
+        if cursor is None:
+            summary = await self.get_report_summary(tenant_id, report_code, date_from, date_to)
+        rows, next_cursor = await self._report_rows(
+            tenant_id, report_code, date_from, date_to, status, limit, cursor
+        )
+        return {
+            "code": definition.code,
+            "title": definition.title,
+            "description": definition.description,
+            "filters": filters,
+            "summary": summary,
+            "columns": REPORT_COLUMNS[report_code],
+            "rows": rows,
+            "next_cursor": next_cursor,
+        }
 
+    async def get_report_summary(
+        self,
+        tenant_id: UUID,
+        report_code: str,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        if report_code == "guest_activity":
+            return await self._guest_metrics(tenant_id, date_from, date_to)
         if report_code == "room_status":
-            summary = await self._room_metrics(tenant_id, date_from, date_to)
-            rows = await self._room_rows(tenant_id, date_from, date_to, status)
-            columns = [
-                {"key": "room_number", "label": "Room"},
-                {"key": "room_type", "label": "Type"},
-                {"key": "status", "label": "Status"},
-                {"key": "floor", "label": "Floor"},
-                {"key": "rate_cents", "label": "Rate (cents)"},
-            ]
-            return {
-                "code": definition.code,
-                "title": definition.title,
-                "description": definition.description,
-                "filters": filters,
-                "summary": summary,
-                "columns": columns,
-                "rows": rows,
-            }
-
+            return await self._room_metrics(tenant_id, date_from, date_to)
         if report_code == "incident_overview":
-            summary = await self._incident_metrics(tenant_id, date_from, date_to)
-            rows = await self._incident_rows(tenant_id, date_from, date_to, status)
-            columns = [
-                {"key": "title", "label": "Incident"},
-                {"key": "status", "label": "Status"},
-                {"key": "severity", "label": "Severity"},
-                {"key": "occurred_at", "label": "Occurred"},
-                {"key": "resolved_at", "label": "Resolved"},
-            ]
-            return {
-                "code": definition.code,
-                "title": definition.title,
-                "description": definition.description,
-                "filters": filters,
-                "summary": summary,
-                "columns": columns,
-                "rows": rows,
-            }
-
+            return await self._incident_metrics(tenant_id, date_from, date_to)
         if report_code == "kiosk_health":
-            summary = await self._kiosk_metrics(tenant_id, date_from, date_to)
-            rows = await self._kiosk_rows(tenant_id, date_from, date_to, status)
-            columns = [
-                {"key": "name", "label": "Kiosk"},
-                {"key": "location", "label": "Location"},
-                {"key": "status", "label": "Status"},
-                {"key": "last_seen_at", "label": "Last Seen"},
-            ]
-            return {
-                "code": definition.code,
-                "title": definition.title,
-                "description": definition.description,
-                "filters": filters,
-                "summary": summary,
-                "columns": columns,
-                "rows": rows,
-            }
-
+            return await self._kiosk_metrics(tenant_id, date_from, date_to)
         if report_code == "billing_snapshot":
-            summary = await self._billing_metrics(tenant_id, date_from, date_to)
-            rows = await self._billing_rows(tenant_id, date_from, date_to, status)
-            columns = [
-                {"key": "invoice_number", "label": "Invoice"},
-                {"key": "status", "label": "Status"},
-                {"key": "amount_cents", "label": "Amount (cents)"},
-                {"key": "issued_at", "label": "Issued"},
-                {"key": "due_at", "label": "Due"},
-            ]
-            return {
-                "code": definition.code,
-                "title": definition.title,
-                "description": definition.description,
-                "filters": filters,
-                "summary": summary,
-                "columns": columns,
-                "rows": rows,
-            }
-
+            return await self._billing_metrics(tenant_id, date_from, date_to)
         raise ValueError("Unknown report")
 
     async def export_report(
@@ -242,7 +231,7 @@ class HotelReportService:
         status_filter: str | None = None,
     ) -> ReportExport:
         export_format = export_format.lower()
-        if export_format not in {"csv", "pdf", "excel"}:
+        if export_format not in {"csv", "ndjson", "parquet", "pdf", "excel"}:
             raise ValueError("Unsupported export format")
         if report_code not in REPORT_DEFINITIONS:
             raise ValueError("Unknown report")
@@ -271,6 +260,82 @@ class HotelReportService:
         )
         return await self.session.scalar(stmt)
 
+    async def get_exports(self, tenant_id: UUID, export_ids: list[UUID]) -> list[ReportExport]:
+        stmt = select(ReportExport).where(
+            ReportExport.id.in_(export_ids), ReportExport.tenant_id == tenant_id
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def estimate_report_rows(
+        self,
+        tenant_id: UUID,
+        report_code: str,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        status: str | None = None,
+    ) -> int:
+        stmt, _, _ = self._ordered_rows_stmt(tenant_id, report_code, date_from, date_to, status)
+        return await estimate_row_count(self.session, stmt)
+
+    async def stream_report_rows(
+        self,
+        tenant_id: UUID,
+        report_code: str,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        status: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield report rows from a server-side cursor without materializing the result."""
+        stmt, mapper, _ = self._ordered_rows_stmt(tenant_id, report_code, date_from, date_to, status)
+        stmt = stmt.execution_options(yield_per=settings.report_stream_fetch_size)
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield mapper(row)
+
+    async def plan_export_shards(
+        self,
+        tenant_id: UUID,
+        report_code: str,
+        shard_count: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        status: str | None = None,
+    ) -> list[DateShard]:
+        """Split a report into date-range shards over its leading sort column.
+
+        Shards come back in report order so their rendered parts can simply be
+        concatenated. Returns an empty list when there is nothing to split or the
+        report is not ordered by a date.
+        """
+        column = self._shard_column(report_code)
+        if column is None:
+            return []
+        stmt, _, _, descending = self._row_source(tenant_id, report_code, date_from, date_to, status)
+        bounds_stmt = stmt.with_only_columns(
+            func.min(column), func.max(column), func.count().filter(column.is_(None))
+        )
+        lower, upper, null_count = (await self.session.execute(bounds_stmt)).one()
+        if lower is None or upper is None:
+            return []
+        return plan_date_shards(
+            lower, upper, shard_count, descending=descending, include_nulls=bool(null_count)
+        )
+
+    async def get_shard_rows(
+        self,
+        tenant_id: UUID,
+        report_code: str,
+        shard: DateShard,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        status: str | None = None,
+    ) -> list[dict[str, Any]]:
+        stmt, mapper, _ = self._ordered_rows_stmt(tenant_id, report_code, date_from, date_to, status)
+        stmt = stmt.where(shard.clause(self._shard_column(report_code)))
+        result = await self.session.execute(stmt)
+        return [mapper(row) for row in result]
+
     async def _guest_metrics(
         self, tenant_id: UUID, date_from: datetime | None, date_to: datetime | None
     ) -> list[dict[str, Any]]:
@@ -433,133 +498,238 @@ class HotelReportService:
             {"label": "Balance (cents)", "value": int(balance or 0)},
         ]
 
-    async def _guest_rows(
+    def _row_source(
         self,
         tenant_id: UUID,
+        report_code: str,
         date_from: datetime | None,
         date_to: datetime | None,
         status: str | None,
-    ) -> list[dict[str, Any]]:
-        stmt = select(Guest).where(Guest.tenant_id == tenant_id)
+    ) -> tuple[Any, Callable[[Any], dict[str, Any]], tuple[Any, ...], bool]:
+        """Return ``(stmt, mapper, sort_keys, descending)`` for a report's rows.
+
+        Sort keys end with the primary key so keyset pages are stable.
+        """
+        if report_code == "guest_activity":
+            sort_keys = (
+                func.coalesce(Guest.check_in_at, NULL_TIMESTAMP_FLOOR),
+                Guest.created_at,
+                Guest.id,
+            )
+            stmt = self._guest_rows_stmt(tenant_id, date_from, date_to, status)
+            return stmt, self._guest_row, sort_keys, True
+        if report_code == "room_status":
+            stmt = self._room_rows_stmt(tenant_id, date_from, date_to, status)
+            return stmt, self._room_row, (Room.number, Room.id), False
+        if report_code == "incident_overview":
+            sort_keys = (
+                func.coalesce(Incident.occurred_at, NULL_TIMESTAMP_FLOOR),
+                Incident.created_at,
+                Incident.id,
+            )
+            stmt = self._incident_rows_stmt(tenant_id, date_from, date_to, status)
+            return stmt, self._incident_row, sort_keys, True
+        if report_code == "kiosk_health":
+            stmt = self._kiosk_rows_stmt(tenant_id, date_from, date_to, status)
+            return stmt, self._kiosk_row, (Kiosk.name, Kiosk.id), False
+        if report_code == "billing_snapshot":
+            sort_keys = (func.coalesce(Invoice.issued_at, NULL_TIMESTAMP_FLOOR), Invoice.id)
+            stmt = self._billing_rows_stmt(tenant_id, date_from, date_to, status)
+            return stmt, self._billing_row, sort_keys, True
+        raise ValueError("Unknown report")
+
+    @staticmethod
+    def _shard_column(report_code: str):
+        """The date under a report's leading sort key, or None if it is not date-ordered.
+
+        The sort key coalesces NULL to NULL_TIMESTAMP_FLOOR, so NULLs sort last in
+        these descending reports, which is where ``plan_date_shards`` puts the
+        NULL shard.
+        """
+        if report_code == "guest_activity":
+            return Guest.check_in_at
+        if report_code == "incident_overview":
+            return Incident.occurred_at
+        if report_code == "billing_snapshot":
+            return Invoice.issued_at
+        if report_code in {"room_status", "kiosk_health"}:
+            return None
+        raise ValueError("Unknown report")
+
+    def _ordered_rows_stmt(
+        self,
+        tenant_id: UUID,
+        report_code: str,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        status: str | None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[Any, Callable[[Any], dict[str, Any]], int]:
+        stmt, mapper, sort_keys, descending = self._row_source(
+            tenant_id, report_code, date_from, date_to, status
+        )
+        stmt = apply_keyset(stmt, sort_keys, descending=descending, cursor=cursor, limit=limit)
+        return stmt, mapper, len(sort_keys)
+
+    async def _report_rows(
+        self,
+        tenant_id: UUID,
+        report_code: str,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        status: str | None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        stmt, mapper, key_count = self._ordered_rows_stmt(
+            tenant_id, report_code, date_from, date_to, status, limit, cursor
+        )
+        result = await self.session.execute(stmt)
+        page, next_cursor = split_keyset_page(result.all(), limit, key_count)
+        return [mapper(row) for row in page], next_cursor
+
+    def _guest_rows_stmt(
+        self,
+        tenant_id: UUID,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        status: str | None,
+    ):
+        stmt = select(
+            Guest.first_name,
+            Guest.last_name,
+            Guest.status,
+            Guest.check_in_at,
+            Guest.check_out_at,
+            Guest.email,
+        ).where(Guest.tenant_id == tenant_id)
         if status:
             stmt = stmt.where(Guest.status == status)
         stmt = apply_date_filter(stmt, Guest.created_at, date_from, date_to)
-        stmt = stmt.order_by(Guest.check_in_at.desc().nullslast(), Guest.created_at.desc())
-        result = await self.session.execute(stmt)
-        rows = []
-        for guest in result.scalars().all():
-            rows.append(
-                {
-                    "guest": f"{guest.first_name} {guest.last_name}",
-                    "status": guest.status,
-                    "check_in_at": guest.check_in_at,
-                    "check_out_at": guest.check_out_at,
-                    "email": guest.email,
-                }
-            )
-        return rows
+        return stmt
+
+    @staticmethod
+    def _guest_row(row) -> dict[str, Any]:
+        return {
+            "guest": f"{row.first_name} {row.last_name}",
+            "status": row.status,
+            "check_in_at": row.check_in_at,
+            "check_out_at": row.check_out_at,
+            "email": row.email,
+        }
 
-    async def _room_rows(
+    def _room_rows_stmt(
         self,
         tenant_id: UUID,
         date_from: datetime | None,
         date_to: datetime | None,
         status: str | None,
-    ) -> list[dict[str, Any]]:
-        stmt = select(Room).where(Room.tenant_id == tenant_id)
+    ):
+        stmt = select(
+            Room.number,
+            Room.room_type,
+            Room.status,
+            Room.floor,
+            Room.rate_cents,
+        ).where(Room.tenant_id == tenant_id)
         if status:
             stmt = stmt.where(Room.status == status)
         stmt = apply_date_filter(stmt, Room.created_at, date_from, date_to)
-        stmt = stmt.order_by(Room.number.asc())
-        result = await self.session.execute(stmt)
-        rows = []
-        for room in result.scalars().all():
-            rows.append(
-                {
-                    "room_number": room.number,
-                    "room_type": room.room_type,
-                    "status": room.status,
-                    "floor": room.floor,
-                    "rate_cents": room.rate_cents,
-                }
-            )
-        return rows
+        return stmt
+
+    @staticmethod
+    def _room_row(row) -> dict[str, Any]:
+        return {
+            "room_number": row.number,
+            "room_type": row.room_type,
+            "status": row.status,
+            "floor": row.floor,
+            "rate_cents": row.rate_cents,
+        }
 
-    async def _incident_rows(
+    def _incident_rows_stmt(
         self,
         tenant_id: UUID,
         date_from: datetime | None,
         date_to: datetime | None,
         status: str | None,
-    ) -> list[dict[str, Any]]:
-        stmt = select(Incident).where(Incident.tenant_id == tenant_id)
+    ):
+        stmt = select(
+            Incident.title,
+            Incident.status,
+            Incident.severity,
+            Incident.occurred_at,
+            Incident.resolved_at,
+        ).where(Incident.tenant_id == tenant_id)
         if status:
             stmt = stmt.where(Incident.status == status)
         date_column = func.coalesce(Incident.occurred_at, Incident.created_at)
         stmt = apply_date_filter(stmt, date_column, date_from, date_to)
-        stmt = stmt.order_by(Incident.occurred_at.desc().nullslast(), Incident.created_at.desc())
-        result = await self.session.execute(stmt)
-        rows = []
-        for incident in result.scalars().all():
-            rows.append(
-                {
-                    "title": incident.title,
-                    "status": incident.status,
-                    "severity": incident.severity,
-                    "occurred_at": incident.occurred_at,
-                    "resolved_at": incident.resolved_at,
-                }
-            )
-        return rows
+        return stmt
+
+    @staticmethod
+    def _incident_row(row) -> dict[str, Any]:
+        return {
+            "title": row.title,
+            "status": row.status,
+            "severity": row.severity,
+            "occurred_at": row.occurred_at,
+            "resolved_at": row.resolved_at,
+        }
 
-    async def _kiosk_rows(
+    def _kiosk_rows_stmt(
         self,
         tenant_id: UUID,
         date_from: datetime | None,
         date_to: datetime | None,
         status: str | None,
-    ) -> list[dict[str, Any]]:
-        stmt = select(Kiosk).where(Kiosk.tenant_id == tenant_id)
+    ):
+        stmt = select(
+            Kiosk.name,
+            Kiosk.location,
+            Kiosk.status,
+            Kiosk.last_seen_at,
+        ).where(Kiosk.tenant_id == tenant_id)
         if status:
             stmt = stmt.where(Kiosk.status == status)
         stmt = apply_date_filter(stmt, Kiosk.created_at, date_from, date_to)
-        stmt = stmt.order_by(Kiosk.name.asc())
-        result = await self.session.execute(stmt)
-        rows = []
-        for kiosk in result.scalars().all():
-            rows.append(
-                {
-                    "name": kiosk.name,
-                    "location": kiosk.location,
-                    "status": kiosk.status,
-                    "last_seen_at": kiosk.last_seen_at,
-                }
-            )
-        return rows
+        return stmt
+
+    @staticmethod
+    def _kiosk_row(row) -> dict[str, Any]:
+        return {
+            "name": row.name,
+            "location": row.location,
+            "status": row.status,
+            "last_seen_at": row.last_seen_at,
+        }
 
-    async def _billing_rows(
+    def _billing_rows_stmt(
         self,
         tenant_id: UUID,
         date_from: datetime | None,
         date_to: datetime | None,
         status: str | None,
-    ) -> list[dict[str, Any]]:
-        stmt = select(Invoice).where(Invoice.tenant_id == tenant_id)
+    ):
+        stmt = select(
+            Invoice.invoice_number,
+            Invoice.status,
+            Invoice.amount_cents,
+            Invoice.issued_at,
+            Invoice.due_at,
+        ).where(Invoice.tenant_id == tenant_id)
         if status:
             stmt = stmt.where(Invoice.status == status)
         stmt = apply_date_filter(stmt, Invoice.issued_at, date_from, date_to)
-        stmt = stmt.order_by(Invoice.issued_at.desc())
-        result = await self.session.execute(stmt)
-        rows = []
-        for invoice in result.scalars().all():
-            rows.append(
-                {
-                    "invoice_number": invoice.invoice_number,
-                    "status": invoice.status,
-                    "amount_cents": invoice.amount_cents,
-                    "issued_at": invoice.issued_at,
-                    "due_at": invoice.due_at,
-                }
-            )
-        return rows
-
+        return stmt
+
+    @staticmethod
+    def _billing_row(row) -> dict[str, Any]:
+        return {
+            "invoice_number": row.invoice_number,
+            "status": row.status,
+            "amount_cents": row.amount_cents,
+            "issued_at": row.issued_at,
+            "due_at": row.due_at,
+        }
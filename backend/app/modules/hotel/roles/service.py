@@ -1,8 +1,12 @@
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.models.rbac import Permission, Role, RolePermission
+from app.services.base import insert_returning
+
+
+ROLE_CONSTRAINT_ERRORS = {"unique_role_per_context": "Role name already exists"}
 
 
 class HotelRoleService:
@@ -56,34 +60,28 @@ class HotelRoleService:
         return [row[0] for row in result.fetchall()]
 
     async def create(self, tenant_id: UUID, payload) -> Role:
-        existing = await self.session.scalar(
-            select(Role).where(
-                Role.name == payload.name,
-                Role.role_type == "hotel",
-                Role.tenant_id == tenant_id,
-            )
-        )
-        if existing:
-            raise ValueError("Role name already exists")
-
         permissions = await self._validate_permissions(payload.permissions)
 
-        role = Role(
-            name=payload.name,
-            display_name=payload.display_name,
-            description=payload.description,
-            role_type="hotel",
-            is_system=False,
-            tenant_id=tenant_id,
+        role = await insert_returning(
+            self.session,
+            Role,
+            {
+                "name": payload.name,
+                "display_name": payload.display_name,
+                "description": payload.description,
+                "role_type": "hotel",
+                "is_system": False,
+                "tenant_id": tenant_id,
+            },
+            ROLE_CONSTRAINT_ERRORS,
         )
-        self.session.add(role)
-        await self.session.flush()
-
-        for perm in permissions:
-            self.session.add(RolePermission(role_id=role.id, permission_id=perm.id))
+        if permissions:
+            await self.session.execute(
+                insert(RolePermission),
+                [{"role_id": role.id, "permission_id": perm.id} for perm in permissions],
+            )
 
         await self.session.commit()
-        await self.session.refresh(role)
         return role
 
     async def update(self, role: Role, tenant_id: UUID, payload) -> Role:
@@ -3,15 +3,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.core.database import get_session
+from app.core.permissions import has_permission
 from app.modules.auth.dependencies import CurrentUser, get_current_user, require_permission
 from app.modules.hotel.rooms.schemas import (
+    RoomBatchItemResult,
+    RoomBatchRequest,
+    RoomBatchResponse,
     RoomCreate,
     RoomListResponse,
     RoomOut,
+    RoomStatusTransition,
+    RoomStatusTransitionResponse,
     RoomUpdate,
     Pagination,
 )
 from app.modules.hotel.rooms.service import RoomService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -25,6 +32,8 @@ router = APIRouter()
 async def list_rooms(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     search: str | None = Query(None),
     current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
@@ -32,10 +41,21 @@ async def list_rooms(
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
     service = RoomService(session)
-    items, total = await service.list(current_user.tenant_id, page, limit, search)
+    try:
+        listing = await service.list(
+            current_user.tenant_id, page, limit, search, cursor=cursor, include_total=include_total
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return RoomListResponse(
-        items=[RoomOut.model_validate(item) for item in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[RoomOut.model_validate(item) for item in listing.items],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
@@ -84,6 +104,58 @@ async def create_room(
     return RoomOut.model_validate(room)
 
 
+@router.post(
+    "/batch",
+    response_model=RoomBatchResponse,
+    dependencies=[Depends(require_permission("hotel:rooms:create"))],
+)
+async def batch_create_rooms(
+    payload: RoomBatchRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> RoomBatchResponse:
+    if current_user.tenant_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
+    if payload.mode == "upsert" and not has_permission(
+        current_user.permissions, "hotel:rooms:update"
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    service = RoomService(session)
+    results = [
+        RoomBatchItemResult.model_validate(result)
+        for result in await service.batch_upsert(current_user.tenant_id, payload.items, payload.mode)
+    ]
+    created = sum(1 for result in results if result.status == "created")
+    updated = sum(1 for result in results if result.status == "updated")
+    return RoomBatchResponse(
+        results=results,
+        created=created,
+        updated=updated,
+        failed=len(results) - created - updated,
+    )
+
+
+@router.post(
+    "/status",
+    response_model=RoomStatusTransitionResponse,
+    dependencies=[Depends(require_permission("hotel:rooms:update"))],
+)
+async def transition_room_status(
+    payload: RoomStatusTransition,
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> RoomStatusTransitionResponse:
+    if current_user.tenant_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
+    service = RoomService(session)
+    rooms = await service.transition_status(current_user.tenant_id, payload)
+    updated_ids = {room.id for room in rooms}
+    return RoomStatusTransitionResponse(
+        updated=[RoomOut.model_validate(room) for room in rooms],
+        skipped_ids=[room_id for room_id in payload.room_ids or [] if room_id not in updated_ids],
+    )
+
+
 @router.put(
     "/{room_id}",
     response_model=RoomOut,
@@ -103,14 +175,12 @@ async def update_room(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid room id") from exc
 
-    room = await service.get(current_user.tenant_id, room_uuid)
-    if not room:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
-
     try:
-        updated = await service.update(room, payload)
+        updated = await service.update(current_user.tenant_id, room_uuid, payload)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if not updated:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found")
     return RoomOut.model_validate(updated)
 
 
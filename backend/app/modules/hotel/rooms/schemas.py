@@ -1,5 +1,6 @@
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import Literal
 from uuid import UUID
 
 
@@ -45,9 +46,54 @@ class RoomOut(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class RoomListResponse(BaseModel):
     items: list[RoomOut]
     pagination: Pagination
+
+
+class RoomBatchRequest(BaseModel):
+    items: list[RoomCreate] = Field(min_length=1, max_length=1000)
+    # "create" reports existing numbers as conflicts; "upsert" updates those rooms.
+    mode: Literal["create", "upsert"] = "create"
+
+
+class RoomBatchItemResult(BaseModel):
+    index: int
+    number: str
+    status: Literal["created", "updated", "conflict", "duplicate"]
+    room: RoomOut | None = None
+    detail: str | None = None
+
+
+class RoomBatchResponse(BaseModel):
+    results: list[RoomBatchItemResult]
+    created: int
+    updated: int
+    failed: int
+
+
+class RoomStatusTransition(BaseModel):
+    status: str = Field(min_length=1, max_length=30)
+    # Rooms are selected by id and/or by floor and room type; at least one is required.
+    room_ids: list[UUID] | None = Field(default=None, max_length=1000)
+    floor: str | None = Field(default=None, max_length=20)
+    room_type: str | None = Field(default=None, max_length=80)
+    # Only rooms currently in one of these statuses change; others are skipped.
+    expected_status: list[str] | None = None
+
+    @model_validator(mode="after")
+    def require_selector(self) -> "RoomStatusTransition":
+        if not self.room_ids and self.floor is None and self.room_type is None:
+            raise ValueError("Provide room_ids, floor or room_type")
+        return self
+
+
+class RoomStatusTransitionResponse(BaseModel):
+    updated: list[RoomOut]
+    # Requested ids that were not changed: unknown, or not in an expected status.
+    skipped_ids: list[UUID] = []
@@ -1,8 +1,35 @@
-from sqlalchemy import func, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from __future__ import annotations
+
+from typing import Any, Sequence
 from uuid import UUID
 
+from sqlalchemy import func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.models.room import Room
+from app.modules.audit.hooks import audit_event_stub
+from app.services.base import (
+    ListPage,
+    changed_fields,
+    insert_returning,
+    paginate,
+    update_returning,
+)
+from app.services.search import (
+    ROOM_DOCUMENT,
+    index_document,
+    index_documents,
+    ranked_search,
+    remove_document,
+)
+
+
+# Columns an upsert overwrites on an existing room. Status is left alone:
+# housekeeping owns it once the room exists.
+ROOM_UPSERT_COLUMNS = ("room_type", "floor", "capacity", "rate_cents", "currency", "description")
+
+ROOM_CONSTRAINT_ERRORS = {"ix_rooms_tenant_number": "Room number already exists"}
 
 
 class RoomService:
@@ -15,92 +42,186 @@ class RoomService:
         page: int,
         limit: int,
         search: str | None = None,
-    ) -> tuple[list[Room], int]:
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> ListPage:
         page = max(page, 1)
         limit = max(min(limit, 100), 1)
 
-        total_stmt = select(func.count()).select_from(Room).where(Room.tenant_id == tenant_id)
         stmt = select(Room).where(Room.tenant_id == tenant_id)
-
+        sort_keys = (Room.created_at, Room.id)
         if search:
-            like = f"%{search.strip()}%"
-            total_stmt = total_stmt.where(
-                or_(
-                    Room.number.ilike(like),
-                    Room.room_type.ilike(like),
-                )
-            )
-            stmt = stmt.where(
-                or_(
-                    Room.number.ilike(like),
-                    Room.room_type.ilike(like),
-                )
-            )
+            stmt, sort_keys = ranked_search(stmt, ROOM_DOCUMENT, search, sort_keys)
 
-        total = await self.session.scalar(total_stmt)
-        stmt = stmt.order_by(Room.created_at.desc()).offset((page - 1) * limit).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all(), int(total or 0)
+        return await paginate(
+            self.session,
+            stmt,
+            sort_keys,
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            include_total=include_total,
+            count_key=("rooms", tenant_id, search),
+            filtered=bool(search),
+        )
 
     async def get(self, tenant_id: UUID, room_id: UUID) -> Room | None:
         stmt = select(Room).where(Room.id == room_id, Room.tenant_id == tenant_id)
         return await self.session.scalar(stmt)
 
     async def create(self, tenant_id: UUID, payload) -> Room:
-        existing = await self.session.scalar(
-            select(Room).where(Room.tenant_id == tenant_id, Room.number == payload.number)
-        )
-        if existing:
-            raise ValueError("Room number already exists")
-
-        room = Room(
-            tenant_id=tenant_id,
-            number=payload.number,
-            room_type=payload.room_type,
-            floor=payload.floor,
-            status=payload.status,
-            capacity=payload.capacity,
-            rate_cents=payload.rate_cents,
-            currency=(payload.currency or "USD").upper(),
-            description=payload.description,
+        room = await insert_returning(
+            self.session,
+            Room,
+            {
+                "tenant_id": tenant_id,
+                "number": payload.number,
+                "room_type": payload.room_type,
+                "floor": payload.floor,
+                "status": payload.status,
+                "capacity": payload.capacity,
+                "rate_cents": payload.rate_cents,
+                "currency": (payload.currency or "USD").upper(),
+                "description": payload.description,
+            },
+            ROOM_CONSTRAINT_ERRORS,
         )
-        self.session.add(room)
+        await index_document(self.session, room)
         await self.session.commit()
-        await self.session.refresh(room)
         return room
 
-    async def update(self, room: Room, payload) -> Room:
-        if payload.number is not None:
-            existing = await self.session.scalar(
-                select(Room).where(
-                    Room.tenant_id == room.tenant_id,
-                    Room.number == payload.number,
-                    Room.id != room.id,
-                )
+    async def batch_upsert(
+        self, tenant_id: UUID, items: Sequence, mode: str = "create"
+    ) -> list[dict[str, Any]]:
+        """Create rooms by number in one ``INSERT ... ON CONFLICT``; upsert mode updates.
+
+        ix_rooms_tenant_number arbitrates conflicts. Returns one result per item,
+        in request order; a number repeated within the batch only applies once.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        positions: dict[str, int] = {}
+        values = []
+        for index, item in enumerate(items):
+            if item.number in positions:
+                results[index] = {
+                    "index": index,
+                    "number": item.number,
+                    "status": "duplicate",
+                    "detail": "Duplicate room number in batch",
+                }
+                continue
+            positions[item.number] = index
+            values.append(
+                {
+                    "tenant_id": tenant_id,
+                    "number": item.number,
+                    "room_type": item.room_type,
+                    "floor": item.floor,
+                    "status": item.status,
+                    "capacity": item.capacity,
+                    "rate_cents": item.rate_cents,
+                    "currency": (item.currency or "USD").upper(),
+                    "description": item.description,
+                }
             )
-            if existing:
-                raise ValueError("Room number already exists")
-            room.number = payload.number
-        if payload.room_type is not None:
-            room.room_type = payload.room_type
+
+        stmt = insert(Room)
+        if mode == "upsert":
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Room.tenant_id, Room.number],
+                set_={
+                    **{column: stmt.excluded[column] for column in ROOM_UPSERT_COLUMNS},
+                    "updated_at": func.now(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[Room.tenant_id, Room.number])
+        # xmax is zero only on rows this statement inserted rather than updated.
+        stmt = stmt.returning(Room, literal_column("xmax = 0").label("inserted"))
+        result = await self.session.execute(
+            stmt, values, execution_options={"populate_existing": True}
+        )
+        rows = result.all()
+        if rows:
+            await index_documents(self.session, Room, [room.id for room, _ in rows])
+        await self.session.commit()
+
+        for room, inserted in rows:
+            index = positions[room.number]
+            results[index] = {
+                "index": index,
+                "number": room.number,
+                "status": "created" if inserted else "updated",
+                "room": room,
+            }
+        for number, index in positions.items():
+            if results[index] is None:
+                results[index] = {
+                    "index": index,
+                    "number": number,
+                    "status": "conflict",
+                    "detail": "Room number already exists",
+                }
+        return results
+
+    async def transition_status(self, tenant_id: UUID, payload) -> list[Room]:
+        """Move every selected room to ``payload.status`` with one ``UPDATE ... RETURNING``.
+
+        Rooms outside ``expected_status`` are left as they are. The whole change
+        is recorded as a single audit entry.
+        """
+        stmt = update(Room).where(Room.tenant_id == tenant_id)
+        if payload.room_ids:
+            stmt = stmt.where(Room.id.in_(payload.room_ids))
         if payload.floor is not None:
-            room.floor = payload.floor
-        if payload.status is not None:
-            room.status = payload.status
-        if payload.capacity is not None:
-            room.capacity = payload.capacity
-        if payload.rate_cents is not None:
-            room.rate_cents = payload.rate_cents
-        if payload.currency is not None:
-            room.currency = payload.currency.upper()
-        if payload.description is not None:
-            room.description = payload.description
-
-        self.session.add(room)
+            stmt = stmt.where(Room.floor == payload.floor)
+        if payload.room_type is not None:
+            stmt = stmt.where(Room.room_type == payload.room_type)
+        if payload.expected_status:
+            stmt = stmt.where(Room.status.in_(payload.expected_status))
+        stmt = (
+            stmt.values(status=payload.status, updated_at=func.now())
+            .returning(Room)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        rooms = list((await self.session.scalars(stmt)).all())
+
+        if rooms:
+            await audit_event_stub(
+                session=self.session,
+                action="room.status.bulk_changed",
+                tenant_id=tenant_id,
+                resource_type="room",
+                metadata={
+                    "status": payload.status,
+                    "expected_status": payload.expected_status,
+                    "floor": payload.floor,
+                    "room_type": payload.room_type,
+                    "room_ids": [str(room.id) for room in rooms],
+                },
+            )
         await self.session.commit()
-        await self.session.refresh(room)
+        return rooms
+
+    async def update(self, tenant_id: UUID, room_id: UUID, payload) -> Room | None:
+        values = changed_fields(payload)
+        if "currency" in values:
+            values["currency"] = values["currency"].upper()
+
+        room = await update_returning(
+            self.session,
+            Room,
+            room_id,
+            values,
+            tenant_id=tenant_id,
+            constraint_errors=ROOM_CONSTRAINT_ERRORS,
+        )
+        if room is not None and values:
+            await index_document(self.session, room)
+            await self.session.commit()
         return room
 
     async def delete(self, room: Room) -> None:
+        await remove_document(self.session, room)
         await self.session.delete(room)
         await self.session.commit()
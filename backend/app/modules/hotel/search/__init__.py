@@ -0,0 +1 @@
+# hotel search module
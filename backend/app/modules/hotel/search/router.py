@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_session
+from app.core.permissions import has_permission
+from app.modules.auth.dependencies import CurrentUser, get_current_user
+from app.modules.hotel.search.schemas import SearchResponse
+from app.modules.hotel.search.service import HotelSearchService
+
+
+router = APIRouter()
+
+# Each entity type is only searched for users who may read that module.
+ENTITY_PERMISSIONS = {
+    "guests": "hotel:guests:read",
+    "rooms": "hotel:rooms:read",
+    "incidents": "hotel:incidents:read",
+    "helpdesk": "hotel:support:read",
+}
+
+
+@router.get("/", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(5, ge=1, le=20),
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> SearchResponse:
+    if current_user.tenant_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
+    entity_types = [
+        entity_type
+        for entity_type, permission in ENTITY_PERMISSIONS.items()
+        if has_permission(current_user.permissions, permission)
+    ]
+    if not entity_types:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    service = HotelSearchService(session)
+    results = await service.search(current_user.tenant_id, q, entity_types, limit)
+    return SearchResponse(query=q, results=results)
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from uuid import UUID
+
+
+class SearchHit(BaseModel):
+    entity_id: UUID
+    title: str
+    headline: str
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: dict[str, list[SearchHit]]
@@ -0,0 +1,81 @@
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.models.search_document import SearchDocument
+from app.services.search import TEXT_SEARCH_CONFIG, prefix_query
+
+
+HEADLINE_OPTIONS = literal_column(
+    "'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5'"
+)
+
+
+class HotelSearchService:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    def _search_stmt(self, tenant_id: UUID, query: str, entity_types: list[str], limit: int):
+        tsquery = func.to_tsquery(TEXT_SEARCH_CONFIG, query)
+        rank = func.ts_rank_cd(SearchDocument.document, tsquery)
+        # Rank every match inside the GIN-filtered set, then keep the top
+        # ``limit`` per entity type; headlines are only built for those rows.
+        ranked = (
+            select(
+                SearchDocument.entity_type,
+                SearchDocument.entity_id,
+                SearchDocument.title,
+                SearchDocument.body,
+                rank.label("rank"),
+                func.row_number()
+                .over(
+                    partition_by=SearchDocument.entity_type,
+                    order_by=(rank.desc(), SearchDocument.entity_id),
+                )
+                .label("position"),
+            )
+            .where(
+                SearchDocument.tenant_id == tenant_id,
+                SearchDocument.document.op("@@")(tsquery),
+                SearchDocument.entity_type.in_(entity_types),
+            )
+            .subquery()
+        )
+        headline = func.ts_headline(
+            TEXT_SEARCH_CONFIG,
+            ranked.c.title.concat(literal_column("' '")).concat(ranked.c.body),
+            tsquery,
+            HEADLINE_OPTIONS,
+        )
+        return (
+            select(
+                ranked.c.entity_type,
+                ranked.c.entity_id,
+                ranked.c.title,
+                ranked.c.rank,
+                headline.label("headline"),
+            )
+            .where(ranked.c.position <= limit)
+            .order_by(ranked.c.entity_type, ranked.c.position)
+        )
+
+    async def search(
+        self, tenant_id: UUID, text: str, entity_types: list[str], limit: int = 5
+    ) -> dict[str, list[dict]]:
+        """Return up to ``limit`` ranked hits per entity type from one query."""
+        results: dict[str, list[dict]] = {entity_type: [] for entity_type in entity_types}
+        query = prefix_query(text)
+        if query is None or not entity_types:
+            return results
+
+        rows = await self.session.execute(self._search_stmt(tenant_id, query, entity_types, limit))
+        for row in rows.all():
+            results[row.entity_type].append(
+                {
+                    "entity_id": row.entity_id,
+                    "title": row.title,
+                    "headline": row.headline,
+                    "rank": float(row.rank),
+                }
+            )
+        return results
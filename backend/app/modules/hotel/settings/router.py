@@ -12,6 +12,7 @@ from app.modules.hotel.settings.schemas import (
     Pagination,
 )
 from app.modules.hotel.settings.service import SettingsService
+from app.services.base import InvalidCursorError
 
 
 router = APIRouter()
@@ -25,16 +26,29 @@ router = APIRouter()
 async def list_settings(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> SettingListResponse:
     if current_user.tenant_id is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant context missing")
     service = SettingsService(session)
-    items, total = await service.list(current_user.tenant_id, page, limit)
+    try:
+        listing = await service.list(
+            current_user.tenant_id, page, limit, cursor=cursor, include_total=include_total
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return SettingListResponse(
-        items=[SettingOut.model_validate(item) for item in items],
-        pagination=Pagination(page=page, limit=limit, total=total),
+        items=[SettingOut.model_validate(item) for item in listing.items],
+        pagination=Pagination(
+            page=page,
+            limit=limit,
+            total=listing.total,
+            next_cursor=listing.next_cursor,
+            total_is_estimate=listing.total_is_estimate,
+        ),
     )
 
 
@@ -104,11 +118,9 @@ async def update_setting(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid setting id") from exc
 
-    setting = await service.get(current_user.tenant_id, setting_uuid)
-    if not setting:
+    updated = await service.update(current_user.tenant_id, setting_uuid, payload, updated_by=current_user.id)
+    if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Setting not found")
-
-    updated = await service.update(setting, payload, updated_by=current_user.id)
     return SettingOut.model_validate(updated)
 
 
@@ -0,0 +1,13 @@
+import asyncio
+
+from app.core.database import AsyncSessionLocal
+from app.services.report_rollups import ReportRollupService
+
+
+async def main() -> None:
+    async with AsyncSessionLocal() as session:
+        await ReportRollupService(session).rebuild()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
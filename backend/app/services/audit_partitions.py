@@ -0,0 +1,96 @@
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timezone
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+
+PARTITION_NAME = re.compile(r"^audit_logs_p(\d{4})(\d{2})$")
+
+PARTITIONS_STMT = text(
+    "SELECT child.relname FROM pg_inherits "
+    "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+    "WHERE pg_inherits.inhparent = 'audit_logs'::regclass"
+)
+
+
+@dataclass
+class AuditPartitionReport:
+    created: int = 0
+    archived: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_month(name: str) -> date | None:
+    match = PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def expired_partitions(names, now: datetime, retention_months: int) -> list[str]:
+    """Monthly partitions whose whole month falls before the retention window, oldest first."""
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(date(now.year, now.month, 1), -retention_months)
+    months = {name: partition_month(name) for name in names}
+    return sorted(
+        (name for name, month in months.items() if month is not None and month < cutoff),
+        key=months.get,
+    )
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class AuditPartitionService:
+    """Creates upcoming audit_logs partitions and archives expired ones.
+
+    Expired months are detached from audit_logs and moved to the archive schema
+    rather than deleted row by row, so retention costs a catalog update instead
+    of a bulk DELETE and the rows stay available to dump or drop later.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def run(self, now: datetime | None = None) -> AuditPartitionReport:
+        now = now or datetime.now(timezone.utc)
+        report = AuditPartitionReport()
+        await self.ensure_partitions(now, report)
+        await self.archive_expired(now, report)
+        return report
+
+    async def ensure_partitions(self, now: datetime, report: AuditPartitionReport) -> None:
+        first = date(now.year, now.month, 1)
+        last = add_months(first, max(settings.audit_log_partitions_ahead, 0))
+        stmt = text("SELECT audit_logs_ensure_partitions(:first, :last)").bindparams(
+            bindparam("first", first), bindparam("last", last)
+        )
+        report.created += int(await self.session.scalar(stmt) or 0)
+        await self.session.commit()
+
+    async def archive_expired(self, now: datetime, report: AuditPartitionReport) -> None:
+        names = (await self.session.execute(PARTITIONS_STMT)).scalars().all()
+        expired = expired_partitions(names, now, settings.audit_log_retention_months)
+        if not expired:
+            return
+        schema = quote_identifier(settings.audit_log_archive_schema)
+        await self.session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        for name in expired:
+            # Names come from the catalog and matched PARTITION_NAME above.
+            await self.session.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {name}"))
+            await self.session.execute(text(f"ALTER TABLE {name} SET SCHEMA {schema}"))
+            await self.session.commit()
+            report.archived.append(name)
@@ -1,4 +1,27 @@
-﻿import uuid
+﻿import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import DateTime, and_, func, insert, literal, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.explain import estimate_row_count
+
+
+# Stand-in for NULL in nullable sort keys so they can take part in row-value
+# keyset comparisons; sorts below every real timestamp, matching NULLS LAST on DESC.
+NULL_TIMESTAMP_FLOOR = literal(datetime(1, 1, 1, tzinfo=timezone.utc), DateTime(timezone=True))
+
+KEYSET_LABEL_PREFIX = "_keyset_"
+
+# Exact and estimated list totals, keyed by the caller's (list, tenant, filters) tuple.
+list_counts = TTLCache(settings.list_count_cache_seconds, settings.list_count_cache_size)
 
 
 class TenantContextMissingError(RuntimeError):
@@ -13,3 +36,324 @@ class BaseService:
         if not self.tenant_id:
             raise TenantContextMissingError("Tenant context missing")
         return self.tenant_id
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def violated_constraint(exc: IntegrityError) -> str | None:
+    """Name of the constraint or unique index behind an IntegrityError, if reported."""
+    # asyncpg errors carry it; SQLAlchemy's adapted DBAPI error chains the original.
+    for error in (exc.orig, getattr(exc.orig, "__cause__", None)):
+        name = getattr(error, "constraint_name", None)
+        if name:
+            return name
+    return None
+
+
+async def insert_returning(
+    session,
+    model,
+    values: dict[str, Any],
+    constraint_errors: dict[str, str] | None = None,
+):
+    """Insert one ``model`` row and return it as loaded by ``INSERT ... RETURNING``.
+
+    The returned entity carries server defaults (``created_at`` and so on), so
+    no refresh is needed. A violation of a constraint named in
+    ``constraint_errors`` rolls the session back and raises ``ValueError`` with
+    the mapped message instead of a separate existence check beforehand.
+    """
+    stmt = insert(model).values(**values).returning(model)
+    return await _scalar_mapping_constraints(session, stmt, constraint_errors)
+
+
+def changed_fields(payload, exclude: Iterable[str] = ()) -> dict[str, Any]:
+    """Fields of an update payload that carry a value; ``None`` means "leave unchanged"."""
+    skipped = set(exclude)
+    return {
+        name: getattr(payload, name)
+        for name in type(payload).model_fields
+        if name not in skipped and getattr(payload, name) is not None
+    }
+
+
+async def update_returning(
+    session,
+    model,
+    entity_id: uuid.UUID,
+    values: dict[str, Any],
+    *,
+    tenant_id: uuid.UUID | None = None,
+    constraint_errors: dict[str, str] | None = None,
+):
+    """Apply ``values`` to one row with ``UPDATE ... RETURNING`` and return it.
+
+    The row is matched by id and, when given, tenant, so a missing or foreign
+    row comes back as ``None`` without a separate lookup. Values may be SQL
+    expressions (``func.coalesce(...)``). With nothing to change the row is
+    only selected. Constraint violations map as in :func:`insert_returning`.
+    """
+    criteria = [model.id == entity_id]
+    if tenant_id is not None:
+        criteria.append(model.tenant_id == tenant_id)
+    if not values:
+        return await session.scalar(select(model).where(*criteria))
+    stmt = (
+        update(model)
+        .where(*criteria)
+        .values(**values)
+        .returning(model)
+        .execution_options(synchronize_session=False)
+    )
+    return await _scalar_mapping_constraints(session, stmt, constraint_errors)
+
+
+async def _scalar_mapping_constraints(session, stmt, constraint_errors: dict[str, str] | None):
+    try:
+        return await session.scalar(stmt, execution_options={"populate_existing": True})
+    except IntegrityError as exc:
+        message = (constraint_errors or {}).get(violated_constraint(exc))
+        if message is None:
+            raise
+        await session.rollback()
+        raise ValueError(message) from exc
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Serialize keyset values into an opaque, URL-safe cursor."""
+    encoded: list[Any] = []
+    for value in values:
+        if isinstance(value, datetime):
+            encoded.append({"dt": value.isoformat()})
+        elif isinstance(value, date):
+            encoded.append({"d": value.isoformat()})
+        elif isinstance(value, uuid.UUID):
+            encoded.append({"uuid": str(value)})
+        else:
+            encoded.append(value)
+    raw = json.dumps(encoded, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        encoded = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+    if not isinstance(encoded, list) or len(encoded) != size:
+        raise InvalidCursorError("Invalid cursor")
+
+    values: list[Any] = []
+    for value in encoded:
+        if not isinstance(value, dict):
+            values.append(value)
+            continue
+        try:
+            if "dt" in value:
+                values.append(datetime.fromisoformat(value["dt"]))
+            elif "d" in value:
+                values.append(date.fromisoformat(value["d"]))
+            elif "uuid" in value:
+                values.append(uuid.UUID(value["uuid"]))
+            else:
+                raise InvalidCursorError("Invalid cursor")
+        except (TypeError, ValueError) as exc:
+            raise InvalidCursorError("Invalid cursor") from exc
+    return values
+
+
+def apply_keyset(
+    stmt,
+    sort_keys: Sequence[Any],
+    *,
+    descending: bool,
+    cursor: str | None = None,
+    limit: int | None = None,
+):
+    """Order ``stmt`` by ``sort_keys`` and resume after ``cursor``.
+
+    The keys are also selected under ``_keyset_<n>`` labels so the caller can
+    build the next cursor from the last row with :func:`keyset_cursor`. When a
+    limit is given one extra row is fetched to detect whether a next page exists.
+    """
+    stmt = stmt.add_columns(
+        *[key.label(f"{KEYSET_LABEL_PREFIX}{index}") for index, key in enumerate(sort_keys)]
+    )
+    if cursor:
+        values = decode_cursor(cursor, len(sort_keys))
+        # The bound on the leading key is implied by the row comparison, but only
+        # a plain comparison lets the planner prune partitions (audit_logs by month).
+        if descending:
+            stmt = stmt.where(tuple_(*sort_keys) < tuple_(*values), sort_keys[0] <= values[0])
+        else:
+            stmt = stmt.where(tuple_(*sort_keys) > tuple_(*values), sort_keys[0] >= values[0])
+    stmt = stmt.order_by(*[key.desc() if descending else key.asc() for key in sort_keys])
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    return stmt
+
+
+def keyset_cursor(row, size: int) -> str:
+    return encode_cursor([getattr(row, f"{KEYSET_LABEL_PREFIX}{index}") for index in range(size)])
+
+
+def split_keyset_page(rows: Sequence[Any], limit: int | None, size: int) -> tuple[list[Any], str | None]:
+    """Trim the look-ahead row and return ``(page, next_cursor)``."""
+    rows = list(rows)
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, keyset_cursor(page[-1], size)
+
+
+async def fetch_keyset_page(
+    session,
+    stmt,
+    sort_keys: Sequence[Any],
+    *,
+    limit: int,
+    page: int = 1,
+    cursor: str | None = None,
+    descending: bool = True,
+) -> tuple[list[Any], str | None]:
+    """Fetch one page of ``stmt`` and return ``(items, next_cursor)``.
+
+    With a cursor the page starts right after the previous one through an
+    indexed row-value comparison, so deep pages cost the same as the first and
+    ``page`` is ignored. Without one, ``page`` still selects an OFFSET page for
+    existing clients. Single-entity selects come back as entities, wider
+    selects as tuples, mirroring ``scalars()`` and ``all()``.
+    """
+    stmt = apply_keyset(stmt, sort_keys, descending=descending, cursor=cursor, limit=limit)
+    if cursor is None and page > 1:
+        stmt = stmt.offset((page - 1) * limit)
+    result = await session.execute(stmt)
+    rows, next_cursor = split_keyset_page(result.all(), limit, len(sort_keys))
+    width = len(rows[0]) - len(sort_keys) if rows else 0
+    if width == 1:
+        return [row[0] for row in rows], next_cursor
+    return [tuple(row)[:width] for row in rows], next_cursor
+
+
+@dataclass
+class ListPage:
+    items: list[Any]
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
+
+
+async def paginate(
+    session,
+    stmt,
+    sort_keys: Sequence[Any],
+    *,
+    limit: int,
+    page: int = 1,
+    cursor: str | None = None,
+    descending: bool = True,
+    include_total: bool = True,
+    count_key: tuple | None = None,
+    filtered: bool = False,
+) -> ListPage:
+    """Fetch one page of ``stmt`` (see :func:`fetch_keyset_page`) with its total.
+
+    The total is skipped when ``include_total`` is false. Otherwise it comes
+    from the count cache under ``count_key``; then, for lists without search
+    filters, from the planner estimate once that is past
+    ``list_count_estimate_threshold``; and finally from ``count(*) OVER ()`` on
+    the page query itself. A cursor page's window would only count the rows
+    after the cursor, so there a separate count runs instead.
+    """
+    total: int | None = None
+    estimated = False
+    cached = None
+    if include_total and count_key is not None:
+        cached = list_counts.get(count_key)
+        if cached is not None:
+            total, estimated = cached
+    if include_total and total is None and not filtered:
+        estimate = await estimate_row_count(session, stmt)
+        if estimate >= settings.list_count_estimate_threshold:
+            total, estimated = estimate, True
+
+    window = include_total and total is None and cursor is None
+    page_stmt = stmt.add_columns(func.count().over().label("_total")) if window else stmt
+    items, next_cursor = await fetch_keyset_page(
+        session,
+        page_stmt,
+        sort_keys,
+        limit=limit,
+        page=page,
+        cursor=cursor,
+        descending=descending,
+    )
+    if window:
+        if items:
+            total = items[0][-1]
+            items = [row[0] if len(row) == 2 else row[:-1] for row in items]
+        elif page == 1:
+            total = 0
+
+    if include_total and total is None:
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+        total = await session.scalar(count_stmt)
+    if include_total and count_key is not None and cached is None:
+        list_counts.set(count_key, (int(total or 0), estimated))
+    return ListPage(
+        items=items,
+        total=int(total or 0) if include_total else None,
+        next_cursor=next_cursor,
+        total_is_estimate=estimated,
+    )
+
+
+@dataclass(frozen=True)
+class DateShard:
+    """Half-open ``[lower, upper)`` slice of a date column; the last slice closes its upper bound.
+
+    A shard with neither bound selects the rows whose date column is NULL.
+    """
+
+    lower: datetime | None
+    upper: datetime | None
+    inclusive_upper: bool = False
+
+    def clause(self, column):
+        if self.lower is None and self.upper is None:
+            return column.is_(None)
+        upper = column <= self.upper if self.inclusive_upper else column < self.upper
+        return and_(column >= self.lower, upper)
+
+
+def plan_date_shards(
+    lower: datetime,
+    upper: datetime,
+    count: int,
+    *,
+    descending: bool = False,
+    include_nulls: bool = False,
+) -> list[DateShard]:
+    """Split ``[lower, upper]`` into ``count`` equal-width shards in output order."""
+    count = max(count, 1)
+    if upper <= lower:
+        count = 1
+    step = (upper - lower) / count
+    shards = [
+        DateShard(
+            lower=lower + step * index,
+            upper=upper if index == count - 1 else lower + step * (index + 1),
+            inclusive_upper=index == count - 1,
+        )
+        for index in range(count)
+    ]
+    if descending:
+        shards.reverse()
+    if include_nulls:
+        # NULL dates sort below every timestamp (see NULL_TIMESTAMP_FLOOR).
+        null_shard = DateShard(lower=None, upper=None)
+        shards = shards + [null_shard] if descending else [null_shard] + shards
+    return shards
@@ -0,0 +1,133 @@
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.storage import ReportStorage
+from app.models.report_export import ReportExport
+
+
+@dataclass
+class ExportLifecycleReport:
+    expired: int = 0
+    evicted: int = 0
+    rows_deleted: int = 0
+    orphans_removed: int = 0
+    bytes_reclaimed: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class ExportLifecycleService:
+    """Expires, evicts and reconciles stored report export artifacts."""
+
+    def __init__(self, session: AsyncSession, storage: ReportStorage | None = None) -> None:
+        self.session = session
+        self.storage = storage or ReportStorage(settings.reports_storage_path)
+
+    async def run(self, now: datetime | None = None) -> ExportLifecycleReport:
+        now = now or datetime.now(timezone.utc)
+        report = ExportLifecycleReport()
+        await self.expire_stale(now, report)
+        await self.enforce_tenant_quotas(report)
+        await self.purge_rows(now, report)
+        await self.remove_orphans(now, report)
+        return report
+
+    async def expire_stale(self, now: datetime, report: ExportLifecycleReport) -> None:
+        cutoff = now - timedelta(hours=settings.report_export_ttl_hours)
+        stmt = select(ReportExport.id, ReportExport.file_path).where(
+            ReportExport.status == "completed", ReportExport.completed_at < cutoff
+        )
+        rows = (await self.session.execute(stmt)).all()
+        report.expired += len(rows)
+        report.bytes_reclaimed += await self._expire(rows)
+
+    async def enforce_tenant_quotas(self, report: ExportLifecycleReport) -> None:
+        quota = settings.report_export_tenant_quota_bytes
+        if quota <= 0:
+            return
+        usage_stmt = (
+            select(ReportExport.tenant_id, func.sum(ReportExport.file_size))
+            .where(ReportExport.status == "completed", ReportExport.tenant_id.is_not(None))
+            .group_by(ReportExport.tenant_id)
+            .having(func.sum(ReportExport.file_size) > quota)
+        )
+        for tenant_id, used in (await self.session.execute(usage_stmt)).all():
+            candidates_stmt = (
+                select(ReportExport.id, ReportExport.file_path, ReportExport.file_size)
+                .where(ReportExport.tenant_id == tenant_id, ReportExport.status == "completed")
+                .order_by(ReportExport.completed_at.asc())
+            )
+            victims = []
+            for row in (await self.session.execute(candidates_stmt)).all():
+                if used <= quota:
+                    break
+                victims.append(row)
+                used -= row.file_size or 0
+            report.evicted += len(victims)
+            report.bytes_reclaimed += await self._expire(victims)
+
+    async def purge_rows(self, now: datetime, report: ExportLifecycleReport) -> None:
+        cutoff = now - timedelta(days=settings.report_export_row_retention_days)
+        stmt = (
+            delete(ReportExport)
+            .where(
+                ReportExport.status.in_(("completed", "failed", "expired")),
+                func.coalesce(ReportExport.completed_at, ReportExport.created_at) < cutoff,
+            )
+            .returning(ReportExport.file_path)
+        )
+        file_paths = (await self.session.execute(stmt)).scalars().all()
+        await self.session.commit()
+        report.rows_deleted += len(file_paths)
+        for file_path in file_paths:
+            if file_path:
+                report.bytes_reclaimed += self.storage.remove_artifact(file_path)
+
+    async def remove_orphans(self, now: datetime, report: ExportLifecycleReport) -> None:
+        """Delete files no export row points at, once they are older than the grace period.
+
+        The grace period covers files the worker has written but not yet recorded.
+        Bundles are removed once sent and the parts of running exports by the
+        worker, so neither is swept; only parts left behind by exports that are no
+        longer running are.
+        """
+        referenced_stmt = select(ReportExport.file_path).where(ReportExport.file_path.is_not(None))
+        referenced = {
+            os.path.abspath(path) for path in (await self.session.execute(referenced_stmt)).scalars()
+        }
+        running_stmt = select(ReportExport.id).where(ReportExport.status.in_(("pending", "processing")))
+        running = {str(export_id) for export_id in (await self.session.execute(running_stmt)).scalars()}
+        bundles_dir = self.storage.base_path / "bundles"
+        parts_dir = self.storage.base_path / "parts"
+        cutoff = (now - timedelta(minutes=settings.report_export_orphan_grace_minutes)).timestamp()
+        for path in list(self.storage.iter_files()):
+            if os.path.abspath(path) in referenced or path.is_relative_to(bundles_dir):
+                continue
+            if path.is_relative_to(parts_dir) and path.relative_to(parts_dir).parts[0] in running:
+                continue
+            try:
+                if path.stat().st_mtime >= cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            report.orphans_removed += 1
+            report.bytes_reclaimed += self.storage.remove_artifact(str(path))
+
+    async def _expire(self, rows) -> int:
+        if not rows:
+            return 0
+        stmt = (
+            update(ReportExport)
+            .where(ReportExport.id.in_([row.id for row in rows]))
+            .values(status="expired", file_path=None)
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+        # Files go only after the rows stop pointing at them.
+        return sum(self.storage.remove_artifact(row.file_path) for row in rows if row.file_path)
@@ -0,0 +1,210 @@
+"""Tenant-scoped text search.
+
+Per-module lists use trigram substring search: each searchable table has a GIN
+``gin_trgm_ops`` index on a concatenated document expression (migration 0029).
+Queries must build that expression with :func:`search_document` so it matches
+the index exactly; separators are rendered inline because a bind parameter
+would hide the match from the planner.
+
+The cross-module search reads ``search_documents`` instead, one weighted
+``tsvector`` per record (migration 0030). Services call :func:`index_document`
+and :func:`remove_document` in the same transaction as their own writes.
+"""
+import re
+
+from sqlalchemy import String, delete, func, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.guest import Guest
+from app.models.helpdesk_ticket import HelpdeskTicket
+from app.models.incident import Incident
+from app.models.room import Room
+from app.models.search_document import SearchDocument
+
+
+# pg_trgm cannot narrow a pattern shorter than one trigram; such searches still
+# work but fall back to scanning the tenant's rows.
+MIN_TRIGRAM_TERM_LENGTH = 3
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_document(*columns):
+    empty = literal_column("''", String)
+    separator = literal_column("' '", String)
+    document = func.coalesce(columns[0], empty)
+    for column in columns[1:]:
+        document = document.concat(separator).concat(func.coalesce(column, empty))
+    return document
+
+
+def contains_term(document, term: str):
+    """Case-insensitive substring match the trigram index can answer."""
+    return document.ilike(f"%{escape_like(term.strip())}%")
+
+
+def trigram_match(document, term: str):
+    """Return ``(condition, rank)`` for a ranked substring search.
+
+    The rank is the best word similarity between the term and any part of the
+    document, so whole-word hits sort above matches buried inside a word.
+    """
+    return contains_term(document, term), func.word_similarity(term.strip(), document)
+
+
+def ranked_search(stmt, document, term: str, sort_keys):
+    """Filter ``stmt`` to ``term`` and put its rank ahead of ``sort_keys``.
+
+    The rank is a keyset column like any other, so cursors keep working and
+    tie-break on the list's usual order.
+    """
+    condition, rank = trigram_match(document, term)
+    return stmt.where(condition), (rank, *sort_keys)
+
+
+GUEST_DOCUMENT = search_document(Guest.first_name, Guest.last_name, Guest.email)
+ROOM_DOCUMENT = search_document(Room.number, Room.room_type)
+INCIDENT_DOCUMENT = search_document(Incident.title, Incident.description)
+
+
+# 'simple' skips stemming and stop words, which suits names, emails and room
+# numbers; the backfill in migration 0030 uses the same configuration.
+TEXT_SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+SEARCH_ENTITY_TYPES = {
+    Guest: "guests",
+    Room: "rooms",
+    Incident: "incidents",
+    HelpdeskTicket: "helpdesk",
+}
+
+_QUERY_TOKEN = re.compile(r"[\w@.+-]+")
+
+
+def _join(*parts: str | None) -> str:
+    # Mirrors concat_ws(' ', ...) in the migration backfill.
+    return " ".join(part for part in parts if part)
+
+
+def document_text(entity) -> tuple[str, str]:
+    """Return the ``(title, body)`` indexed for ``entity``."""
+    if isinstance(entity, Guest):
+        return _join(entity.first_name, entity.last_name), _join(entity.email, entity.phone)
+    if isinstance(entity, Room):
+        return entity.number, _join(entity.room_type, entity.floor, entity.description)
+    if isinstance(entity, Incident):
+        return entity.title, _join(entity.category, entity.description)
+    if isinstance(entity, HelpdeskTicket):
+        body = _join(entity.requester_name, entity.requester_email, entity.description)
+        return entity.subject, body
+    raise TypeError(f"{type(entity).__name__} is not searchable")
+
+
+def document_vector(title, body):
+    """Weighted ``tsvector``: title terms rank above body terms."""
+    return func.setweight(
+        func.to_tsvector(TEXT_SEARCH_CONFIG, title), literal_column("'A'")
+    ).concat(func.setweight(func.to_tsvector(TEXT_SEARCH_CONFIG, body), literal_column("'B'")))
+
+
+async def index_document(session, entity) -> None:
+    """Insert or refresh the search document for ``entity``.
+
+    The entity must have been flushed so its id is set. Records without a
+    tenant (platform helpdesk tickets) are not searchable and are removed.
+    """
+    if entity.tenant_id is None:
+        await remove_document(session, entity)
+        return
+    title, body = document_text(entity)
+    stmt = insert(SearchDocument).values(
+        entity_type=SEARCH_ENTITY_TYPES[type(entity)],
+        entity_id=entity.id,
+        tenant_id=entity.tenant_id,
+        title=title,
+        body=body,
+        document=document_vector(title, body),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SearchDocument.entity_type, SearchDocument.entity_id],
+        set_={
+            "tenant_id": stmt.excluded.tenant_id,
+            "title": stmt.excluded.title,
+            "body": stmt.excluded.body,
+            "document": stmt.excluded.document,
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+
+
+# SQL mirror of document_text() for set-based indexing; concat_ws matches the
+# migration 0030 backfill.
+DOCUMENT_COLUMNS = {
+    Guest: (
+        func.concat_ws(" ", Guest.first_name, Guest.last_name),
+        func.concat_ws(" ", Guest.email, Guest.phone),
+    ),
+    Room: (Room.number, func.concat_ws(" ", Room.room_type, Room.floor, Room.description)),
+    Incident: (Incident.title, func.concat_ws(" ", Incident.category, Incident.description)),
+    HelpdeskTicket: (
+        HelpdeskTicket.subject,
+        func.concat_ws(
+            " ",
+            HelpdeskTicket.requester_name,
+            HelpdeskTicket.requester_email,
+            HelpdeskTicket.description,
+        ),
+    ),
+}
+
+
+async def index_documents(session, model, ids) -> None:
+    """Index or refresh every ``model`` row whose id ``ids`` (a subquery) selects.
+
+    One statement for bulk writes, which never hold the rows as entities.
+    """
+    title, body = DOCUMENT_COLUMNS[model]
+    rows = select(
+        literal(SEARCH_ENTITY_TYPES[model]),
+        model.id,
+        model.tenant_id,
+        title,
+        body,
+        document_vector(title, body),
+    ).where(model.id.in_(ids), model.tenant_id.is_not(None))
+    columns = ["entity_type", "entity_id", "tenant_id", "title", "body", "document"]
+    stmt = insert(SearchDocument).from_select(columns, rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SearchDocument.entity_type, SearchDocument.entity_id],
+        set_={
+            "title": stmt.excluded.title,
+            "body": stmt.excluded.body,
+            "document": stmt.excluded.document,
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+
+
+async def remove_document(session, entity) -> None:
+    await session.execute(
+        delete(SearchDocument).where(
+            SearchDocument.entity_type == SEARCH_ENTITY_TYPES[type(entity)],
+            SearchDocument.entity_id == entity.id,
+        )
+    )
+
+
+def prefix_query(text: str) -> str | None:
+    """Turn free text into a ``to_tsquery`` string matching every word as a prefix.
+
+    Returns None when the text has nothing searchable. Tokens are quoted, so
+    tsquery operators typed by the user are matched literally.
+    """
+    tokens = [token.strip(".+-") for token in _QUERY_TOKEN.findall(text.lower())]
+    terms = [f"'{token}':*" for token in tokens if token]
+    return " & ".join(terms) or None
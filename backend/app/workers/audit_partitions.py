@@ -0,0 +1,39 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.services.audit_partitions import AuditPartitionService
+
+logger = logging.getLogger(__name__)
+
+_partition_task: asyncio.Task | None = None
+
+
+def start_audit_partition_worker() -> None:
+    global _partition_task
+    if _partition_task and not _partition_task.done():
+        return
+    _partition_task = asyncio.create_task(_partition_loop())
+
+
+async def stop_audit_partition_worker() -> None:
+    global _partition_task
+    if _partition_task:
+        _partition_task.cancel()
+        try:
+            await _partition_task
+        except asyncio.CancelledError:
+            pass
+        _partition_task = None
+
+
+async def _partition_loop() -> None:
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                report = await AuditPartitionService(session).run()
+            logger.info("Audit log partition maintenance: %s", report.as_dict())
+        except Exception:  # pragma: no cover
+            logger.exception("Audit log partition maintenance failed")
+        await asyncio.sleep(max(settings.audit_log_maintenance_interval_seconds, 60))
@@ -0,0 +1,12 @@
+from app.core.config import settings
+from app.modules.audit.writer import audit_writer
+
+
+def start_audit_writer() -> None:
+    if settings.audit_writer_enabled:
+        audit_writer.start()
+
+
+async def stop_audit_writer() -> None:
+    # Drains the queue, so it runs after the other workers have stopped emitting events.
+    await audit_writer.stop()
@@ -0,0 +1,65 @@
+import asyncio
+import json
+import logging
+
+from app.core.config import settings
+from app.core.database import listen_engine
+from app.core.events import EXPORT_EVENTS_CHANNEL, export_events
+
+logger = logging.getLogger(__name__)
+
+_listener_task: asyncio.Task | None = None
+
+
+def start_export_event_listener() -> None:
+    global _listener_task
+    if _listener_task and not _listener_task.done():
+        return
+    _listener_task = asyncio.create_task(_listener_loop())
+
+
+async def stop_export_event_listener() -> None:
+    global _listener_task
+    if _listener_task:
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+        _listener_task = None
+
+
+async def _listener_loop() -> None:
+    # LISTEN on a dedicated connection so events from any process's export worker
+    # reach the SSE subscribers connected to this one.
+    while True:
+        try:
+            await _listen_until_lost()
+        except Exception:  # pragma: no cover
+            logger.exception("Export event listener failed")
+        await asyncio.sleep(max(settings.export_events_reconnect_seconds, 1))
+
+
+async def _listen_until_lost() -> None:
+    async with listen_engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        lost = asyncio.Event()
+        driver_connection.add_termination_listener(lambda _connection: lost.set())
+        await driver_connection.add_listener(EXPORT_EVENTS_CHANNEL, _on_notify)
+        try:
+            await lost.wait()
+        finally:
+            if not driver_connection.is_closed():
+                await driver_connection.remove_listener(EXPORT_EVENTS_CHANNEL, _on_notify)
+
+
+def _on_notify(_connection, _pid: int, _channel: str, payload: str) -> None:
+    try:
+        event = json.loads(payload)
+    except ValueError:
+        logger.warning("Ignoring malformed export event payload")
+        return
+    requested_by = event.get("requested_by")
+    if requested_by:
+        export_events.publish(requested_by, event)
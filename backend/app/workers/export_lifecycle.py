@@ -0,0 +1,39 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.services.export_lifecycle import ExportLifecycleService
+
+logger = logging.getLogger(__name__)
+
+_lifecycle_task: asyncio.Task | None = None
+
+
+def start_export_lifecycle_worker() -> None:
+    global _lifecycle_task
+    if _lifecycle_task and not _lifecycle_task.done():
+        return
+    _lifecycle_task = asyncio.create_task(_lifecycle_loop())
+
+
+async def stop_export_lifecycle_worker() -> None:
+    global _lifecycle_task
+    if _lifecycle_task:
+        _lifecycle_task.cancel()
+        try:
+            await _lifecycle_task
+        except asyncio.CancelledError:
+            pass
+        _lifecycle_task = None
+
+
+async def _lifecycle_loop() -> None:
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                report = await ExportLifecycleService(session).run()
+            logger.info("Report export lifecycle run: %s", report.as_dict())
+        except Exception:  # pragma: no cover
+            logger.exception("Report export lifecycle iteration failed")
+        await asyncio.sleep(max(settings.report_export_cleanup_interval_seconds, 60))
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.guest_import import GuestImport
+from app.modules.hotel.guests.service import GuestImportService
+
+logger = logging.getLogger(__name__)
+
+_worker_task: asyncio.Task | None = None
+
+
+def start_guest_import_worker() -> None:
+    global _worker_task
+    if _worker_task and not _worker_task.done():
+        return
+    _worker_task = asyncio.create_task(_worker_loop())
+
+
+async def stop_guest_import_worker() -> None:
+    global _worker_task
+    if _worker_task:
+        _worker_task.cancel()
+        try:
+            await _worker_task
+        except asyncio.CancelledError:
+            pass
+        _worker_task = None
+
+
+async def _worker_loop() -> None:
+    while True:
+        try:
+            await _process_pending_imports()
+        except Exception:  # pragma: no cover
+            logger.exception("Guest import worker iteration failed")
+        await asyncio.sleep(max(settings.guest_import_poll_seconds, 1))
+
+
+async def _process_pending_imports() -> None:
+    async with AsyncSessionLocal() as session:
+        stmt = (
+            select(GuestImport.id)
+            .where(GuestImport.status == "pending")
+            .order_by(GuestImport.created_at.asc())
+        )
+        pending = (await session.execute(stmt)).scalars().all()
+
+    for import_id in pending:
+        await _process_one_import(import_id)
+
+
+async def _process_one_import(import_id) -> None:
+    async with AsyncSessionLocal() as session:
+        # Claim the job so a second worker process skips it.
+        claimed = await session.scalar(
+            update(GuestImport)
+            .where(GuestImport.id == import_id, GuestImport.status == "pending")
+            .values(status="processing", error_message=None)
+            .returning(GuestImport.id)
+        )
+        await session.commit()
+    if claimed is None:
+        return
+
+    async with AsyncSessionLocal() as session:
+        job = await session.get(GuestImport, import_id)
+        if not job:
+            return
+        try:
+            await GuestImportService(session).run(job)
+        except Exception as exc:
+            logger.exception("Guest import %s failed", import_id)
+            await session.rollback()
+            # Batches committed before the failure stay imported and counted.
+            await session.execute(
+                update(GuestImport)
+                .where(GuestImport.id == import_id)
+                .values(
+                    status="failed",
+                    error_message=str(exc)[:500],
+                    completed_at=datetime.now(timezone.utc),
+                )
+            )
+            await session.commit()
@@ -0,0 +1,42 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.database import engine, replica_engine
+from app.core.pool import check_pool_liveness
+
+logger = logging.getLogger(__name__)
+
+_liveness_task: asyncio.Task | None = None
+
+
+def start_pool_liveness_worker() -> None:
+    global _liveness_task
+    if settings.database_pool_liveness_seconds <= 0:
+        return
+    if _liveness_task and not _liveness_task.done():
+        return
+    _liveness_task = asyncio.create_task(_liveness_loop())
+
+
+async def stop_pool_liveness_worker() -> None:
+    global _liveness_task
+    if _liveness_task:
+        _liveness_task.cancel()
+        try:
+            await _liveness_task
+        except asyncio.CancelledError:
+            pass
+        _liveness_task = None
+
+
+async def _liveness_loop() -> None:
+    while True:
+        await asyncio.sleep(settings.database_pool_liveness_seconds)
+        for checked in (engine, replica_engine):
+            if checked is None:
+                continue
+            try:
+                await check_pool_liveness(checked)
+            except Exception:  # pragma: no cover
+                logger.exception("Database pool liveness check failed")
@@ -1,20 +1,34 @@
 import asyncio
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from functools import partial
+from typing import Any, AsyncIterator
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 
 from app.core.config import settings
-from app.core.database import AsyncSessionLocal
+from app.core.database import AsyncReadSessionLocal, AsyncSessionLocal
+from app.core.events import notify_export_event
 from app.core.storage import ReportStorage
 from app.models.report_export import ReportExport
-from app.modules.admin.reports.service import ReportService
-from app.modules.hotel.reports.service import HotelReportService
+from app.modules.admin.reports.service import (
+    REPORT_COLUMNS as ADMIN_REPORT_COLUMNS,
+    REPORT_DEFINITIONS as ADMIN_REPORT_DEFINITIONS,
+    ReportService,
+)
+from app.modules.hotel.reports.service import REPORT_COLUMNS, REPORT_DEFINITIONS, HotelReportService
+from app.services.base import DateShard
 
 logger = logging.getLogger(__name__)
 
+# Formats whose shards can be rendered independently and concatenated byte-wise.
+PART_FORMATS = {"csv", "ndjson"}
+
 _worker_task: asyncio.Task | None = None
+_render_pool: ProcessPoolExecutor | None = None
 
 
 def start_report_export_worker() -> None:
@@ -25,7 +39,7 @@ def start_report_export_worker() -> None:
 
 
 async def stop_report_export_worker() -> None:
-    global _worker_task
+    global _worker_task, _render_pool
     if _worker_task:
         _worker_task.cancel()
         try:
@@ -33,6 +47,20 @@ async def stop_report_export_worker() -> None:
         except asyncio.CancelledError:
             pass
         _worker_task = None
+    if _render_pool:
+        _render_pool.shutdown(wait=False, cancel_futures=True)
+        _render_pool = None
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    global _render_pool
+    if _render_pool is None:
+        # Spawned (not forked) so children do not inherit the event loop or DB connections.
+        _render_pool = ProcessPoolExecutor(
+            max_workers=max(settings.report_export_processes, 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _render_pool
 
 
 async def _worker_loop() -> None:
@@ -60,8 +88,6 @@ async def _process_pending_exports() -> None:
 
 
 async def _process_one_export(export_id) -> None:
-    storage = ReportStorage(settings.reports_storage_path)
-
     async with AsyncSessionLocal() as session:
         export = await session.get(ReportExport, export_id)
         if not export or export.status != "pending":
@@ -70,52 +96,86 @@ async def _process_one_export(export_id) -> None:
         export.status = "processing"
         export.error_message = None
         session.add(export)
+        await notify_export_event(session, export)
         await session.commit()
 
-    async with AsyncSessionLocal() as session:
+    # Report queries run on the read replica (if configured); the export row and its
+    # progress updates stay on the primary.
+    async with AsyncSessionLocal() as session, AsyncReadSessionLocal() as read_session:
         export = await session.get(ReportExport, export_id)
         if not export:
             return
 
         try:
+            root = ReportStorage(settings.reports_storage_path)
+            storage = ReportStorage(
+                root.partition_path(export.tenant_id, export.created_at),
+                compress=settings.report_export_compress,
+            )
             filters = export.filters or {}
             date_from = _parse_datetime(filters.get("date_from"))
             date_to = _parse_datetime(filters.get("date_to"))
             status_filter = _clean_status(filters.get("status"))
 
+            rows = None
             if export.scope == "hotel":
                 if export.tenant_id is None:
                     raise ValueError("Hotel export requires tenant context")
-                report_service = HotelReportService(session)
-                report = await report_service.get_report(
-                    tenant_id=export.tenant_id,
-                    report_code=export.report_code,
-                    date_from=date_from,
-                    date_to=date_to,
-                    status=status_filter,
+                report_service = HotelReportService(read_session)
+                estimated_rows = await report_service.estimate_report_rows(
+                    export.tenant_id, export.report_code, date_from, date_to, status_filter
                 )
-            elif export.scope == "admin":
-                report_service = ReportService(session)
-                report = await report_service.get_report(
-                    report_code=export.report_code,
-                    date_from=date_from,
-                    date_to=date_to,
-                    status=status_filter,
+                export.rows_total = estimated_rows
+                await _update_export(export_id, rows_total=estimated_rows, rows_processed=0)
+                shards = await _plan_shards(
+                    report_service,
+                    export.tenant_id,
+                    export.report_code,
+                    estimated_rows,
+                    date_from,
+                    date_to,
+                    status_filter,
                 )
+                if shards:
+                    file_path, file_name, export.rows_processed = await _render_sharded_export(
+                        storage, export, shards, date_from, date_to, status_filter
+                    )
+                    export.shards_total = export.shards_completed = len(shards)
+                else:
+                    columns = REPORT_COLUMNS[export.report_code]
+                    title = REPORT_DEFINITIONS[export.report_code].title
+                    rows = report_service.stream_report_rows(
+                        export.tenant_id, export.report_code, date_from, date_to, status_filter
+                    )
+            elif export.scope == "admin":
+                if export.report_code not in ADMIN_REPORT_DEFINITIONS:
+                    raise ValueError("Unknown report")
+                report_service = ReportService(read_session)
+                columns = ADMIN_REPORT_COLUMNS[export.report_code]
+                title = ADMIN_REPORT_DEFINITIONS[export.report_code].title
+                rows = _no_rows()
+                if columns:
+                    estimated_rows = await report_service.estimate_report_rows(
+                        export.report_code, date_from, date_to, status_filter
+                    )
+                    export.rows_total = estimated_rows
+                    await _update_export(export_id, rows_total=estimated_rows, rows_processed=0)
+                    rows = report_service.stream_report_rows(
+                        export.report_code, date_from, date_to, status_filter
+                    )
             else:
                 raise ValueError("Unsupported report scope")
 
-            file_path, file_name = storage.save_export(
-                report_code=export.report_code,
-                export_format=export.export_format,
-                columns=report.get("columns", []),
-                rows=report.get("rows", []),
-                title=report.get("title"),
-            )
+            if rows is not None:
+                file_path, file_name, export.rows_processed = await _render_streamed_export(
+                    storage, export, columns, title, rows
+                )
 
             export.status = "completed"
             export.file_path = file_path
             export.file_name = file_name
+            # Hashing a large artifact would otherwise stall every other request.
+            export.file_size, export.file_sha256 = await asyncio.to_thread(storage.file_digest, file_path)
             export.completed_at = datetime.now(timezone.utc)
             export.error_message = None
         except Exception as exc:  # pragma: no cover
@@ -125,6 +185,237 @@ async def _process_one_export(export_id) -> None:
             logger.exception("Report export %s failed", export_id)
 
         session.add(export)
+        await notify_export_event(session, export)
+        await session.commit()
+
+
+async def _no_rows() -> AsyncIterator[dict[str, Any]]:
+    return
+    yield
+
+
+async def _render_streamed_export(
+    storage: ReportStorage,
+    export: ReportExport,
+    columns: list[dict[str, str]],
+    title: str,
+    rows: AsyncIterator[dict[str, Any]],
+) -> tuple[str, str, int]:
+    """Render an unsharded export from a row stream, reporting progress per batch.
+
+    CSV/NDJSON batches are rendered to part files as they arrive and merged at the
+    end, and Parquet batches are appended to an open file as row groups fill.
+    Excel and PDF are laid out from every row at once, so progress there tracks
+    the fetch. Returns ``(file_path, file_name, row_count)``.
+    """
+    export_id = export.id
+    as_parts = export.export_format in PART_FORMATS
+    parquet = None
+    if export.export_format == "parquet":
+        parquet = storage.open_parquet(export.report_code, columns)
+    batch_size = max(settings.report_export_progress_rows, 1)
+    part_paths: list[str] = []
+    collected: list[dict[str, Any]] = []
+    batch: list[dict[str, Any]] = []
+    processed = 0
+
+    async def flush() -> None:
+        nonlocal processed
+        if as_parts:
+            part_path = storage.part_path(str(export_id), export.export_format, len(part_paths))
+            part_paths.append(
+                storage.save_part(
+                    part_path, export.export_format, columns, batch, include_header=not part_paths
+                )
+            )
+        elif parquet is not None:
+            parquet.write(batch)
+        else:
+            collected.extend(batch)
+        processed += len(batch)
+        batch.clear()
+        await _update_export(export_id, rows_processed=processed)
+
+    try:
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                await flush()
+        # An empty CSV still gets its header part.
+        if batch or (as_parts and not part_paths):
+            await flush()
+    except Exception:
+        storage.discard_parts(str(export_id))
+        if parquet is not None:
+            parquet.discard()
+        raise
+
+    if as_parts:
+        file_path, file_name = storage.merge_parts(export.report_code, export.export_format, part_paths)
+    elif parquet is not None:
+        file_path, file_name = parquet.close()
+    else:
+        file_path, file_name = storage.save_export(
+            export.report_code, export.export_format, columns, collected, title=title
+        )
+    return file_path, file_name, processed
+
+
+async def _plan_shards(
+    report_service: HotelReportService,
+    tenant_id: UUID,
+    report_code: str,
+    estimated_rows: int,
+    date_from: datetime | None,
+    date_to: datetime | None,
+    status_filter: str | None,
+) -> list[DateShard]:
+    if settings.report_export_shard_count <= 1:
+        return []
+    if estimated_rows < settings.report_export_shard_min_rows:
+        return []
+    return await report_service.plan_export_shards(
+        tenant_id,
+        report_code,
+        settings.report_export_shard_count,
+        date_from=date_from,
+        date_to=date_to,
+        status=status_filter,
+    )
+
+
+async def _render_sharded_export(
+    storage: ReportStorage,
+    export: ReportExport,
+    shards: list[DateShard],
+    date_from: datetime | None,
+    date_to: datetime | None,
+    status_filter: str | None,
+) -> tuple[str, str, int]:
+    """Fetch date-range shards concurrently and render them in the process pool.
+
+    CSV/NDJSON shards are rendered to part files and concatenated; other formats
+    cannot be merged byte-wise, so their shards are fetched in parallel and
+    rendered as one file. Returns ``(file_path, file_name, row_count)``.
+    """
+    export_id = export.id
+    report_code = export.report_code
+    export_format = export.export_format
+    columns = REPORT_COLUMNS[report_code]
+    await _update_export(export_id, shards_total=len(shards), shards_completed=0)
+
+    loop = asyncio.get_running_loop()
+    pool = _get_render_pool()
+    # Bounds both open DB sessions and shard rows held in memory.
+    semaphore = asyncio.Semaphore(max(settings.report_export_processes, 1))
+
+    async def fetch_shard(shard: DateShard) -> list[dict[str, Any]]:
+        async with AsyncReadSessionLocal() as session:
+            return await HotelReportService(session).get_shard_rows(
+                export.tenant_id, report_code, shard, date_from, date_to, status_filter
+            )
+
+    async def render_part(index: int, shard: DateShard) -> tuple[str, int]:
+        async with semaphore:
+            rows = await fetch_shard(shard)
+            part_path = storage.part_path(str(export_id), export_format, index)
+            await loop.run_in_executor(
+                pool,
+                partial(
+                    _render_part,
+                    str(storage.base_path),
+                    storage.compress,
+                    part_path,
+                    export_format,
+                    columns,
+                    rows,
+                    index == 0,
+                ),
+            )
+        await _record_shard_done(export_id, len(rows))
+        return part_path, len(rows)
+
+    async def fetch_counted(shard: DateShard) -> list[dict[str, Any]]:
+        async with semaphore:
+            rows = await fetch_shard(shard)
+        await _record_shard_done(export_id, len(rows))
+        return rows
+
+    if export_format in PART_FORMATS:
+        try:
+            parts = await asyncio.gather(
+                *[render_part(index, shard) for index, shard in enumerate(shards)]
+            )
+        except Exception:
+            storage.discard_parts(str(export_id))
+            raise
+        file_path, file_name = storage.merge_parts(report_code, export_format, [path for path, _ in parts])
+        return file_path, file_name, sum(count for _, count in parts)
+
+    shard_rows = await asyncio.gather(*[fetch_counted(shard) for shard in shards])
+    rows = [row for chunk in shard_rows for row in chunk]
+    file_path, file_name = await loop.run_in_executor(
+        pool,
+        partial(
+            _render_export,
+            str(storage.base_path),
+            storage.compress,
+            report_code,
+            export_format,
+            columns,
+            rows,
+            REPORT_DEFINITIONS[report_code].title,
+        ),
+    )
+    return file_path, file_name, len(rows)
+
+
+def _render_part(
+    base_path: str,
+    compress: bool,
+    part_path: str,
+    export_format: str,
+    columns: list[dict[str, str]],
+    rows: list[dict[str, Any]],
+    include_header: bool,
+) -> str:
+    storage = ReportStorage(base_path, compress=compress)
+    return storage.save_part(part_path, export_format, columns, rows, include_header=include_header)
+
+
+def _render_export(
+    base_path: str,
+    compress: bool,
+    report_code: str,
+    export_format: str,
+    columns: list[dict[str, str]],
+    rows: list[dict[str, Any]],
+    title: str,
+) -> tuple[str, str]:
+    storage = ReportStorage(base_path, compress=compress)
+    return storage.save_export(report_code, export_format, columns, rows, title=title)
+
+
+async def _record_shard_done(export_id: UUID, row_count: int) -> None:
+    await _update_export(
+        export_id,
+        shards_completed=ReportExport.shards_completed + 1,
+        rows_processed=func.coalesce(ReportExport.rows_processed, 0) + row_count,
+    )
+
+
+async def _update_export(export_id: UUID, **values: Any) -> None:
+    """Apply a progress update in its own transaction and notify subscribers."""
+    async with AsyncSessionLocal() as session:
+        stmt = (
+            update(ReportExport)
+            .where(ReportExport.id == export_id)
+            .values(**values)
+            .returning(ReportExport)
+        )
+        export = await session.scalar(stmt)
+        if export is not None:
+            await notify_export_event(session, export)
         await session.commit()
 
 
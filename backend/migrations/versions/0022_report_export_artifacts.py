@@ -0,0 +1,24 @@
+"""Record size and digest of stored report export artifacts
+
+Revision ID: 0022_report_export_artifacts
+Revises: 0021_backfill_refresh_token_families
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0022_report_export_artifacts"
+down_revision = "0021_backfill_refresh_token_families"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("report_exports", sa.Column("file_size", sa.BigInteger(), nullable=True))
+    op.add_column("report_exports", sa.Column("file_sha256", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("report_exports", "file_sha256")
+    op.drop_column("report_exports", "file_size")
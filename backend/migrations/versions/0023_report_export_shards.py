@@ -0,0 +1,24 @@
+"""Track shard progress of parallel report exports
+
+Revision ID: 0023_report_export_shards
+Revises: 0022_report_export_artifacts
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0023_report_export_shards"
+down_revision = "0022_report_export_artifacts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("report_exports", sa.Column("shards_total", sa.Integer(), nullable=True))
+    op.add_column("report_exports", sa.Column("shards_completed", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("report_exports", "shards_completed")
+    op.drop_column("report_exports", "shards_total")
@@ -0,0 +1,24 @@
+"""Track row progress of report exports
+
+Revision ID: 0024_report_export_progress
+Revises: 0023_report_export_shards
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0024_report_export_progress"
+down_revision = "0023_report_export_shards"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("report_exports", sa.Column("rows_total", sa.BigInteger(), nullable=True))
+    op.add_column("report_exports", sa.Column("rows_processed", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("report_exports", "rows_processed")
+    op.drop_column("report_exports", "rows_total")
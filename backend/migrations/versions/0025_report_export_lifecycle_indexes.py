@@ -0,0 +1,29 @@
+"""Index report exports for lifecycle sweeps
+
+Revision ID: 0025_report_export_lifecycle_indexes
+Revises: 0024_report_export_progress
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "0025_report_export_lifecycle_indexes"
+down_revision = "0024_report_export_progress"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_report_exports_status_completed_at", "report_exports", ["status", "completed_at"]
+    )
+    op.create_index(
+        "ix_report_exports_tenant_status_completed_at",
+        "report_exports",
+        ["tenant_id", "status", "completed_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_report_exports_tenant_status_completed_at", table_name="report_exports")
+    op.drop_index("ix_report_exports_status_completed_at", table_name="report_exports")
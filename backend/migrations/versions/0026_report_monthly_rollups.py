@@ -0,0 +1,170 @@
+"""Monthly rollup tables for revenue and tenant growth reports
+
+Revision ID: 0026_report_monthly_rollups
+Revises: 0025_report_export_lifecycle_indexes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0026_report_monthly_rollups"
+down_revision = "0025_report_export_lifecycle_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revenue_monthly_rollups",
+        sa.Column("month", sa.Date(), primary_key=True),
+        sa.Column("billed_cents", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("paid_cents", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("invoice_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_table(
+        "tenant_monthly_rollups",
+        sa.Column("month", sa.Date(), primary_key=True),
+        sa.Column("new_hotels", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+    # One statement per op.execute: asyncpg does not run multi-statement strings.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION revenue_rollup_apply(
+            p_issued_at timestamptz, p_billed bigint, p_paid bigint, p_count integer
+        ) RETURNS void AS $$
+        BEGIN
+            IF p_issued_at IS NULL THEN
+                RETURN;
+            END IF;
+            INSERT INTO revenue_monthly_rollups (month, billed_cents, paid_cents, invoice_count, updated_at)
+            VALUES (date_trunc('month', p_issued_at AT TIME ZONE 'UTC')::date, p_billed, p_paid, p_count, now())
+            ON CONFLICT (month) DO UPDATE SET
+                billed_cents = revenue_monthly_rollups.billed_cents + EXCLUDED.billed_cents,
+                paid_cents = revenue_monthly_rollups.paid_cents + EXCLUDED.paid_cents,
+                invoice_count = revenue_monthly_rollups.invoice_count + EXCLUDED.invoice_count,
+                updated_at = now();
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION invoices_revenue_rollup() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM revenue_rollup_apply(
+                    OLD.issued_at,
+                    -OLD.amount_cents,
+                    CASE WHEN OLD.status = 'paid' THEN -OLD.amount_cents ELSE 0 END,
+                    -1
+                );
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM revenue_rollup_apply(
+                    NEW.issued_at,
+                    NEW.amount_cents,
+                    CASE WHEN NEW.status = 'paid' THEN NEW.amount_cents ELSE 0 END,
+                    1
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER invoices_revenue_rollup_insert_delete
+        AFTER INSERT OR DELETE ON invoices
+        FOR EACH ROW EXECUTE FUNCTION invoices_revenue_rollup()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER invoices_revenue_rollup_update
+        AFTER UPDATE OF amount_cents, status, issued_at ON invoices
+        FOR EACH ROW
+        WHEN (
+            OLD.amount_cents IS DISTINCT FROM NEW.amount_cents
+            OR OLD.status IS DISTINCT FROM NEW.status
+            OR OLD.issued_at IS DISTINCT FROM NEW.issued_at
+        )
+        EXECUTE FUNCTION invoices_revenue_rollup()
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tenants_growth_rollup() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE tenant_monthly_rollups
+                SET new_hotels = new_hotels - 1, updated_at = now()
+                WHERE month = date_trunc('month', OLD.created_at AT TIME ZONE 'UTC')::date;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO tenant_monthly_rollups (month, new_hotels, updated_at)
+                VALUES (date_trunc('month', NEW.created_at AT TIME ZONE 'UTC')::date, 1, now())
+                ON CONFLICT (month) DO UPDATE SET
+                    new_hotels = tenant_monthly_rollups.new_hotels + 1,
+                    updated_at = now();
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tenants_growth_rollup_insert_delete
+        AFTER INSERT OR DELETE ON tenants
+        FOR EACH ROW EXECUTE FUNCTION tenants_growth_rollup()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tenants_growth_rollup_update
+        AFTER UPDATE OF created_at ON tenants
+        FOR EACH ROW
+        WHEN (OLD.created_at IS DISTINCT FROM NEW.created_at)
+        EXECUTE FUNCTION tenants_growth_rollup()
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO revenue_monthly_rollups (month, billed_cents, paid_cents, invoice_count, updated_at)
+        SELECT
+            date_trunc('month', issued_at AT TIME ZONE 'UTC')::date,
+            sum(amount_cents),
+            sum(CASE WHEN status = 'paid' THEN amount_cents ELSE 0 END),
+            count(*),
+            now()
+        FROM invoices
+        WHERE issued_at IS NOT NULL
+        GROUP BY 1
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO tenant_monthly_rollups (month, new_hotels, updated_at)
+        SELECT date_trunc('month', created_at AT TIME ZONE 'UTC')::date, count(*), now()
+        FROM tenants
+        GROUP BY 1
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS tenants_growth_rollup_update ON tenants")
+    op.execute("DROP TRIGGER IF EXISTS tenants_growth_rollup_insert_delete ON tenants")
+    op.execute("DROP FUNCTION IF EXISTS tenants_growth_rollup()")
+    op.execute("DROP TRIGGER IF EXISTS invoices_revenue_rollup_update ON invoices")
+    op.execute("DROP TRIGGER IF EXISTS invoices_revenue_rollup_insert_delete ON invoices")
+    op.execute("DROP FUNCTION IF EXISTS invoices_revenue_rollup()")
+    op.execute("DROP FUNCTION IF EXISTS revenue_rollup_apply(timestamptz, bigint, bigint, integer)")
+    op.drop_table("tenant_monthly_rollups")
+    op.drop_table("revenue_monthly_rollups")
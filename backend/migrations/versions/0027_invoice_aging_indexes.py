@@ -0,0 +1,38 @@
+"""Partial indexes on unpaid invoices for aging buckets
+
+Revision ID: 0027_invoice_aging_indexes
+Revises: 0026_report_monthly_rollups
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0027_invoice_aging_indexes"
+down_revision = "0026_report_monthly_rollups"
+branch_labels = None
+depends_on = None
+
+
+UNPAID = sa.text("status <> 'paid'")
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_invoices_unpaid_due_at",
+        "invoices",
+        ["due_at", "id"],
+        postgresql_where=UNPAID,
+    )
+    op.create_index(
+        "ix_invoices_unpaid_tenant_due_at",
+        "invoices",
+        ["tenant_id", "due_at"],
+        postgresql_where=UNPAID,
+        postgresql_include=["amount_cents"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_invoices_unpaid_tenant_due_at", table_name="invoices")
+    op.drop_index("ix_invoices_unpaid_due_at", table_name="invoices")
@@ -0,0 +1,41 @@
+"""Composite indexes for keyset-paginated list endpoints
+
+Revision ID: 0028_list_keyset_indexes
+Revises: 0027_invoice_aging_indexes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "0028_list_keyset_indexes"
+down_revision = "0027_invoice_aging_indexes"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns): each list endpoint's filter columns followed by its sort key.
+INDEXES = (
+    ("ix_guests_tenant_created_at_id", "guests", ["tenant_id", "created_at", "id"]),
+    ("ix_rooms_tenant_created_at_id", "rooms", ["tenant_id", "created_at", "id"]),
+    ("ix_incidents_tenant_created_at_id", "incidents", ["tenant_id", "created_at", "id"]),
+    ("ix_kiosks_tenant_created_at_id", "kiosks", ["tenant_id", "created_at", "id"]),
+    ("ix_kiosks_created_at_id", "kiosks", ["created_at", "id"]),
+    ("ix_hotel_settings_tenant_updated_at_id", "hotel_settings", ["tenant_id", "updated_at", "id"]),
+    ("ix_platform_settings_updated_at_id", "platform_settings", ["updated_at", "id"]),
+    ("ix_tenants_created_at_id", "tenants", ["created_at", "id"]),
+    ("ix_subscriptions_created_at_id", "subscriptions", ["created_at", "id"]),
+    ("ix_invoices_created_at_id", "invoices", ["created_at", "id"]),
+    ("ix_helpdesk_tickets_created_at_id", "helpdesk_tickets", ["created_at", "id"]),
+    ("ix_audit_logs_created_at_id", "audit_logs", ["created_at", "id"]),
+    ("ix_audit_logs_tenant_created_at_id", "audit_logs", ["tenant_id", "created_at", "id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
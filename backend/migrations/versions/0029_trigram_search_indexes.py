@@ -0,0 +1,46 @@
+"""Tenant-scoped trigram GIN indexes for substring search
+
+Revision ID: 0029_trigram_search_indexes
+Revises: 0028_list_keyset_indexes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "0029_trigram_search_indexes"
+down_revision = "0028_list_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+# Must match app.services.search.search_document() for each table, or the
+# planner will not use the index.
+GUEST_DOCUMENT = (
+    "coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(email, '')"
+)
+ROOM_DOCUMENT = "coalesce(number, '') || ' ' || coalesce(room_type, '')"
+INCIDENT_DOCUMENT = "coalesce(title, '') || ' ' || coalesce(description, '')"
+
+INDEXES = (
+    ("ix_guests_search_trgm", "guests", GUEST_DOCUMENT),
+    ("ix_rooms_search_trgm", "rooms", ROOM_DOCUMENT),
+    ("ix_incidents_search_trgm", "incidents", INCIDENT_DOCUMENT),
+    ("ix_audit_logs_action_trgm", "audit_logs", "action"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # btree_gin lets tenant_id share the GIN index, so a tenant's search
+    # intersects both keys inside one index scan.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    for name, table, expression in INDEXES:
+        op.execute(
+            f"CREATE INDEX {name} ON {table} USING gin (tenant_id, ({expression}) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    # The extensions stay installed; other objects may depend on them.
+    for name, _table, _expression in reversed(INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,78 @@
+"""Full-text search documents for guests, rooms, incidents and helpdesk tickets
+
+Revision ID: 0030_search_documents
+Revises: 0029_trigram_search_indexes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0030_search_documents"
+down_revision = "0029_trigram_search_indexes"
+branch_labels = None
+depends_on = None
+
+
+# (entity_type, table, title, body, filter) - must mirror
+# app.services.search.document_text() so backfilled rows match live ones.
+SOURCES = (
+    (
+        "guests",
+        "guests",
+        "concat_ws(' ', first_name, last_name)",
+        "concat_ws(' ', email, phone)",
+        "",
+    ),
+    ("rooms", "rooms", "number", "concat_ws(' ', room_type, floor, description)", ""),
+    ("incidents", "incidents", "title", "concat_ws(' ', category, description)", ""),
+    (
+        "helpdesk",
+        "helpdesk_tickets",
+        "subject",
+        "concat_ws(' ', requester_name, requester_email, description)",
+        "WHERE tenant_id IS NOT NULL",
+    ),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_documents",
+        sa.Column("entity_type", sa.String(length=30), primary_key=True),
+        sa.Column("entity_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False, server_default=""),
+        sa.Column("document", postgresql.TSVECTOR(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    # btree_gin (installed by 0029) keeps tenant_id in the same GIN index, so a
+    # tenant's search is one index scan across every entity type.
+    op.execute(
+        "CREATE INDEX ix_search_documents_tenant_document "
+        "ON search_documents USING gin (tenant_id, document)"
+    )
+
+    for entity_type, table, title, body, where in SOURCES:
+        op.execute(
+            f"""
+            INSERT INTO search_documents (entity_type, entity_id, tenant_id, title, body, document)
+            SELECT '{entity_type}', id, tenant_id, title, body,
+                   setweight(to_tsvector('simple'::regconfig, title), 'A')
+                   || setweight(to_tsvector('simple'::regconfig, body), 'B')
+            FROM (
+                SELECT id, tenant_id, {title} AS title, {body} AS body FROM {table} {where}
+            ) AS source
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("search_documents")
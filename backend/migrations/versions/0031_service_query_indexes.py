@@ -0,0 +1,59 @@
+"""Composite indexes for tenant-scoped service queries
+
+Revision ID: 0031_service_query_indexes
+Revises: 0030_search_documents
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0031_service_query_indexes"
+down_revision = "0030_search_documents"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns): found by tests/integration/test_query_plans.py,
+# which fails on large sequential scans or sorts in service queries.
+INDEXES = (
+    # Hotel billing list and billing report: tenant invoices by issue date.
+    ("ix_invoices_tenant_issued_at_id", "invoices", ["tenant_id", "issued_at", "id"]),
+    # Hotel billing: a tenant's latest subscription.
+    ("ix_subscriptions_tenant_created_at", "subscriptions", ["tenant_id", "created_at"]),
+    # Hotel helpdesk list and dashboard open-ticket count.
+    (
+        "ix_helpdesk_tickets_tenant_created_at_id",
+        "helpdesk_tickets",
+        ["tenant_id", "created_at", "id"],
+    ),
+    ("ix_helpdesk_tickets_tenant_status", "helpdesk_tickets", ["tenant_id", "status"]),
+    # Incident list filtered by status, dashboard counts and the incident report.
+    (
+        "ix_incidents_tenant_status_created_at",
+        "incidents",
+        ["tenant_id", "status", "created_at"],
+    ),
+    # Dashboard recent incidents: ORDER BY occurred_at DESC NULLS LAST, created_at DESC.
+    (
+        "ix_incidents_tenant_recent",
+        "incidents",
+        ["tenant_id", sa.text("occurred_at DESC NULLS LAST"), sa.text("created_at DESC")],
+    ),
+    # Dashboard status counts.
+    ("ix_guests_tenant_status", "guests", ["tenant_id", "status"]),
+    ("ix_rooms_tenant_status", "rooms", ["tenant_id", "status"]),
+    ("ix_kiosks_tenant_status", "kiosks", ["tenant_id", "status"]),
+    # Kiosk health report, ordered by name.
+    ("ix_kiosks_tenant_name_id", "kiosks", ["tenant_id", "name", "id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
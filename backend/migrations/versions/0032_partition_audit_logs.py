@@ -0,0 +1,121 @@
+"""Monthly range partitions for audit_logs
+
+Revision ID: 0032_partition_audit_logs
+Revises: 0031_service_query_indexes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "0032_partition_audit_logs"
+down_revision = "0031_service_query_indexes"
+branch_labels = None
+depends_on = None
+
+
+# Created in UTC months up to this far ahead; the app's partition job keeps extending it.
+MONTHS_AHEAD = 3
+
+FOREIGN_KEYS = (
+    ("audit_logs_tenant_id_fkey", "tenant_id", "tenants"),
+    ("audit_logs_actor_user_id_fkey", "actor_user_id", "users"),
+    ("fk_audit_logs_acting_as_user_id", "acting_as_user_id", "users"),
+    ("audit_logs_impersonated_by_fkey", "impersonated_by", "users"),
+)
+
+# Indexes from 0019, 0028 and 0029; on the partitioned parent they cascade to
+# every partition, including ones created later.
+INDEXES = (
+    "CREATE INDEX ix_audit_logs_acting_as_user_id ON audit_logs (acting_as_user_id)",
+    "CREATE INDEX ix_audit_logs_created_at_id ON audit_logs (created_at, id)",
+    "CREATE INDEX ix_audit_logs_tenant_created_at_id ON audit_logs (tenant_id, created_at, id)",
+    "CREATE INDEX ix_audit_logs_action_trgm ON audit_logs "
+    "USING gin (tenant_id, (action) gin_trgm_ops)",
+)
+
+
+def _swap_in(create_table: str) -> None:
+    """Replace audit_logs with the table ``create_table`` builds, keeping every row."""
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_legacy")
+    op.execute(
+        "ALTER TABLE audit_logs_legacy RENAME CONSTRAINT audit_logs_pkey TO audit_logs_legacy_pkey"
+    )
+    op.execute(create_table)
+
+
+def _finish_swap() -> None:
+    op.execute("DROP TABLE audit_logs_legacy")
+    for name, column, target in FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE audit_logs ADD CONSTRAINT {name} FOREIGN KEY ({column}) "
+            f"REFERENCES {target} (id) ON DELETE SET NULL"
+        )
+    for statement in INDEXES:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    op.execute("UPDATE audit_logs SET created_at = now() WHERE created_at IS NULL")
+    # The partition key must be part of the primary key; ids stay unique on their own.
+    _swap_in(
+        "CREATE TABLE audit_logs (LIKE audit_logs_legacy INCLUDING DEFAULTS, "
+        "PRIMARY KEY (id, created_at)) PARTITION BY RANGE (created_at)"
+    )
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN created_at SET NOT NULL")
+    # Catches rows for months the partition job has not created yet, so audit
+    # writes never fail on a missing partition.
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit_logs_ensure_partitions(p_from date, p_to date)
+        RETURNS integer AS $$
+        DECLARE
+            month_start date := date_trunc('month', p_from)::date;
+            partition_name text;
+            created integer := 0;
+        BEGIN
+            WHILE month_start <= p_to LOOP
+                partition_name := 'audit_logs_p' || to_char(month_start, 'YYYYMM');
+                IF to_regclass(partition_name) IS NULL THEN
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                        partition_name,
+                        month_start::timestamp AT TIME ZONE 'UTC',
+                        (month_start + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                    );
+                    created := created + 1;
+                END IF;
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+            RETURN created;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        f"""
+        SELECT audit_logs_ensure_partitions(
+            coalesce(
+                (SELECT (min(created_at) AT TIME ZONE 'UTC')::date FROM audit_logs_legacy),
+                (now() AT TIME ZONE 'UTC')::date
+            ),
+            ((now() AT TIME ZONE 'UTC') + interval '{MONTHS_AHEAD} months')::date
+        )
+        """
+    )
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_legacy")
+    _finish_swap()
+    # Audit rows arrive in created_at order, so a BRIN index stays tiny and lets
+    # date-range scans inside a partition skip whole block ranges.
+    op.execute("CREATE INDEX ix_audit_logs_created_at_brin ON audit_logs USING brin (created_at)")
+
+
+def downgrade() -> None:
+    # Partitions already moved to the archive schema are not brought back.
+    _swap_in(
+        "CREATE TABLE audit_logs (LIKE audit_logs_legacy INCLUDING DEFAULTS, PRIMARY KEY (id))"
+    )
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN created_at DROP NOT NULL")
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_legacy")
+    _finish_swap()
+    op.execute("DROP FUNCTION IF EXISTS audit_logs_ensure_partitions(date, date)")
@@ -0,0 +1,54 @@
+"""Guest import jobs
+
+Revision ID: 0033_guest_imports
+Revises: 0032_partition_audit_logs
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0033_guest_imports"
+down_revision = "0032_partition_audit_logs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "guest_imports",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "requested_by",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+        ),
+        sa.Column("import_format", sa.String(length=10), nullable=False),
+        sa.Column("status", sa.String(length=30), nullable=False, server_default=sa.text("'pending'")),
+        sa.Column("file_path", sa.String(length=500)),
+        sa.Column("file_size", sa.BigInteger()),
+        sa.Column("rows_processed", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+        sa.Column("rows_imported", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+        sa.Column("rows_failed", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+        sa.Column("errors", postgresql.JSONB()),
+        sa.Column("error_message", sa.Text()),
+        sa.Column("completed_at", sa.DateTime(timezone=True)),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+    op.create_index("ix_guest_imports_tenant_id", "guest_imports", ["tenant_id"])
+    # The worker polls for pending jobs oldest first.
+    op.create_index("ix_guest_imports_status_created_at", "guest_imports", ["status", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_guest_imports_status_created_at", table_name="guest_imports")
+    op.drop_index("ix_guest_imports_tenant_id", table_name="guest_imports")
+    op.drop_table("guest_imports")
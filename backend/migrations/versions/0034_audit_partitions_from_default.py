@@ -0,0 +1,98 @@
+"""Move default-partition rows into audit_logs month partitions as they are created
+
+Revision ID: 0034_audit_partitions_from_default
+Revises: 0033_guest_imports
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "0034_audit_partitions_from_default"
+down_revision = "0033_guest_imports"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rows for a month without a partition (skewed clocks, or the job falling
+    # behind) land in audit_logs_default, and Postgres refuses to create a
+    # partition whose range the default already holds rows for. Detach the
+    # default, create the month, move its rows over and reattach. Detaching locks
+    # audit_logs, so concurrent writes wait for the transaction instead of failing.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit_logs_ensure_partitions(p_from date, p_to date)
+        RETURNS integer AS $$
+        DECLARE
+            month_start date := date_trunc('month', p_from)::date;
+            partition_name text;
+            range_start timestamptz;
+            range_end timestamptz;
+            stranded boolean;
+            created integer := 0;
+        BEGIN
+            WHILE month_start <= p_to LOOP
+                partition_name := 'audit_logs_p' || to_char(month_start, 'YYYYMM');
+                range_start := month_start::timestamp AT TIME ZONE 'UTC';
+                range_end := (month_start + interval '1 month')::timestamp AT TIME ZONE 'UTC';
+                IF to_regclass(partition_name) IS NULL THEN
+                    stranded := to_regclass('audit_logs_default') IS NOT NULL AND EXISTS (
+                        SELECT 1 FROM audit_logs_default
+                        WHERE created_at >= range_start AND created_at < range_end
+                    );
+                    IF stranded THEN
+                        ALTER TABLE audit_logs DETACH PARTITION audit_logs_default;
+                    END IF;
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, range_start, range_end
+                    );
+                    IF stranded THEN
+                        EXECUTE format(
+                            'INSERT INTO %I SELECT * FROM audit_logs_default '
+                            'WHERE created_at >= %L AND created_at < %L',
+                            partition_name, range_start, range_end
+                        );
+                        DELETE FROM audit_logs_default
+                        WHERE created_at >= range_start AND created_at < range_end;
+                        ALTER TABLE audit_logs ATTACH PARTITION audit_logs_default DEFAULT;
+                    END IF;
+                    created := created + 1;
+                END IF;
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+            RETURN created;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit_logs_ensure_partitions(p_from date, p_to date)
+        RETURNS integer AS $$
+        DECLARE
+            month_start date := date_trunc('month', p_from)::date;
+            partition_name text;
+            created integer := 0;
+        BEGIN
+            WHILE month_start <= p_to LOOP
+                partition_name := 'audit_logs_p' || to_char(month_start, 'YYYYMM');
+                IF to_regclass(partition_name) IS NULL THEN
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                        partition_name,
+                        month_start::timestamp AT TIME ZONE 'UTC',
+                        (month_start + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                    );
+                    created := created + 1;
+                END IF;
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+            RETURN created;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
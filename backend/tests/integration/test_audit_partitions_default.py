@@ -0,0 +1,65 @@
+"""Creating an audit_logs month must adopt rows already parked in the default partition.
+
+Requires ``TEST_DATABASE_URL`` pointing at a database migrated to head.
+"""
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.services.audit_partitions import AuditPartitionReport, AuditPartitionService
+
+
+@pytest.mark.integration
+async def test_ensure_partitions_moves_rows_out_of_the_default_partition():
+    database_url = os.getenv("TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("TEST_DATABASE_URL not set")
+
+    row_id = uuid.uuid4()
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            # No partition exists this far ahead, so the row lands in the default.
+            await connection.execute(
+                text(
+                    "INSERT INTO audit_logs (id, action, created_at) "
+                    "VALUES (:id, 'partition.test', '2099-05-15T12:00:00+00:00')"
+                ),
+                {"id": row_id},
+            )
+            session = AsyncSession(
+                bind=connection,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            report = AuditPartitionReport()
+
+            await AuditPartitionService(session).ensure_partitions(
+                datetime(2099, 5, 1, tzinfo=timezone.utc), report
+            )
+
+            location = await connection.scalar(
+                text("SELECT tableoid::regclass::text FROM audit_logs WHERE id = :id"),
+                {"id": row_id},
+            )
+            default_attached = await connection.scalar(
+                text(
+                    "SELECT count(*) FROM pg_inherits "
+                    "WHERE inhparent = 'audit_logs'::regclass "
+                    "AND inhrelid = 'audit_logs_default'::regclass"
+                )
+            )
+
+            await session.close()
+            await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+    assert report.created >= 1
+    assert location == "audit_logs_p209905"
+    assert default_attached == 1
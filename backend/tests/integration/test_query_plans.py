@@ -0,0 +1,522 @@
+"""Query-plan regression harness for service read paths.
+
+Seeds a synthetic multi-tenant dataset inside a transaction that is rolled back
+afterwards, runs every read method of every ``app/modules/**/service.py``
+service, captures the SQL each one emits and runs ``EXPLAIN (ANALYZE, FORMAT
+JSON)`` on it. The test fails on sequential scans or sorts that touch
+``PLAN_CHECK_ROW_THRESHOLD`` rows or more, so a missing or unusable index shows
+up here instead of in production.
+
+Requires ``TEST_DATABASE_URL`` pointing at a database migrated to head.
+"""
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import app.modules
+from app.core.explain import find_plan_regressions
+from app.modules.admin.audit.service import AuditLogService
+from app.modules.admin.dashboard.service import AdminDashboardService
+from app.modules.admin.helpdesk.service import HelpdeskService
+from app.modules.admin.hotels.service import HotelService
+from app.modules.admin.invoices.service import InvoiceService
+from app.modules.admin.kiosks.service import KioskService
+from app.modules.admin.plans.service import PlanService
+from app.modules.admin.profile.service import ProfileService as AdminProfileService
+from app.modules.admin.reports.service import (
+    INVOICE_AGING_BUCKETS,
+    REPORT_DEFINITIONS as ADMIN_REPORTS,
+    ReportService,
+)
+from app.modules.admin.roles.service import AdminRoleService
+from app.modules.admin.settings.service import SettingsService as AdminSettingsService
+from app.modules.admin.subscriptions.service import SubscriptionService
+from app.modules.admin.users.service import AdminUserService
+from app.modules.hotel.audit.service import HotelAuditLogService
+from app.modules.hotel.billing.service import BillingService
+from app.modules.hotel.dashboard.service import HotelDashboardService
+from app.modules.hotel.guests.service import GuestImportService, GuestService
+from app.modules.hotel.helpdesk.service import HotelHelpdeskService
+from app.modules.hotel.incidents.service import IncidentService
+from app.modules.hotel.kiosk_settings.service import KioskSettingsService
+from app.modules.hotel.profile.service import ProfileService as HotelProfileService
+from app.modules.hotel.reports.service import (
+    REPORT_DEFINITIONS as HOTEL_REPORTS,
+    HotelReportService,
+)
+from app.modules.hotel.roles.service import HotelRoleService
+from app.modules.hotel.rooms.service import RoomService
+from app.modules.hotel.search.service import HotelSearchService
+from app.modules.hotel.settings.service import SettingsService as HotelSettingsService
+from app.modules.hotel.users.service import HotelUserService
+
+
+ROWS = int(os.getenv("PLAN_CHECK_ROWS", "200000"))
+TENANTS = int(os.getenv("PLAN_CHECK_TENANTS", "20"))
+ROW_THRESHOLD = int(os.getenv("PLAN_CHECK_ROW_THRESHOLD", "5000"))
+
+# Methods that write, or need a request and credentials, are not plan-checked.
+WRITE_METHODS = {"create", "update", "delete", "export_report", "run", "batch_upsert", "transition_status"}
+UNCHECKED_SERVICES = {"AuthService"}
+
+# Reads that touch every row in scope by design; their scans and sorts are expected.
+ACCEPTED_FULL_READS = {
+    "admin.dashboard.AdminDashboardService.get_summary": "platform-wide counts",
+    "admin.reports.ReportService.get_report_summary": "platform-wide aggregates",
+    "admin.reports.ReportService.stream_report_rows": "exports read the whole report",
+    "hotel.reports.HotelReportService.stream_report_rows": "exports read the whole report",
+    "hotel.reports.HotelReportService.get_shard_rows": "export shards read a whole date range",
+}
+
+
+def service_read_methods() -> set[str]:
+    """``<area>.<module>.<Service>.<method>`` for every read method under app.modules."""
+    found = set()
+    for info in pkgutil.walk_packages(app.modules.__path__, "app.modules."):
+        if not info.name.endswith(".service"):
+            continue
+        module = importlib.import_module(info.name)
+        prefix = info.name.removeprefix("app.modules.").removesuffix(".service")
+        for class_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__ or not class_name.endswith("Service"):
+                continue
+            if class_name in UNCHECKED_SERVICES:
+                continue
+            for name, method in vars(cls).items():
+                if name.startswith("_") or name in WRITE_METHODS:
+                    continue
+                if inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method):
+                    found.add(f"{prefix}.{class_name}.{name}")
+    return found
+
+
+async def _first(rows) -> None:
+    async for _row in rows:
+        break
+    await rows.aclose()
+
+
+async def _admin_reports(session, ctx) -> None:
+    service = ReportService(session)
+    for code in ADMIN_REPORTS:
+        await service.get_report(code, date_from=ctx.since, limit=50)
+
+
+async def _admin_report_summaries(session, ctx) -> None:
+    service = ReportService(session)
+    for code in ADMIN_REPORTS:
+        await service.get_report_summary(code, date_from=ctx.since)
+
+
+async def _admin_report_estimates(session, ctx) -> None:
+    service = ReportService(session)
+    for code in ADMIN_REPORTS:
+        await service.estimate_report_rows(code, date_from=ctx.since)
+
+
+async def _admin_report_streams(session, ctx) -> None:
+    service = ReportService(session)
+    for code in ADMIN_REPORTS:
+        await _first(service.stream_report_rows(code, date_from=ctx.since))
+
+
+async def _aging_invoices(session, ctx) -> None:
+    service = ReportService(session)
+    for bucket in INVOICE_AGING_BUCKETS:
+        await service.list_aging_invoices(bucket.code, tenant_id=ctx.tenant_id, limit=50)
+
+
+async def _hotel_reports(session, ctx) -> None:
+    service = HotelReportService(session)
+    for code in HOTEL_REPORTS:
+        await service.get_report(ctx.tenant_id, code, date_from=ctx.since, limit=50)
+
+
+async def _hotel_report_summaries(session, ctx) -> None:
+    service = HotelReportService(session)
+    for code in HOTEL_REPORTS:
+        await service.get_report_summary(ctx.tenant_id, code, date_from=ctx.since)
+
+
+async def _hotel_report_estimates(session, ctx) -> None:
+    service = HotelReportService(session)
+    for code in HOTEL_REPORTS:
+        await service.estimate_report_rows(ctx.tenant_id, code, date_from=ctx.since)
+
+
+async def _hotel_report_streams(session, ctx) -> None:
+    service = HotelReportService(session)
+    for code in HOTEL_REPORTS:
+        await _first(service.stream_report_rows(ctx.tenant_id, code, date_from=ctx.since))
+
+
+async def _hotel_report_shards(session, ctx) -> None:
+    service = HotelReportService(session)
+    for code in HOTEL_REPORTS:
+        await service.plan_export_shards(ctx.tenant_id, code, 4, date_from=ctx.since)
+
+
+async def _hotel_report_shard_rows(session, ctx) -> None:
+    service = HotelReportService(session)
+    for code in HOTEL_REPORTS:
+        shards = await service.plan_export_shards(ctx.tenant_id, code, 4, date_from=ctx.since)
+        if shards:
+            await service.get_shard_rows(ctx.tenant_id, code, shards[0], date_from=ctx.since)
+
+
+async def _invoice_names(session, ctx) -> None:
+    service = InvoiceService(session)
+    await service.get_names(await service.get(ctx.invoice_id))
+
+
+async def _subscription_names(session, ctx) -> None:
+    service = SubscriptionService(session)
+    await service.get_names(await service.get(ctx.subscription_id))
+
+
+SCENARIOS = {
+    "admin.audit.AuditLogService.list_logs": lambda s, c: AuditLogService(s).list_logs(
+        1, 50, tenant_id=c.tenant_id, action="guest", date_from=c.since
+    ),
+    "admin.audit.AuditLogService.get": lambda s, c: AuditLogService(s).get(c.missing_id),
+    "admin.dashboard.AdminDashboardService.get_summary": lambda s, c: AdminDashboardService(
+        s
+    ).get_summary(),
+    "admin.helpdesk.HelpdeskService.list": lambda s, c: HelpdeskService(s).list(
+        1, 50, status="open", tenant_id=c.tenant_id
+    ),
+    "admin.helpdesk.HelpdeskService.get": lambda s, c: HelpdeskService(s).get(c.missing_id),
+    "admin.hotels.HotelService.list_hotels": lambda s, c: HotelService(s).list_hotels(1, 50),
+    "admin.hotels.HotelService.get": lambda s, c: HotelService(s).get(c.tenant_id),
+    "admin.invoices.InvoiceService.list_invoices": lambda s, c: InvoiceService(
+        s
+    ).list_invoices(1, 50),
+    "admin.invoices.InvoiceService.get": lambda s, c: InvoiceService(s).get(c.invoice_id),
+    "admin.invoices.InvoiceService.get_names": _invoice_names,
+    "admin.kiosks.KioskService.list": lambda s, c: KioskService(s).list(1, 50),
+    "admin.kiosks.KioskService.get": lambda s, c: KioskService(s).get(c.missing_id),
+    "admin.plans.PlanService.list_plans": lambda s, c: PlanService(s).list_plans(1, 50),
+    "admin.plans.PlanService.get": lambda s, c: PlanService(s).get(c.plan_id),
+    "admin.profile.ProfileService.get": lambda s, c: AdminProfileService(s).get(c.missing_id),
+    "admin.reports.ReportService.list_reports": lambda s, c: ReportService(s).list_reports(
+        date_from=c.since
+    ),
+    "admin.reports.ReportService.get_report": _admin_reports,
+    "admin.reports.ReportService.get_report_summary": _admin_report_summaries,
+    "admin.reports.ReportService.estimate_report_rows": _admin_report_estimates,
+    "admin.reports.ReportService.stream_report_rows": _admin_report_streams,
+    "admin.reports.ReportService.get_invoice_aging": lambda s, c: ReportService(
+        s
+    ).get_invoice_aging(limit=50),
+    "admin.reports.ReportService.list_aging_invoices": _aging_invoices,
+    "admin.reports.ReportService.get_export": lambda s, c: ReportService(s).get_export(
+        c.missing_id
+    ),
+    "admin.reports.ReportService.get_exports": lambda s, c: ReportService(s).get_exports(
+        [c.missing_id]
+    ),
+    "admin.roles.AdminRoleService.list_roles": lambda s, c: AdminRoleService(s).list_roles(),
+    "admin.roles.AdminRoleService.list_permissions": lambda s, c: AdminRoleService(
+        s
+    ).list_permissions(),
+    "admin.roles.AdminRoleService.get": lambda s, c: AdminRoleService(s).get(c.missing_id),
+    "admin.roles.AdminRoleService.get_permissions_for_role": lambda s, c: AdminRoleService(
+        s
+    ).get_permissions_for_role(c.missing_id),
+    "admin.settings.SettingsService.list": lambda s, c: AdminSettingsService(s).list(1, 50),
+    "admin.settings.SettingsService.get": lambda s, c: AdminSettingsService(s).get(
+        c.missing_id
+    ),
+    "admin.subscriptions.SubscriptionService.list_subscriptions": lambda s, c: (
+        SubscriptionService(s).list_subscriptions(1, 50)
+    ),
+    "admin.subscriptions.SubscriptionService.get": lambda s, c: SubscriptionService(s).get(
+        c.subscription_id
+    ),
+    "admin.subscriptions.SubscriptionService.get_names": _subscription_names,
+    "admin.users.AdminUserService.list_users": lambda s, c: AdminUserService(s).list_users(
+        1, 50
+    ),
+    "admin.users.AdminUserService.list_roles": lambda s, c: AdminUserService(s).list_roles(),
+    "admin.users.AdminUserService.get": lambda s, c: AdminUserService(s).get(c.missing_id),
+    "admin.users.AdminUserService.get_roles_for_user": lambda s, c: AdminUserService(
+        s
+    ).get_roles_for_user(c.missing_id),
+    "hotel.audit.HotelAuditLogService.list_logs": lambda s, c: HotelAuditLogService(
+        s
+    ).list_logs(c.tenant_id, 1, 50, action="guest", date_from=c.since),
+    "hotel.audit.HotelAuditLogService.get": lambda s, c: HotelAuditLogService(s).get(
+        c.tenant_id, c.missing_id
+    ),
+    "hotel.billing.BillingService.get_subscription": lambda s, c: BillingService(
+        s
+    ).get_subscription(c.tenant_id),
+    "hotel.billing.BillingService.get_plan": lambda s, c: BillingService(s).get_plan(c.plan_id),
+    "hotel.billing.BillingService.list_invoices": lambda s, c: BillingService(
+        s
+    ).list_invoices(c.tenant_id, 50),
+    "hotel.billing.BillingService.get_invoice": lambda s, c: BillingService(s).get_invoice(
+        c.tenant_id, c.invoice_id
+    ),
+    "hotel.dashboard.HotelDashboardService.get_summary": lambda s, c: HotelDashboardService(
+        s
+    ).get_summary(c.tenant_id),
+    "hotel.guests.GuestService.list": lambda s, c: GuestService(s).list(
+        c.tenant_id, 1, 50, search="guest42"
+    ),
+    "hotel.guests.GuestService.get": lambda s, c: GuestService(s).get(c.tenant_id, c.missing_id),
+    "hotel.guests.GuestImportService.get": lambda s, c: GuestImportService(s).get(
+        c.tenant_id, c.missing_id
+    ),
+    "hotel.helpdesk.HotelHelpdeskService.list": lambda s, c: HotelHelpdeskService(s).list(
+        c.tenant_id, 50
+    ),
+    "hotel.incidents.IncidentService.list": lambda s, c: IncidentService(s).list(
+        c.tenant_id, 1, 50, status="open"
+    ),
+    "hotel.incidents.IncidentService.get": lambda s, c: IncidentService(s).get(
+        c.tenant_id, c.missing_id
+    ),
+    "hotel.kiosk_settings.KioskSettingsService.list": lambda s, c: KioskSettingsService(
+        s
+    ).list(c.tenant_id, 1, 50),
+    "hotel.kiosk_settings.KioskSettingsService.get": lambda s, c: KioskSettingsService(s).get(
+        c.tenant_id, c.missing_id
+    ),
+    "hotel.profile.ProfileService.get": lambda s, c: HotelProfileService(s).get(c.missing_id),
+    "hotel.reports.HotelReportService.list_reports": lambda s, c: HotelReportService(
+        s
+    ).list_reports(c.tenant_id, date_from=c.since),
+    "hotel.reports.HotelReportService.get_report": _hotel_reports,
+    "hotel.reports.HotelReportService.get_report_summary": _hotel_report_summaries,
+    "hotel.reports.HotelReportService.estimate_report_rows": _hotel_report_estimates,
+    "hotel.reports.HotelReportService.stream_report_rows": _hotel_report_streams,
+    "hotel.reports.HotelReportService.plan_export_shards": _hotel_report_shards,
+    "hotel.reports.HotelReportService.get_shard_rows": _hotel_report_shard_rows,
+    "hotel.reports.HotelReportService.get_export": lambda s, c: HotelReportService(
+        s
+    ).get_export(c.tenant_id, c.missing_id),
+    "hotel.reports.HotelReportService.get_exports": lambda s, c: HotelReportService(
+        s
+    ).get_exports(c.tenant_id, [c.missing_id]),
+    "hotel.roles.HotelRoleService.list_roles": lambda s, c: HotelRoleService(s).list_roles(
+        c.tenant_id
+    ),
+    "hotel.roles.HotelRoleService.list_permissions": lambda s, c: HotelRoleService(
+        s
+    ).list_permissions(),
+    "hotel.roles.HotelRoleService.get": lambda s, c: HotelRoleService(s).get(c.missing_id),
+    "hotel.roles.HotelRoleService.get_permissions_for_role": lambda s, c: HotelRoleService(
+        s
+    ).get_permissions_for_role(c.missing_id),
+    "hotel.rooms.RoomService.list": lambda s, c: RoomService(s).list(
+        c.tenant_id, 1, 50, search="suite"
+    ),
+    "hotel.rooms.RoomService.get": lambda s, c: RoomService(s).get(c.tenant_id, c.missing_id),
+    "hotel.search.HotelSearchService.search": lambda s, c: HotelSearchService(s).search(
+        c.tenant_id, "guest42", ["guests", "rooms", "incidents", "helpdesk"]
+    ),
+    "hotel.settings.SettingsService.list": lambda s, c: HotelSettingsService(s).list(
+        c.tenant_id, 1, 50
+    ),
+    "hotel.settings.SettingsService.get": lambda s, c: HotelSettingsService(s).get(
+        c.tenant_id, c.missing_id
+    ),
+    "hotel.users.HotelUserService.list_users": lambda s, c: HotelUserService(s).list_users(
+        c.tenant_id, 1, 50
+    ),
+    "hotel.users.HotelUserService.list_roles": lambda s, c: HotelUserService(s).list_roles(
+        c.tenant_id
+    ),
+    "hotel.users.HotelUserService.get": lambda s, c: HotelUserService(s).get(c.missing_id),
+    "hotel.users.HotelUserService.get_roles_for_user": lambda s, c: HotelUserService(
+        s
+    ).get_roles_for_user(c.missing_id),
+}
+
+
+# Spreads generate_series row ``n`` over the seeded tenants.
+TENANT_SLOT = (
+    "JOIN (SELECT id AS tenant_id, row_number() OVER (ORDER BY id) - 1 AS slot "
+    "FROM tenants WHERE slug LIKE :prefix) AS t ON t.slot = n % :tenants"
+)
+
+SEED_STATEMENTS = (
+    "INSERT INTO guests (id, tenant_id, first_name, last_name, email, status, "
+    "check_in_at, created_at, updated_at) "
+    "SELECT gen_random_uuid(), t.tenant_id, 'Guest' || n, md5(n::text), "
+    "'guest' || n || '@example.com', (ARRAY['active', 'checked_out'])[1 + n % 2], "
+    "now() - n * interval '1 minute', now() - n * interval '1 minute', now() "
+    f"FROM generate_series(1, :rows) AS n {TENANT_SLOT}",
+    "INSERT INTO rooms (id, tenant_id, number, room_type, status, created_at, updated_at) "
+    "SELECT gen_random_uuid(), t.tenant_id, n::text, (ARRAY['Suite', 'Double'])[1 + n % 2], "
+    "(ARRAY['available', 'occupied'])[1 + n % 2], now() - n * interval '1 minute', now() "
+    f"FROM generate_series(1, :rows) AS n {TENANT_SLOT}",
+    "INSERT INTO incidents (id, tenant_id, title, description, status, severity, "
+    "occurred_at, created_at, updated_at) "
+    "SELECT gen_random_uuid(), t.tenant_id, 'Incident ' || n, md5(n::text), "
+    "(ARRAY['open', 'in_progress', 'resolved'])[1 + n % 3], 'medium', "
+    "now() - n * interval '1 minute', now() - n * interval '1 minute', now() "
+    f"FROM generate_series(1, :rows) AS n {TENANT_SLOT}",
+    "INSERT INTO kiosks (id, tenant_id, name, status, token_hash, created_at, updated_at) "
+    "SELECT gen_random_uuid(), t.tenant_id, 'Kiosk ' || n, "
+    "(ARRAY['active', 'offline'])[1 + n % 2], md5(n::text), "
+    "now() - n * interval '1 minute', now() "
+    f"FROM generate_series(1, :rows) AS n {TENANT_SLOT}",
+    "INSERT INTO helpdesk_tickets (id, tenant_id, subject, status, priority, "
+    "created_at, updated_at) "
+    "SELECT gen_random_uuid(), t.tenant_id, 'Ticket ' || n, "
+    "(ARRAY['open', 'in_progress', 'closed'])[1 + n % 3], 'normal', "
+    "now() - n * interval '1 minute', now() "
+    f"FROM generate_series(1, :rows) AS n {TENANT_SLOT}",
+    "INSERT INTO audit_logs (id, tenant_id, action, resource_type, created_at) "
+    "SELECT gen_random_uuid(), t.tenant_id, (ARRAY['guest.create', 'room.update'])[1 + n % 2], "
+    "'guest', now() - n * interval '1 minute' "
+    f"FROM generate_series(1, :rows) AS n {TENANT_SLOT}",
+    "INSERT INTO invoices (id, tenant_id, subscription_id, invoice_number, status, "
+    "amount_cents, issued_at, due_at, created_at, updated_at) "
+    "SELECT gen_random_uuid(), t.tenant_id, s.id, :prefix_number || n, "
+    "(ARRAY['issued', 'paid', 'overdue'])[1 + n % 3], 1000 + n % 5000, "
+    "now() - n * interval '1 minute', now() - n * interval '1 minute' + interval '30 days', "
+    "now() - n * interval '1 minute', now() "
+    f"FROM generate_series(1, :rows) AS n {TENANT_SLOT} "
+    "JOIN subscriptions AS s ON s.tenant_id = t.tenant_id",
+)
+
+ANALYZED_TABLES = (
+    "tenants",
+    "subscriptions",
+    "guests",
+    "rooms",
+    "incidents",
+    "kiosks",
+    "helpdesk_tickets",
+    "audit_logs",
+    "invoices",
+)
+
+
+async def _seed(connection) -> SimpleNamespace:
+    run = uuid.uuid4().hex[:8]
+    prefix = f"plan-check-{run}-%"
+    plan_id = uuid.uuid4()
+    await connection.execute(
+        text(
+            "INSERT INTO plans (id, name, code, price_cents) "
+            "VALUES (:id, 'Plan check', :code, 1000)"
+        ),
+        {"id": plan_id, "code": f"plan-check-{run}"},
+    )
+    for index in range(TENANTS):
+        await connection.execute(
+            text("INSERT INTO tenants (id, name, slug) VALUES (:id, :name, :slug)"),
+            {
+                "id": uuid.uuid4(),
+                "name": f"Plan check {index}",
+                "slug": f"plan-check-{run}-{index}",
+            },
+        )
+    await connection.execute(
+        text(
+            "INSERT INTO subscriptions (id, tenant_id, plan_id, status) "
+            "SELECT gen_random_uuid(), id, :plan_id, 'active' FROM tenants WHERE slug LIKE :prefix"
+        ),
+        {"plan_id": plan_id, "prefix": prefix},
+    )
+    params = {
+        "rows": ROWS,
+        "tenants": TENANTS,
+        "prefix": prefix,
+        "prefix_number": f"PC-{run}-",
+    }
+    for statement in SEED_STATEMENTS:
+        used = {key: value for key, value in params.items() if f":{key}" in statement}
+        await connection.execute(text(statement), used)
+    for table in ANALYZED_TABLES:
+        await connection.execute(text(f"ANALYZE {table}"))
+
+    tenant_id = await connection.scalar(
+        text("SELECT id FROM tenants WHERE slug = :slug"), {"slug": f"plan-check-{run}-0"}
+    )
+    return SimpleNamespace(
+        tenant_id=tenant_id,
+        plan_id=plan_id,
+        subscription_id=await connection.scalar(
+            text("SELECT id FROM subscriptions WHERE tenant_id = :tenant_id"),
+            {"tenant_id": tenant_id},
+        ),
+        invoice_id=await connection.scalar(
+            text("SELECT id FROM invoices WHERE tenant_id = :tenant_id LIMIT 1"),
+            {"tenant_id": tenant_id},
+        ),
+        missing_id=uuid.uuid4(),
+        since=datetime.now(timezone.utc) - timedelta(days=30),
+    )
+
+
+def test_every_service_read_method_has_a_plan_scenario():
+    discovered = service_read_methods()
+    assert sorted(discovered - SCENARIOS.keys()) == []
+    assert sorted(SCENARIOS.keys() - discovered) == []
+    assert set(ACCEPTED_FULL_READS) <= discovered
+
+
+@pytest.mark.integration
+async def test_service_queries_avoid_large_scans_and_sorts():
+    database_url = os.getenv("TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("TEST_DATABASE_URL not set")
+
+    engine = create_async_engine(database_url)
+    captured: list[tuple[str, str, tuple]] = []
+    current = {"key": None}
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        head = statement.lstrip()[:6].upper()
+        if current["key"] and head in {"SELECT", "WITH"}:
+            captured.append((current["key"], statement, tuple(parameters or ())))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    failures = []
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            ctx = await _seed(connection)
+            session = AsyncSession(
+                bind=connection,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            for key, scenario in sorted(SCENARIOS.items()):
+                current["key"] = key
+                await scenario(session, ctx)
+            current["key"] = None
+
+            seen = set()
+            for key, statement, parameters in captured:
+                if key in ACCEPTED_FULL_READS or (statement, parameters) in seen:
+                    continue
+                seen.add((statement, parameters))
+                raw = await connection.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters
+                )
+                document = raw.scalar()
+                document = json.loads(document) if isinstance(document, str) else document
+                for problem in find_plan_regressions(document[0]["Plan"], ROW_THRESHOLD):
+                    failures.append(f"{key}: {problem}\n    {' '.join(statement.split())}")
+            await session.close()
+            await transaction.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+        await engine.dispose()
+
+    assert not failures, "Plan regressions:\n" + "\n".join(failures)
@@ -0,0 +1,74 @@
+"""Benchmark trigram-indexed guest search against a sequential ILIKE scan.
+
+Seeds ``SEARCH_BENCHMARK_ROWS`` guests (1M by default) into a migrated test
+database inside a transaction that is rolled back afterwards, then times the
+same tenant search with the trigram index and with it dropped.
+"""
+import os
+import time
+import uuid
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.models.guest import Guest
+from app.services.search import GUEST_DOCUMENT, ranked_search
+
+
+ROWS = int(os.getenv("SEARCH_BENCHMARK_ROWS", "1000000"))
+RUNS = 5
+
+
+async def _best_of(connection, stmt) -> float:
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        await connection.execute(stmt)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+@pytest.mark.integration
+async def test_trigram_index_speeds_up_guest_search():
+    database_url = os.getenv("TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("TEST_DATABASE_URL not set")
+
+    engine = create_async_engine(database_url)
+    tenant_id = uuid.uuid4()
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            await connection.execute(
+                text("INSERT INTO tenants (id, name, slug) VALUES (:id, 'Benchmark', :slug)"),
+                {"id": tenant_id, "slug": f"benchmark-{tenant_id.hex}"},
+            )
+            await connection.execute(
+                text(
+                    "INSERT INTO guests (id, tenant_id, first_name, last_name, email, status) "
+                    "SELECT gen_random_uuid(), :tenant_id, 'Guest' || n, md5(n::text), "
+                    "'guest' || n || '@example.com', 'active' "
+                    "FROM generate_series(1, :rows) AS n"
+                ),
+                {"tenant_id": tenant_id, "rows": ROWS},
+            )
+            await connection.execute(text("ANALYZE guests"))
+
+            stmt, sort_keys = ranked_search(
+                select(Guest.id).where(Guest.tenant_id == tenant_id),
+                GUEST_DOCUMENT,
+                "guest4242",
+                (Guest.created_at, Guest.id),
+            )
+            stmt = stmt.order_by(*[key.desc() for key in sort_keys]).limit(20)
+
+            indexed = await _best_of(connection, stmt)
+            await connection.execute(text("DROP INDEX ix_guests_search_trgm"))
+            scanned = await _best_of(connection, stmt)
+            await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+    print(f"\nguest search over {ROWS} rows: indexed {indexed:.4f}s, scan {scanned:.4f}s")
+    assert indexed < scanned
@@ -0,0 +1,71 @@
+from datetime import date, datetime, timezone
+
+from app.core.config import settings
+from app.services.audit_partitions import (
+    AuditPartitionService,
+    add_months,
+    expired_partitions,
+)
+
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+class _FakeScalars:
+    def __init__(self, values) -> None:
+        self._values = values
+
+    def all(self):
+        return self._values
+
+
+class _FakeResult:
+    def __init__(self, values) -> None:
+        self._values = values
+
+    def scalars(self):
+        return _FakeScalars(self._values)
+
+
+class _FakeSession:
+    def __init__(self, partitions) -> None:
+        self.partitions = partitions
+        self.statements = []
+        self.commits = 0
+
+    async def scalar(self, stmt):
+        self.statements.append(str(stmt))
+        return 2
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt))
+        return _FakeResult(self.partitions)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_add_months_crosses_years() -> None:
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_expired_partitions_keep_the_retention_window() -> None:
+    names = ["audit_logs_p202607", "audit_logs_p202603", "audit_logs_default", "audit_logs_p202604"]
+
+    assert expired_partitions(names, NOW, 6) == ["audit_logs_p202603"]
+    assert expired_partitions(names, NOW, 0) == []
+
+
+async def test_run_creates_ahead_and_archives_expired(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "audit_log_retention_months", 6)
+    monkeypatch.setattr(settings, "audit_log_archive_schema", "audit_archive")
+    session = _FakeSession(["audit_logs_p202603", "audit_logs_p202609", "audit_logs_default"])
+
+    report = await AuditPartitionService(session).run(NOW)
+
+    assert report.created == 2
+    assert report.archived == ["audit_logs_p202603"]
+    assert "ALTER TABLE audit_logs DETACH PARTITION audit_logs_p202603" in session.statements
+    assert 'ALTER TABLE audit_logs_p202603 SET SCHEMA "audit_archive"' in session.statements
+    assert not any("DELETE" in statement for statement in session.statements)
@@ -0,0 +1,96 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.core.streaming import iter_gzip
+from app.modules.audit.writer import audit_writer
+from app.services.audit_stream import audit_stream_stmt, iter_audit_ndjson, stream_upper_bound
+
+
+UNTIL = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+class _Row:
+    def __init__(self, **values) -> None:
+        self._mapping = values
+        self.__dict__.update(values)
+
+
+async def _rows(count: int):
+    for index in range(count):
+        yield _Row(
+            id=uuid4(),
+            action=f"guest.updated.{index}",
+            changes={"status": ["pending", "active"]},
+            created_at=UNTIL,
+        )
+
+
+async def _collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_stream_reads_oldest_first_up_to_bound() -> None:
+    sql = _sql(audit_stream_stmt(UNTIL))
+
+    assert "audit_logs.created_at <= %(created_at_1)s" in sql
+    assert sql.endswith("ORDER BY audit_logs.created_at ASC, audit_logs.id ASC")
+
+
+def test_watermark_resumes_after_last_row_with_prunable_bound() -> None:
+    sql = _sql(audit_stream_stmt(UNTIL, UNTIL - timedelta(days=1), uuid4()))
+
+    assert "(audit_logs.created_at, audit_logs.id) > (" in sql
+    assert "audit_logs.created_at >= " in sql
+
+
+def test_timestamp_only_watermark_is_exclusive() -> None:
+    sql = _sql(audit_stream_stmt(UNTIL, UNTIL - timedelta(days=1)))
+
+    assert "audit_logs.created_at > " in sql
+    assert "(audit_logs.created_at, audit_logs.id)" not in sql
+
+
+def test_upper_bound_trails_now(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "audit_stream_settle_seconds", 30)
+
+    assert stream_upper_bound(UNTIL) == UNTIL - timedelta(seconds=30)
+
+
+def test_upper_bound_stops_before_unflushed_writer_rows(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "audit_stream_settle_seconds", 30)
+    queued_at = UNTIL - timedelta(minutes=5)
+    monkeypatch.setattr(audit_writer, "oldest_unflushed", lambda: queued_at)
+
+    assert stream_upper_bound(UNTIL) == queued_at - timedelta(microseconds=1)
+
+    monkeypatch.setattr(audit_writer, "oldest_unflushed", lambda: UNTIL)
+    assert stream_upper_bound(UNTIL) == UNTIL - timedelta(seconds=30)
+
+
+async def test_ndjson_keeps_changes_as_objects_and_batches_lines() -> None:
+    chunks = await _collect(iter_audit_ndjson(_rows(5), chunk_rows=2))
+
+    assert len(chunks) == 3
+    records = [json.loads(line) for line in "".join(chunks).splitlines()]
+    assert records[0]["changes"] == {"status": ["pending", "active"]}
+    assert records[4]["created_at"] == "2026-10-01T00:00:00+00:00"
+
+
+async def test_gzip_stream_round_trips() -> None:
+    body = b"".join(await _collect(iter_gzip(iter_audit_ndjson(_rows(3)))))
+
+    lines = gzip.decompress(body).decode("utf-8").splitlines()
+    assert [json.loads(line)["action"] for line in lines] == [
+        "guest.updated.0",
+        "guest.updated.1",
+        "guest.updated.2",
+    ]
@@ -0,0 +1,181 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.modules.audit.hooks import audit_event_stub
+from app.modules.audit.service import audit_log_values
+from app.modules.audit.writer import AuditWriter, audit_writer
+
+
+class _FakeSession:
+    def __init__(self, batches: list) -> None:
+        self.batches = batches
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def execute(self, stmt, rows):
+        assert "INSERT INTO audit_logs" in str(stmt.compile(dialect=postgresql.dialect()))
+        self.batches.append(list(rows))
+
+    async def commit(self) -> None:
+        return None
+
+
+class _FailingSession(_FakeSession):
+    """Fails its first ``failures`` inserts, and every insert containing a "bad." row."""
+
+    def __init__(self, batches: list, attempts: list, failures: int) -> None:
+        super().__init__(batches)
+        self.attempts = attempts
+        self.failures = failures
+
+    async def execute(self, stmt, rows):
+        self.attempts.append(len(rows))
+        if len(self.attempts) <= self.failures or any(
+            row["action"].startswith("bad.") for row in rows
+        ):
+            raise RuntimeError("insert failed")
+        await super().execute(stmt, rows)
+
+
+def _writer(batches: list, **kwargs) -> AuditWriter:
+    return AuditWriter(lambda: _FakeSession(batches), **kwargs)
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(settings, "audit_writer_retry_attempts", 3)
+    monkeypatch.setattr(settings, "audit_writer_retry_seconds", 0)
+
+
+async def test_full_batch_is_written_without_waiting_for_timer() -> None:
+    batches: list = []
+    writer = _writer(batches, batch_size=3, flush_seconds=60)
+    writer.start()
+    for index in range(3):
+        assert writer.enqueue(audit_log_values(action=f"event.{index}"))
+
+    for _ in range(20):
+        if batches:
+            break
+        await asyncio.sleep(0.01)
+    await writer.stop()
+
+    assert [[row["action"] for row in batch] for batch in batches] == [
+        ["event.0", "event.1", "event.2"]
+    ]
+    assert all(row["id"] and row["created_at"] for row in batches[0])
+
+
+async def test_partial_batch_is_written_after_flush_interval() -> None:
+    batches: list = []
+    writer = _writer(batches, batch_size=100, flush_seconds=0.02)
+    writer.start()
+    writer.enqueue(audit_log_values(action="user.updated", tenant_id=uuid4()))
+
+    await asyncio.sleep(0.1)
+
+    assert len(batches) == 1 and batches[0][0]["action"] == "user.updated"
+    await writer.stop()
+
+
+async def test_stop_drains_queued_rows() -> None:
+    batches: list = []
+    writer = _writer(batches, batch_size=2, flush_seconds=60)
+    writer.start()
+    for index in range(5):
+        writer.enqueue(audit_log_values(action=f"event.{index}"))
+
+    await writer.stop()
+
+    assert sum(len(batch) for batch in batches) == 5
+    assert max(len(batch) for batch in batches) <= 2
+    assert writer.enqueue(audit_log_values(action="late")) is False
+
+
+async def test_full_queue_rejects_rows() -> None:
+    writer = _writer([], queue_size=1, batch_size=10, flush_seconds=60)
+    writer.start()
+
+    assert writer.enqueue(audit_log_values(action="first")) is True
+    # The loop has not run yet, so the single slot is still taken.
+    assert writer.enqueue(audit_log_values(action="second")) is False
+    await writer.stop()
+
+
+async def test_failed_batch_is_retried(fast_retries) -> None:
+    batches: list = []
+    attempts: list = []
+    writer = AuditWriter(lambda: _FailingSession(batches, attempts, failures=2), batch_size=3)
+    writer.start()
+    for index in range(3):
+        writer.enqueue(audit_log_values(action=f"event.{index}"))
+
+    await writer.stop()
+
+    assert attempts == [3, 3, 3]
+    assert [len(batch) for batch in batches] == [3]
+
+
+async def test_bad_row_is_dropped_alone_after_retries(fast_retries) -> None:
+    batches: list = []
+    attempts: list = []
+    writer = AuditWriter(lambda: _FailingSession(batches, attempts, failures=0), batch_size=3)
+    writer.start()
+    for action in ("event.0", "bad.row", "event.2"):
+        writer.enqueue(audit_log_values(action=action))
+
+    await writer.stop()
+
+    assert attempts == [3, 3, 3, 1, 1, 1]
+    assert [batch[0]["action"] for batch in batches] == ["event.0", "event.2"]
+    assert writer.oldest_unflushed() is None
+
+
+async def test_oldest_unflushed_tracks_queued_rows() -> None:
+    batches: list = []
+    writer = _writer(batches, batch_size=10, flush_seconds=60)
+    writer.start()
+    assert writer.oldest_unflushed() is None
+
+    writer.enqueue(audit_log_values(action="first"))
+    writer.enqueue(audit_log_values(action="second"))
+    oldest = writer.oldest_unflushed()
+
+    await writer.stop()
+
+    assert oldest is not None
+    assert batches[0][0]["created_at"] == oldest
+    assert writer.oldest_unflushed() is None
+
+
+async def test_stub_queues_non_critical_events_while_writer_runs() -> None:
+    session = MagicMock()
+    with patch.object(audit_writer, "enqueue", return_value=True) as enqueue, patch(
+        "app.modules.audit.service.append_audit_log", new_callable=AsyncMock
+    ) as append:
+        await audit_event_stub(action="guest.viewed", session=session)
+
+    append.assert_not_called()
+    assert enqueue.call_args.args[0]["action"] == "guest.viewed"
+
+
+@pytest.mark.parametrize("critical, queued", [(True, True), (False, False)])
+async def test_stub_writes_in_transaction_when_critical_or_queue_full(critical, queued) -> None:
+    session = MagicMock()
+    with patch.object(audit_writer, "enqueue", return_value=queued) as enqueue, patch(
+        "app.modules.audit.service.append_audit_log", new_callable=AsyncMock
+    ) as append:
+        await audit_event_stub(action="password.changed", session=session, critical=critical)
+
+    append.assert_called_once()
+    assert append.call_args.kwargs["session"] is session
+    assert enqueue.called is not critical
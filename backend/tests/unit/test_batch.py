@@ -0,0 +1,117 @@
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from pydantic import ValidationError
+
+from app.core.database import get_session
+from app.modules.auth.dependencies import CurrentUser, get_current_user
+from app.modules.batch.schemas import BatchRequestItem
+from app.modules.batch.service import dispatch_batch
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.rollbacks = 0
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+def _user() -> CurrentUser:
+    return CurrentUser(
+        id=uuid4(),
+        email="manager@hotel.com",
+        first_name="Hotel",
+        last_name="Manager",
+        user_type="hotel",
+        tenant_id=uuid4(),
+        roles=["hotel_manager"],
+        permissions=["hotel:rooms:read"],
+        impersonation=None,
+    )
+
+
+def _app(session: _FakeSession, user: CurrentUser) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/hotel/rooms")
+    async def rooms(
+        limit: int = 20,
+        current_user: CurrentUser = Depends(get_current_user),
+        db=Depends(get_session),
+    ):
+        return {"limit": limit, "user": current_user.email, "shared": db is session}
+
+    @app.get("/api/hotel/rooms/{room_id}")
+    async def room(room_id: str):
+        raise HTTPException(status_code=404, detail="Room not found")
+
+    @app.get("/api/hotel/reports/export")
+    async def export():
+        return PlainTextResponse("a,b\n")
+
+    @app.get("/api/hotel/broken")
+    async def broken():
+        raise RuntimeError("boom")
+
+    @app.get("/api/probe")
+    async def probe(request: Request):
+        leaked = getattr(request.state, "leaked", False)
+        request.state.leaked = True
+        return {"leaked": leaked}
+
+    @app.post("/api/batch")
+    async def batch(request: Request):
+        request.state.current_user = user
+        payload = await request.json()
+        return await dispatch_batch(request.app.router, request.scope, session, payload)
+
+    return app
+
+
+async def test_sub_requests_share_session_and_user_and_report_per_item_status() -> None:
+    session = _FakeSession()
+    user = _user()
+    app = _app(session, user)
+    paths = [
+        "/hotel/rooms?limit=5",
+        "/hotel/rooms/missing",
+        "/hotel/unknown",
+        "/hotel/reports/export",
+        "/hotel/broken",
+        "/hotel/rooms",
+    ]
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app, raise_app_exceptions=False),
+        base_url="http://test",
+    ) as client:
+        response = await client.post("/api/batch", json=paths)
+
+    results = response.json()
+    assert [result["status"] for result in results] == [200, 404, 404, 406, 500, 200]
+    assert results[0]["body"] == {"limit": 5, "user": user.email, "shared": True}
+    assert results[1]["body"] == {"detail": "Room not found"}
+    assert "text/plain" in results[3]["body"]["detail"]
+    assert results[5]["body"]["limit"] == 20
+    assert session.rollbacks == 1
+
+
+async def test_sub_request_state_is_isolated() -> None:
+    app = _app(_FakeSession(), _user())
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post("/api/batch", json=["/probe", "/probe"])
+
+    assert [result["body"] for result in response.json()] == [{"leaked": False}, {"leaked": False}]
+
+
+@pytest.mark.parametrize("path", ["hotel/rooms", "http://evil.test/api/hotel", "/batch", "/batch/"])
+def test_batch_item_rejects_foreign_or_nested_paths(path) -> None:
+    with pytest.raises(ValidationError):
+        BatchRequestItem(path=path)
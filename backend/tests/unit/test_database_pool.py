@@ -0,0 +1,127 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.pool import NullPool
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.config import settings
+from app.core.pool import (
+    InstrumentedQueuePool,
+    check_pool_liveness,
+    engine_options,
+    pool_limits,
+    pool_metrics,
+    pool_status,
+)
+
+
+class _Connection:
+    def rollback(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    pool_metrics.reset()
+    yield
+    pool_metrics.reset()
+
+
+def test_direct_profile_pools_and_caches_statements(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "database_statement_cache_size", 250)
+
+    options = engine_options()
+
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["connect_args"] == {
+        "statement_cache_size": 250,
+        "prepared_statement_cache_size": 250,
+    }
+    assert options["pool_pre_ping"] is False
+
+
+def test_pgbouncer_profile_disables_prepared_statement_reuse(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "database_pool_profile", "pgbouncer")
+
+    connect_args = engine_options()["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+
+def test_zero_pool_size_disables_pooling(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "database_pool_size", 0)
+
+    options = engine_options()
+
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+
+
+def test_disabled_liveness_falls_back_to_pre_ping(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "database_pool_liveness_seconds", 0)
+
+    assert engine_options()["pool_pre_ping"] is True
+
+
+def test_connection_budget_is_split_across_worker_processes(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "database_pool_size", 10)
+    monkeypatch.setattr(settings, "database_max_overflow", 10)
+    monkeypatch.setattr(settings, "database_max_connections", 24)
+    monkeypatch.setattr(settings, "web_concurrency", 4)
+
+    assert pool_limits() == (6, 0)
+
+    monkeypatch.setattr(settings, "database_pool_size", 4)
+    assert pool_limits() == (4, 2)
+
+
+async def test_checkouts_record_wait_in_use_and_timeouts() -> None:
+    pool = InstrumentedQueuePool(_Connection, pool_size=1, max_overflow=0, timeout=0.01)
+
+    held = await greenlet_spawn(pool.connect)
+    status = pool_status(pool)
+    assert (status["checked_out"], status["checkouts"]) == (1, 1)
+
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    held.close()
+
+    status = pool_status(pool)
+    assert (status["checked_out"], status["checked_in"]) == (0, 1)
+    assert status["checkout_timeouts"] == 1
+    assert status["checkout_wait_ms_max"] >= 0
+
+
+class _ProbeConnection:
+    async def exec_driver_sql(self, _sql: str) -> None:
+        return None
+
+
+def _engine(pool: InstrumentedQueuePool) -> SimpleNamespace:
+    @asynccontextmanager
+    async def connect():
+        fairy = await greenlet_spawn(pool.connect)
+        try:
+            yield _ProbeConnection()
+        finally:
+            fairy.close()
+
+    return SimpleNamespace(sync_engine=SimpleNamespace(pool=pool), connect=connect)
+
+
+async def test_liveness_probe_is_not_counted_as_a_checkout() -> None:
+    pool = InstrumentedQueuePool(_Connection, pool_size=1, max_overflow=0)
+    (await greenlet_spawn(pool.connect)).close()
+
+    assert await check_pool_liveness(_engine(pool)) is True
+
+    status = pool_status(pool)
+    assert (status["checkouts"], status["checked_in"]) == (1, 1)
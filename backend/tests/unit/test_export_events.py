@@ -0,0 +1,86 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.core import events
+from app.core.events import EventBroker, export_event_payload, format_sse, iter_export_events
+
+
+class _Request:
+    def __init__(self) -> None:
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+def test_broker_fans_out_per_key_and_drops_oldest() -> None:
+    broker = EventBroker(queue_size=2)
+    mine = broker.subscribe("user-1")
+    other = broker.subscribe("user-2")
+
+    for index in range(3):
+        broker.publish("user-1", {"n": index})
+
+    assert [mine.get_nowait()["n"] for _ in range(mine.qsize())] == [1, 2]
+    assert other.empty()
+
+    broker.unsubscribe("user-1", mine)
+    broker.publish("user-1", {"n": 4})
+    assert mine.empty()
+
+
+def test_export_event_payload_serializes_ids() -> None:
+    export = SimpleNamespace(
+        id=uuid.uuid4(),
+        scope="hotel",
+        tenant_id=uuid.uuid4(),
+        requested_by=None,
+        report_code="guest_activity",
+        export_format="csv",
+        status="processing",
+        file_name=None,
+        shards_total=4,
+        shards_completed=1,
+        rows_total=1000,
+        rows_processed=250,
+        error_message=None,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        completed_at=None,
+    )
+
+    payload = export_event_payload(export)
+
+    assert payload["id"] == str(export.id)
+    assert payload["requested_by"] is None
+    assert json.loads(json.dumps(payload))["rows_processed"] == 250
+
+
+def test_format_sse() -> None:
+    assert format_sse("progress", {"id": "x"}, event_id="x") == 'event: progress\nid: x\ndata: {"id":"x"}\n\n'
+
+
+async def test_iter_export_events_filters_and_names_events(monkeypatch) -> None:
+    monkeypatch.setattr(events.settings, "export_events_heartbeat_seconds", 0.05)
+    broker = EventBroker()
+    request = _Request()
+
+    def render(event: dict) -> dict | None:
+        return None if event.get("hidden") else event
+
+    stream = iter_export_events(request, "user-1", render, broker=broker)
+    assert await stream.__anext__() == f"retry: {events.SSE_RETRY_MS}\n\n"
+
+    next_chunk = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+    broker.publish("user-1", {"id": "a", "status": "processing", "hidden": True})
+    broker.publish("user-1", {"id": "a", "status": "completed"})
+    assert (await next_chunk).startswith("event: completed\nid: a\n")
+
+    assert await stream.__anext__() == ": keep-alive\n\n"
+    request.disconnected = True
+    chunks = [chunk async for chunk in stream]
+    assert chunks == []
+    assert broker._subscribers == {}
@@ -0,0 +1,102 @@
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from app.core.storage import ReportStorage
+from app.services.export_lifecycle import ExportLifecycleReport, ExportLifecycleService
+
+
+class _Result:
+    def __init__(self, values):
+        self._values = values
+
+    def scalars(self):
+        return iter(self._values)
+
+
+class _FakeSession:
+    def __init__(self, *results: list):
+        self._results = list(results)
+
+    async def execute(self, _stmt):
+        return _Result(self._results.pop(0))
+
+
+def _write(path: Path, size: int, age_seconds: int = 0) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    if age_seconds:
+        stamp = time.time() - age_seconds
+        os.utime(path, (stamp, stamp))
+    return path
+
+
+def test_partition_path_shards_by_owner_and_day(tmp_path: Path) -> None:
+    storage = ReportStorage(str(tmp_path))
+    when = datetime(2026, 3, 7, tzinfo=timezone.utc)
+
+    assert storage.partition_path("abc", when) == str(tmp_path / "tenants" / "abc" / "2026" / "03" / "07")
+    assert storage.partition_path(None, when) == str(tmp_path / "platform" / "2026" / "03" / "07")
+
+
+def test_remove_artifact_prunes_empty_directories(tmp_path: Path) -> None:
+    storage = ReportStorage(str(tmp_path))
+    artifact = _write(tmp_path / "tenants" / "abc" / "2026" / "03" / "07" / "r.csv", 10)
+
+    assert storage.remove_artifact(str(artifact)) == 10
+    assert storage.remove_artifact(str(artifact)) == 0
+    assert not (tmp_path / "tenants").exists()
+    assert tmp_path.exists()
+
+
+async def test_remove_orphans_keeps_referenced_and_recent_files(tmp_path: Path) -> None:
+    storage = ReportStorage(str(tmp_path))
+    referenced = _write(tmp_path / "platform" / "kept.csv", 5, age_seconds=7200)
+    orphan = _write(tmp_path / "platform" / "orphan.csv", 7, age_seconds=7200)
+    recent = _write(tmp_path / "platform" / "fresh.csv", 3)
+
+    service = ExportLifecycleService(_FakeSession([str(referenced)], []), storage)
+    report = ExportLifecycleReport()
+    await service.remove_orphans(datetime.now(timezone.utc), report)
+
+    assert referenced.exists() and recent.exists()
+    assert not orphan.exists()
+    assert report.orphans_removed == 1
+    assert report.bytes_reclaimed == 7
+
+
+async def test_remove_orphans_leaves_bundles_and_running_parts(tmp_path: Path) -> None:
+    storage = ReportStorage(str(tmp_path))
+    bundle = _write(tmp_path / "bundles" / "exports.zip", 3, age_seconds=7200)
+    running = _write(tmp_path / "parts" / "running" / "part-0000.csv", 5, age_seconds=7200)
+    stale = _write(tmp_path / "parts" / "crashed" / "part-0000.csv", 7, age_seconds=7200)
+
+    service = ExportLifecycleService(_FakeSession([], ["running"]), storage)
+    report = ExportLifecycleReport()
+    await service.remove_orphans(datetime.now(timezone.utc), report)
+
+    assert bundle.exists() and running.exists()
+    assert not stale.exists()
+    assert report.orphans_removed == 1
+
+
+async def test_expire_marks_rows_before_deleting_files(tmp_path: Path) -> None:
+    storage = ReportStorage(str(tmp_path))
+    artifact = _write(tmp_path / "platform" / "old.csv", 11)
+    events: list[str] = []
+
+    class _Session:
+        async def execute(self, _stmt):
+            events.append("update")
+
+        async def commit(self):
+            events.append("commit")
+
+    service = ExportLifecycleService(_Session(), storage)
+    freed = await service._expire([SimpleNamespace(id=1, file_path=str(artifact))])
+
+    assert events == ["update", "commit"]
+    assert freed == 11
+    assert not artifact.exists()
@@ -0,0 +1,90 @@
+import gzip
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import Column, DateTime, MetaData, Table, select
+from sqlalchemy.dialects import postgresql
+
+from app.core.storage import ReportStorage
+from app.modules.hotel.reports.service import HotelReportService
+from app.services.base import DateShard, plan_date_shards
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 1, 5, tzinfo=timezone.utc)
+
+
+def test_plan_date_shards_covers_range_in_order() -> None:
+    shards = plan_date_shards(START, END, 4)
+
+    assert [shard.lower for shard in shards] == [START + timedelta(days=day) for day in range(4)]
+    assert shards[-1].upper == END
+    assert [shard.inclusive_upper for shard in shards] == [False, False, False, True]
+
+
+def test_plan_date_shards_descending_with_nulls() -> None:
+    shards = plan_date_shards(START, END, 2, descending=True, include_nulls=True)
+
+    assert shards[0].upper == END and shards[0].inclusive_upper
+    assert shards[1].lower == START
+    assert shards[-1] == DateShard(lower=None, upper=None)
+
+
+def test_plan_date_shards_single_instant() -> None:
+    shards = plan_date_shards(START, START, 8)
+
+    assert shards == [DateShard(lower=START, upper=START, inclusive_upper=True)]
+
+
+def test_date_shard_clause() -> None:
+    table = Table("t", MetaData(), Column("created_at", DateTime(timezone=True)))
+    column = table.c.created_at
+
+    def compiled(shard: DateShard) -> str:
+        return str(select(column).where(shard.clause(column)).compile(dialect=postgresql.dialect()))
+
+    assert "t.created_at < " in compiled(DateShard(START, END))
+    assert "t.created_at <= " in compiled(DateShard(START, END, inclusive_upper=True))
+    assert "t.created_at IS NULL" in compiled(DateShard(None, None))
+
+
+def test_merge_parts_concatenates_gzip_members(tmp_path: Path) -> None:
+    storage = ReportStorage(str(tmp_path), compress=True)
+    columns = [{"key": "name", "label": "Name"}]
+    parts = [
+        storage.save_part(storage.part_path("job", "csv", 0), "csv", columns, [{"name": "a"}], include_header=True),
+        storage.save_part(storage.part_path("job", "csv", 1), "csv", columns, [{"name": "b"}]),
+    ]
+
+    file_path, file_name = storage.merge_parts("guest_activity", "csv", parts)
+
+    assert file_name.endswith(".csv")
+    with gzip.open(file_path, "rt", encoding="utf-8") as handle:
+        assert handle.read().splitlines() == ["Name", "a", "b"]
+    assert not (tmp_path / "parts" / "job").exists()
+
+
+class _NoQuerySession:
+    async def execute(self, _stmt):
+        raise AssertionError("reports not ordered by a date must not be planned")
+
+
+async def test_reports_not_ordered_by_a_date_are_not_sharded() -> None:
+    service = HotelReportService(_NoQuerySession())
+
+    for report_code in ("room_status", "kiosk_health"):
+        assert await service.plan_export_shards(uuid4(), report_code, 4) == []
+
+
+def test_guest_activity_shards_on_its_leading_sort_column() -> None:
+    shard = DateShard(START, END)
+    stmt, _, _ = HotelReportService(None)._ordered_rows_stmt(uuid4(), "guest_activity", None, None, None)
+    sql = str(
+        stmt.where(shard.clause(HotelReportService._shard_column("guest_activity"))).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert "guests.check_in_at >= " in sql and "guests.check_in_at < " in sql
+    assert "ORDER BY coalesce(guests.check_in_at, " in sql
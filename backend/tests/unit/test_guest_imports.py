@@ -0,0 +1,125 @@
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import settings
+from app.models.guest_import import GuestImport
+from app.modules.hotel.guests.service import (
+    GuestImportService,
+    read_import_records,
+    staging_record,
+)
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    def add(self, _item) -> None:
+        return None
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def refresh(self, _item) -> None:
+        return None
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def _job(path, import_format: str) -> GuestImport:
+    return GuestImport(
+        id=uuid4(),
+        tenant_id=uuid4(),
+        import_format=import_format,
+        status="processing",
+        file_path=str(path),
+        rows_processed=0,
+        rows_imported=0,
+        rows_failed=0,
+    )
+
+
+def test_csv_records_map_blank_cells_to_none(tmp_path) -> None:
+    path = tmp_path / "guests.csv"
+    path.write_text("﻿first_name,last_name,email\nAda,Lovelace,\nAlan,Turing,alan@example.com\n")
+
+    records = list(read_import_records(str(path), "csv"))
+
+    assert records == [
+        (1, {"first_name": "Ada", "last_name": "Lovelace", "email": None}),
+        (2, {"first_name": "Alan", "last_name": "Turing", "email": "alan@example.com"}),
+    ]
+
+
+def test_ndjson_records_report_bad_lines_by_line_number(tmp_path) -> None:
+    path = tmp_path / "guests.ndjson"
+    path.write_text('{"first_name": "Ada", "last_name": "Lovelace"}\n\nnot json\n[1, 2]\n')
+
+    records = list(read_import_records(str(path), "ndjson"))
+
+    assert records[0][0] == 1
+    assert records[1:] == [(3, "Invalid JSON"), (4, "Expected a JSON object")]
+
+
+def test_staging_record_validates_against_guest_create() -> None:
+    staged = staging_record(7, {"first_name": "Ada", "last_name": "Lovelace"})
+    assert staged[0] == 7 and staged[2:5] == ("Ada", "Lovelace", None)
+    assert staged[6] == "active"
+
+    assert staging_record(8, {"first_name": "Ada"}) == "last_name: Field required"
+
+
+async def test_run_loads_in_batches_and_records_errors(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "guest_import_batch_size", 2)
+    monkeypatch.setattr(settings, "guest_import_max_errors", 2)
+    path = tmp_path / "guests.csv"
+    path.write_text(
+        "first_name,last_name,email\n"
+        "Ada,Lovelace,ada@example.com\n"
+        ",Missing,\n"
+        "Alan,Turing,ada@example.com\n"
+        "Grace,Hopper,\n"
+        "Bad,Row,x" + "x" * 300 + "\n"
+    )
+    batches = []
+
+    async def fake_load(tenant_id, rows):
+        batches.append([row[0] for row in rows])
+        return [row[0] for row in rows if row[0] == 3]
+
+    session = _FakeSession()
+    service = GuestImportService(session)
+    monkeypatch.setattr(service, "_load_guests", fake_load)
+    job = _job(path, "csv")
+
+    await service.run(job)
+
+    assert batches == [[1], [3, 4]]
+    assert (job.rows_processed, job.rows_imported, job.rows_failed) == (5, 2, 3)
+    assert job.errors == [
+        {"row": 2, "message": "first_name: Input should be a valid string"},
+        {"row": 3, "message": "Guest email already exists"},
+    ]
+    assert job.status == "completed" and job.completed_at is not None
+    assert not path.exists()
+
+
+async def test_create_spools_body_and_rejects_oversized_uploads(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "guest_imports_storage_path", str(tmp_path))
+    monkeypatch.setattr(settings, "guest_import_max_bytes", 10)
+    service = GuestImportService(_FakeSession())
+    tenant_id = uuid4()
+
+    job = await service.create(tenant_id, None, "ndjson", _chunks(b"{}\n", b"{}\n"))
+    assert job.status == "pending" and job.file_size == 6
+    assert (tmp_path / str(tenant_id) / f"{job.id}.ndjson").read_bytes() == b"{}\n{}\n"
+
+    with pytest.raises(ValueError, match="too large"):
+        await service.create(tenant_id, None, "csv", _chunks(b"x" * 8, b"x" * 8))
+    with pytest.raises(ValueError, match="Unsupported import format"):
+        await service.create(tenant_id, None, "xlsx", _chunks(b"x"))
+    assert len(list((tmp_path / str(tenant_id)).iterdir())) == 1
@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.guest import Guest
+from app.models.helpdesk_ticket import HelpdeskTicket
+from app.models.room import Room
+from app.modules.hotel.search.service import HotelSearchService
+from app.services.search import document_text, index_document, prefix_query
+
+
+class _FakeResult:
+    def __init__(self, rows=()) -> None:
+        self._rows = list(rows)
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    def __init__(self, rows=()) -> None:
+        self.rows = rows
+        self.executed = []
+
+    async def execute(self, stmt):
+        self.executed.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return _FakeResult(self.rows)
+
+
+def test_prefix_query_quotes_each_word() -> None:
+    assert prefix_query("Ann  Smith") == "'ann':* & 'smith':*"
+    assert prefix_query("ann@example.com!") == "'ann@example.com':*"
+    assert prefix_query("'|&!") is None
+
+
+def test_document_text_skips_missing_parts() -> None:
+    guest = Guest(first_name="Ann", last_name="Lee", email=None, phone="555")
+    room = Room(number="101", room_type="Suite", floor=None, description="Sea view")
+
+    assert document_text(guest) == ("Ann Lee", "555")
+    assert document_text(room) == ("101", "Suite Sea view")
+
+
+async def test_index_document_upserts_weighted_vector() -> None:
+    session = _FakeSession()
+    guest = Guest(id=uuid4(), tenant_id=uuid4(), first_name="Ann", last_name="Lee")
+
+    await index_document(session, guest)
+
+    sql = session.executed[0]
+    assert "INSERT INTO search_documents" in sql
+    assert "setweight(to_tsvector('simple'::regconfig" in sql
+    assert "ON CONFLICT (entity_type, entity_id) DO UPDATE" in sql
+
+
+async def test_ticket_without_tenant_is_removed_from_index() -> None:
+    session = _FakeSession()
+
+    await index_document(session, HelpdeskTicket(id=uuid4(), tenant_id=None, subject="Help"))
+
+    assert session.executed[0].startswith("DELETE FROM search_documents")
+
+
+async def test_search_is_one_query_grouped_by_entity_type() -> None:
+    guest_id, room_id = uuid4(), uuid4()
+    rows = [
+        SimpleNamespace(entity_type="guests", entity_id=guest_id, title="Ann Lee",
+                        headline="<mark>Ann</mark> Lee", rank=0.5),
+        SimpleNamespace(entity_type="rooms", entity_id=room_id, title="101",
+                        headline="101 <mark>Annex</mark>", rank=0.1),
+    ]
+    session = _FakeSession(rows)
+
+    results = await HotelSearchService(session).search(
+        uuid4(), "ann", ["guests", "rooms", "incidents"], limit=3
+    )
+
+    assert len(session.executed) == 1
+    sql = session.executed[0]
+    assert "row_number() OVER (PARTITION BY search_documents.entity_type" in sql
+    assert "search_documents.document @@ to_tsquery('simple'::regconfig" in sql
+    assert "ts_headline(" in sql
+    assert results["guests"][0]["headline"] == "<mark>Ann</mark> Lee"
+    assert results["rooms"][0]["entity_id"] == room_id
+    assert results["incidents"] == []
+
+
+async def test_search_without_searchable_words_skips_query() -> None:
+    session = _FakeSession()
+
+    results = await HotelSearchService(session).search(uuid4(), "!!", ["guests"])
+
+    assert results == {"guests": []}
+    assert session.executed == []
@@ -0,0 +1,99 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.models.kiosk import Kiosk
+from app.models.room import Room
+from app.modules.admin.kiosks.service import KioskService
+from app.modules.hotel.rooms.schemas import RoomCreate
+from app.modules.hotel.rooms.service import RoomService
+from app.services.base import insert_returning
+
+
+class _UniqueViolation(Exception):
+    def __init__(self, constraint_name: str) -> None:
+        super().__init__(f"duplicate key value violates unique constraint {constraint_name!r}")
+        self.constraint_name = constraint_name
+
+
+class _AdaptedError(Exception):
+    """Stands in for SQLAlchemy's adapted asyncpg error, which chains the original."""
+
+
+def _integrity_error(constraint_name: str) -> IntegrityError:
+    adapted = _AdaptedError()
+    adapted.__cause__ = _UniqueViolation(constraint_name)
+    return IntegrityError("INSERT", {}, adapted)
+
+
+class _FakeSession:
+    def __init__(self, violation: str | None = None) -> None:
+        self.violation = violation
+        self.statements: list[str] = []
+        self.rollbacks = 0
+        self.commits = 0
+
+    async def scalar(self, stmt, execution_options=None):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        if self.violation:
+            raise _integrity_error(self.violation)
+        values = {column.key: value.value for column, value in stmt._values.items()}
+        return stmt.entity_description["type"](id=uuid4(), **values)
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+async def test_room_create_is_a_single_insert_returning() -> None:
+    session = _FakeSession()
+    payload = RoomCreate(number="101", room_type="double", currency="eur")
+
+    room = await RoomService(session).create(uuid4(), payload)
+
+    assert isinstance(room, Room) and room.currency == "EUR"
+    assert session.statements[0].startswith("INSERT INTO rooms")
+    assert "RETURNING rooms.id" in session.statements[0]
+    assert "INSERT INTO search_documents" in session.statements[1]
+    assert len(session.statements) == 2 and session.commits == 1
+
+
+async def test_unique_violation_maps_to_value_error_and_rolls_back() -> None:
+    session = _FakeSession("ix_rooms_tenant_number")
+
+    with pytest.raises(ValueError, match="Room number already exists"):
+        await RoomService(session).create(uuid4(), RoomCreate(number="101", room_type="double"))
+
+    assert session.rollbacks == 1 and session.commits == 0
+
+
+async def test_foreign_key_violation_maps_to_tenant_not_found() -> None:
+    class _Payload:
+        tenant_id = uuid4()
+        name = "Lobby"
+        location = None
+        status = "active"
+        device_id = "dev-1"
+
+    session = _FakeSession("kiosks_tenant_id_fkey")
+
+    with pytest.raises(ValueError, match="Tenant not found"):
+        await KioskService(session).create(_Payload())
+
+
+async def test_unmapped_violation_is_not_swallowed() -> None:
+    session = _FakeSession("kiosks_pkey")
+
+    with pytest.raises(IntegrityError):
+        await insert_returning(
+            session, Kiosk, {"name": "Lobby"}, {"ix_kiosks_device_id": "Device ID already exists"}
+        )
+
+    assert session.rollbacks == 0
@@ -0,0 +1,93 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.modules.admin.reports.service import (
+    AGING_BUCKETS_BY_CODE,
+    INVOICE_AGING_BUCKETS,
+    ReportService,
+    aging_bucket_clause,
+)
+
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+def _sql(clause) -> str:
+    return str(
+        clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+def test_buckets_are_contiguous() -> None:
+    assert INVOICE_AGING_BUCKETS[0].min_days is None
+    assert INVOICE_AGING_BUCKETS[-1].max_days is None
+    for previous, following in zip(INVOICE_AGING_BUCKETS, INVOICE_AGING_BUCKETS[1:]):
+        assert previous.max_days == following.min_days
+
+
+def test_overdue_bucket_is_a_due_at_range_on_unpaid_invoices() -> None:
+    sql = _sql(aging_bucket_clause(AGING_BUCKETS_BY_CODE["31_60"], NOW))
+    assert "invoices.status != 'paid'" in sql
+    assert f"invoices.due_at <= '{NOW - timedelta(days=31)}'" in sql
+    assert f"invoices.due_at > '{NOW - timedelta(days=61)}'" in sql
+    assert "IS NULL" not in sql
+
+
+def test_current_bucket_includes_invoices_without_due_date() -> None:
+    sql = _sql(aging_bucket_clause(AGING_BUCKETS_BY_CODE["current"], NOW))
+    assert "invoices.due_at IS NULL OR invoices.due_at >" in sql
+
+
+def test_oldest_bucket_has_no_upper_bound() -> None:
+    sql = _sql(aging_bucket_clause(AGING_BUCKETS_BY_CODE["90_plus"], NOW))
+    assert f"invoices.due_at <= '{NOW - timedelta(days=91)}'" in sql
+    assert "invoices.due_at >" not in sql
+
+
+def test_aging_by_tenant_is_one_grouped_query() -> None:
+    stmt = ReportService(session=None)._aging_by_tenant_stmt(NOW)
+    sql = _sql(stmt)
+    assert sql.count("GROUP BY") == 1
+    assert sql.count("FILTER (WHERE") == 2 * len(INVOICE_AGING_BUCKETS)
+
+
+def test_aging_tenant_row_totals() -> None:
+    values = {"tenant_id": uuid.uuid4(), "hotel_name": "Harbor"}
+    for index, bucket in enumerate(INVOICE_AGING_BUCKETS):
+        values[f"count_{bucket.code}"] = index
+        values[f"cents_{bucket.code}"] = index * 100
+    row = SimpleNamespace(_mapping=values, **{"tenant_id": values["tenant_id"], "hotel_name": "Harbor"})
+
+    result = ReportService._aging_tenant_row(row)
+
+    assert result["buckets"]["90_plus"] == {"count": 4, "amount_cents": 400}
+    assert result["total_outstanding_cents"] == 1000
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    async def scalar(self, stmt):
+        self.statements.append(_sql(stmt))
+        return 7
+
+    async def execute(self, stmt):
+        self.statements.append(_sql(stmt))
+        return SimpleNamespace(one=lambda: (2, 4500))
+
+
+async def test_invoice_metrics_filter_in_where_clauses() -> None:
+    session = _RecordingSession()
+
+    metrics = await ReportService(session)._invoice_metrics(NOW - timedelta(days=30), NOW)
+
+    assert [metric["value"] for metric in metrics] == [7, 2, 4500]
+    total_sql, unpaid_sql = session.statements
+    assert "WHERE invoices.issued_at >= " in total_sql and "FILTER" not in total_sql
+    # Same predicate as the ix_invoices_unpaid_* partial indexes.
+    assert "WHERE invoices.status != 'paid'" in unpaid_sql
+    assert "issued_at" not in unpaid_sql
@@ -0,0 +1,143 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.guest import Guest
+from app.services.base import (
+    InvalidCursorError,
+    apply_keyset,
+    decode_cursor,
+    encode_cursor,
+    fetch_keyset_page,
+    split_keyset_page,
+)
+
+
+class _Row(tuple):
+    def __getattr__(self, name: str):
+        if name.startswith("_keyset_"):
+            return self[-2 + int(name.rsplit("_", 1)[1])]
+        raise AttributeError(name)
+
+
+class _FakeResult:
+    def __init__(self, rows) -> None:
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    def __init__(self, rows) -> None:
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _FakeResult(self.rows)
+
+
+def test_cursor_round_trip_preserves_types() -> None:
+    created_at = datetime(2026, 2, 1, 12, 30, tzinfo=timezone.utc)
+    row_id = uuid4()
+
+    cursor = encode_cursor([created_at, row_id, "101", 7])
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 4) == [created_at, row_id, "101", 7]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!!", "e30", encode_cursor(["a", "b"])])
+def test_decode_cursor_rejects_malformed_values(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 3)
+
+
+def test_decode_cursor_rejects_bad_typed_value() -> None:
+    cursor = encode_cursor([{"dt": "yesterday"}])
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 1)
+
+
+def test_apply_keyset_descending_uses_row_comparison() -> None:
+    cursor = encode_cursor([datetime(2026, 1, 1, tzinfo=timezone.utc), uuid4()])
+    stmt = apply_keyset(
+        select(Guest.first_name),
+        (Guest.created_at, Guest.id),
+        descending=True,
+        cursor=cursor,
+        limit=20,
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "(guests.created_at, guests.id) <" in sql
+    assert "ORDER BY guests.created_at DESC, guests.id DESC" in sql
+    assert "_keyset_1" in sql
+
+
+def test_split_keyset_page_trims_look_ahead_row() -> None:
+    rows = [SimpleNamespace(_keyset_0=index) for index in range(4)]
+
+    page, next_cursor = split_keyset_page(rows, 3, 1)
+
+    assert [row._keyset_0 for row in page] == [0, 1, 2]
+    assert decode_cursor(next_cursor, 1) == [2]
+
+
+def test_split_keyset_page_last_page_has_no_cursor() -> None:
+    rows = [SimpleNamespace(_keyset_0=index) for index in range(2)]
+
+    page, next_cursor = split_keyset_page(rows, 3, 1)
+
+    assert len(page) == 2
+    assert next_cursor is None
+
+
+def _guest_rows(count: int):
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [_Row((f"guest-{index}", created_at, uuid4())) for index in range(count)]
+
+
+async def test_fetch_keyset_page_unwraps_entities_and_builds_cursor() -> None:
+    session = _FakeSession(_guest_rows(3))
+
+    items, next_cursor = await fetch_keyset_page(
+        session, select(Guest), (Guest.created_at, Guest.id), limit=2
+    )
+
+    assert items == ["guest-0", "guest-1"]
+    assert decode_cursor(next_cursor, 2)[1] == session.rows[1][2]
+
+
+async def test_fetch_keyset_page_cursor_replaces_offset() -> None:
+    cursor = encode_cursor([datetime(2026, 1, 1, tzinfo=timezone.utc), uuid4()])
+    session = _FakeSession(_guest_rows(1))
+
+    await fetch_keyset_page(
+        session, select(Guest), (Guest.created_at, Guest.id), limit=20, page=50, cursor=cursor
+    )
+    await fetch_keyset_page(session, select(Guest), (Guest.created_at, Guest.id), limit=20, page=3)
+
+    keyset_sql, offset_sql = (
+        str(stmt.compile(dialect=postgresql.dialect())) for stmt in session.statements
+    )
+    assert "OFFSET" not in keyset_sql
+    assert "(guests.created_at, guests.id) <" in keyset_sql
+    assert "OFFSET" in offset_sql
+
+
+async def test_fetch_keyset_page_keeps_wide_rows_as_tuples() -> None:
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    session = _FakeSession([_Row(("kiosk", "Harbor Hotel", created_at, uuid4()))])
+
+    items, next_cursor = await fetch_keyset_page(
+        session, select(Guest, Guest.email), (Guest.created_at, Guest.id), limit=20
+    )
+
+    assert items == [("kiosk", "Harbor Hotel")]
+    assert next_cursor is None
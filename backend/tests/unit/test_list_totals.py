@@ -0,0 +1,142 @@
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.explain import Explain
+from app.models.guest import Guest
+from app.services.base import encode_cursor, list_counts, paginate
+
+
+SORT_KEYS = (Guest.created_at, Guest.id)
+
+
+class _Row(tuple):
+    def __getattr__(self, name: str):
+        if name.startswith("_keyset_"):
+            return self[-2 + int(name.rsplit("_", 1)[1])]
+        raise AttributeError(name)
+
+
+class _FakeResult:
+    def __init__(self, rows) -> None:
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    def __init__(self, rows=(), estimate: int = 0, exact: int = 0) -> None:
+        self.rows = list(rows)
+        self.estimate = estimate
+        self.exact = exact
+        self.executed = []
+        self.explained = 0
+        self.counted = 0
+
+    async def execute(self, stmt):
+        self.executed.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return _FakeResult(self.rows)
+
+    async def scalar(self, stmt):
+        if isinstance(stmt, Explain):
+            self.explained += 1
+            return json.dumps([{"Plan": {"Plan Rows": self.estimate}}])
+        self.counted += 1
+        return self.exact
+
+
+def _rows(count: int, total: int | None = None):
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    extra = (total,) if total is not None else ()
+    return [_Row((f"guest-{index}", *extra, created_at, uuid4())) for index in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def _reset_counts(monkeypatch):
+    monkeypatch.setattr(settings, "list_count_estimate_threshold", 1000)
+    list_counts.clear()
+    yield
+    list_counts.clear()
+
+
+async def test_include_total_false_skips_counting() -> None:
+    session = _FakeSession(_rows(2))
+
+    listing = await paginate(session, select(Guest), SORT_KEYS, limit=20, include_total=False)
+
+    assert listing.items == ["guest-0", "guest-1"]
+    assert listing.total is None
+    assert session.explained == 0 and session.counted == 0
+    assert "OVER" not in session.executed[0]
+
+
+async def test_large_unfiltered_list_uses_planner_estimate() -> None:
+    session = _FakeSession(_rows(2), estimate=250_000)
+
+    listing = await paginate(session, select(Guest), SORT_KEYS, limit=20, count_key=("guests", 1))
+
+    assert listing.total == 250_000
+    assert listing.total_is_estimate is True
+    assert "OVER" not in session.executed[0]
+
+
+async def test_filtered_list_counts_with_window_in_same_query() -> None:
+    session = _FakeSession(_rows(2, total=42), estimate=250_000)
+
+    listing = await paginate(session, select(Guest), SORT_KEYS, limit=20, filtered=True)
+
+    assert listing.items == ["guest-0", "guest-1"]
+    assert listing.total == 42
+    assert listing.total_is_estimate is False
+    assert session.explained == 0 and session.counted == 0
+    assert "count(*) OVER ()" in session.executed[0]
+
+
+async def test_cached_total_skips_counting() -> None:
+    first = _FakeSession(_rows(1, total=7))
+    await paginate(
+        first, select(Guest), SORT_KEYS, limit=20, count_key=("guests", 1, "ann"), filtered=True
+    )
+
+    second = _FakeSession(_rows(1))
+    listing = await paginate(
+        second, select(Guest), SORT_KEYS, limit=20, count_key=("guests", 1, "ann"), filtered=True
+    )
+
+    assert listing.total == 7
+    assert "OVER" not in second.executed[0]
+
+
+async def test_cursor_page_counts_separately() -> None:
+    cursor = encode_cursor([datetime(2026, 1, 1, tzinfo=timezone.utc), uuid4()])
+    session = _FakeSession(_rows(1), exact=31)
+
+    listing = await paginate(
+        session, select(Guest), SORT_KEYS, limit=20, cursor=cursor, filtered=True
+    )
+
+    assert listing.total == 31
+    assert session.counted == 1
+    assert "OVER" not in session.executed[0]
+
+
+def test_ttl_cache_expires_and_bounds_entries() -> None:
+    now = [0.0]
+    cache = TTLCache(ttl_seconds=10, max_entries=2, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    now[0] = 10.0
+    assert cache.get("c") is None
+    assert len(cache) == 1
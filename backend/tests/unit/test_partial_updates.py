@@ -0,0 +1,77 @@
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.incident import Incident
+from app.models.room import Room
+from app.modules.hotel.incidents.schemas import IncidentUpdate
+from app.modules.hotel.incidents.service import IncidentService
+from app.modules.hotel.rooms.schemas import RoomUpdate
+from app.modules.hotel.rooms.service import RoomService
+from app.services.base import changed_fields
+
+
+class _FakeSession:
+    def __init__(self, row=None) -> None:
+        self.row = row
+        self.statements: list[str] = []
+        self.commits = 0
+
+    async def scalar(self, stmt, execution_options=None):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return self.row
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def test_changed_fields_skips_unset_and_excluded_fields() -> None:
+    payload = RoomUpdate(room_type="suite", floor="", description=None)
+
+    assert changed_fields(payload) == {"room_type": "suite", "floor": ""}
+    assert changed_fields(payload, exclude={"floor"}) == {"room_type": "suite"}
+
+
+async def test_room_update_is_one_tenant_scoped_update_returning() -> None:
+    room = Room(id=uuid4(), tenant_id=uuid4(), number="101", room_type="suite")
+    session = _FakeSession(room)
+
+    updated = await RoomService(session).update(room.tenant_id, room.id, RoomUpdate(currency="eur"))
+
+    assert updated is room
+    sql = session.statements[0]
+    assert sql.startswith("UPDATE rooms SET currency=")
+    assert "WHERE rooms.id = " in sql and "rooms.tenant_id = " in sql
+    assert "RETURNING rooms.id" in sql
+    assert "INSERT INTO search_documents" in session.statements[1]
+    assert session.commits == 1
+
+
+async def test_update_of_missing_row_returns_none_without_commit() -> None:
+    session = _FakeSession(None)
+
+    assert await RoomService(session).update(uuid4(), uuid4(), RoomUpdate(floor="2")) is None
+    assert len(session.statements) == 1 and session.commits == 0
+
+
+async def test_empty_update_only_selects() -> None:
+    room = Room(id=uuid4(), tenant_id=uuid4(), number="101", room_type="suite")
+    session = _FakeSession(room)
+
+    assert await RoomService(session).update(room.tenant_id, room.id, RoomUpdate()) is room
+    assert session.statements[0].startswith("SELECT rooms.id")
+    assert session.commits == 0
+
+
+async def test_resolving_incident_stamps_resolved_at_in_sql() -> None:
+    incident = Incident(id=uuid4(), tenant_id=uuid4(), title="Leak")
+    session = _FakeSession(incident)
+
+    await IncidentService(session).update(
+        incident.tenant_id, incident.id, IncidentUpdate(status="resolved")
+    )
+
+    assert "resolved_at=coalesce(incidents.resolved_at, now())" in session.statements[0]
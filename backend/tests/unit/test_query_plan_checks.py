@@ -0,0 +1,53 @@
+from app.core.explain import find_plan_regressions
+
+
+def _seq_scan(relation: str, rows: int, removed: int = 0) -> dict:
+    return {
+        "Node Type": "Seq Scan",
+        "Relation Name": relation,
+        "Actual Rows": rows,
+        "Actual Loops": 1,
+        "Rows Removed by Filter": removed,
+    }
+
+
+def test_seq_scan_counts_rows_removed_by_filter() -> None:
+    plan = {"Node Type": "Limit", "Plans": [_seq_scan("guests", 20, removed=90_000)]}
+
+    assert find_plan_regressions(plan, 10_000) == ["Seq Scan on guests (90020 rows)"]
+
+
+def test_small_seq_scans_are_allowed() -> None:
+    assert find_plan_regressions(_seq_scan("plans", 12), 10_000) == []
+
+
+def test_sort_is_measured_by_its_input() -> None:
+    sort = {
+        "Node Type": "Sort",
+        "Sort Key": ["guests.created_at DESC"],
+        "Actual Rows": 21,
+        "Actual Loops": 1,
+        "Plans": [
+            {"Node Type": "Index Scan", "Relation Name": "guests", "Actual Rows": 50_000}
+        ],
+    }
+    plan = {"Node Type": "Limit", "Plans": [sort]}
+
+    assert find_plan_regressions(plan, 10_000) == [
+        "Sort on guests.created_at DESC (50000 rows)"
+    ]
+
+
+def test_estimates_are_used_without_analyze() -> None:
+    plan = {"Node Type": "Seq Scan", "Relation Name": "invoices", "Plan Rows": 40_000}
+
+    assert find_plan_regressions(plan, 10_000) == ["Seq Scan on invoices (40000 rows)"]
+
+
+def test_index_scans_pass() -> None:
+    plan = {
+        "Node Type": "Limit",
+        "Plans": [{"Node Type": "Index Scan", "Relation Name": "guests", "Actual Rows": 21}],
+    }
+
+    assert find_plan_regressions(plan, 10_000) == []
@@ -0,0 +1,93 @@
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from starlette.requests import Request
+
+from app import main
+from app.core import database
+from app.core.config import settings
+from app.core.database import (
+    PRIMARY_UNTIL_COOKIE,
+    AsyncReadSessionLocal,
+    AsyncSessionLocal,
+    read_sessionmaker,
+    reads_primary,
+)
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
+
+
+def _request(cookie: str | None = None) -> Request:
+    headers = [(b"cookie", f"{PRIMARY_UNTIL_COOKIE}={cookie}".encode())] if cookie else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    monkeypatch.setattr(settings, "database_replica_sticky_seconds", 5)
+    monkeypatch.setattr(database, "replica_engine", object())
+
+
+@pytest.mark.parametrize(
+    "offset, expected",
+    [(None, False), (3, True), (-1, False), (3600, False)],
+)
+def test_reads_stick_to_primary_only_inside_the_window(replica, offset, expected) -> None:
+    cookie = None if offset is None else str(int(time.time()) + offset)
+
+    assert reads_primary(_request(cookie)) is expected
+
+
+def test_malformed_cookie_reads_from_replica(replica) -> None:
+    assert reads_primary(_request("soon")) is False
+
+
+def test_read_sessionmaker_routes_by_stickiness(replica) -> None:
+    assert read_sessionmaker(_request()) is AsyncReadSessionLocal
+    assert read_sessionmaker(_request(str(int(time.time()) + 3))) is AsyncSessionLocal
+
+
+def test_without_replica_reads_use_primary(monkeypatch) -> None:
+    monkeypatch.setattr(database, "replica_engine", None)
+
+    assert read_sessionmaker(_request()) is AsyncSessionLocal
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    @app.get("/items")
+    async def list_items() -> list[int]:
+        return []
+
+    @app.post("/items")
+    async def create_item(fail: bool = False) -> dict[str, bool]:
+        if fail:
+            raise HTTPException(status_code=400, detail="Invalid")
+        return {"created": True}
+
+    return app
+
+
+async def test_successful_writes_set_the_sticky_cookie(replica) -> None:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        created = await client.post("/items")
+        failed = await client.post("/items", params={"fail": True})
+        listed = await client.get("/items")
+
+    cookie = created.headers["set-cookie"]
+    assert cookie.startswith(f"{PRIMARY_UNTIL_COOKIE}=") and "Max-Age=5" in cookie
+    assert "set-cookie" not in failed.headers
+    assert "set-cookie" not in listed.headers
+
+
+@pytest.mark.parametrize("configured", [True, False])
+def test_middleware_is_registered_only_with_a_replica(monkeypatch, configured) -> None:
+    monkeypatch.setattr(main, "replica_engine", object() if configured else None)
+
+    middleware = [entry.cls for entry in main.create_app().user_middleware]
+
+    assert (ReadYourWritesMiddleware in middleware) is configured
@@ -0,0 +1,84 @@
+import gzip
+import hashlib
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from app.core.downloads import RangeNotSatisfiableError, export_file_response, parse_byte_range
+
+
+BODY = b"0123456789" * 10
+DIGEST = hashlib.sha256(BODY).hexdigest()
+
+
+def test_parse_byte_range() -> None:
+    assert parse_byte_range(None, 100) is None
+    assert parse_byte_range("bytes=10-19", 100) == (10, 19)
+    assert parse_byte_range("bytes=90-", 100) == (90, 99)
+    assert parse_byte_range("bytes=-5", 100) == (95, 99)
+    assert parse_byte_range("bytes=50-500", 100) == (50, 99)
+    assert parse_byte_range("bytes=0-1,5-6", 100) is None
+    assert parse_byte_range("items=0-1", 100) is None
+
+
+def test_parse_byte_range_unsatisfiable() -> None:
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_byte_range("bytes=100-", 100)
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_byte_range("bytes=20-10", 100)
+
+
+def _client(file_path: Path, digest: str | None) -> httpx.AsyncClient:
+    app = FastAPI()
+
+    @app.get("/download")
+    async def download(request: Request):
+        return export_file_response(request, str(file_path), "report.csv", digest)
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_download_range_and_etag(tmp_path: Path) -> None:
+    path = tmp_path / "report.csv"
+    path.write_bytes(BODY)
+
+    async with _client(path, DIGEST) as client:
+        full = await client.get("/download")
+        assert full.status_code == 200
+        assert full.headers["etag"] == f'"{DIGEST}"'
+        assert full.headers["accept-ranges"] == "bytes"
+        assert full.content == BODY
+
+        partial = await client.get("/download", headers={"Range": "bytes=10-19", "If-Range": f'"{DIGEST}"'})
+        assert partial.status_code == 206
+        assert partial.headers["content-range"] == f"bytes 10-19/{len(BODY)}"
+        assert partial.content == BODY[10:20]
+
+        stale = await client.get("/download", headers={"Range": "bytes=10-19", "If-Range": '"other"'})
+        assert stale.status_code == 200
+        assert stale.content == BODY
+
+        not_modified = await client.get("/download", headers={"If-None-Match": f'"{DIGEST}"'})
+        assert not_modified.status_code == 304
+
+        unsatisfiable = await client.get("/download", headers={"Range": "bytes=1000-"})
+        assert unsatisfiable.status_code == 416
+        assert unsatisfiable.headers["content-range"] == f"bytes */{len(BODY)}"
+
+
+async def test_download_gzip_negotiation(tmp_path: Path) -> None:
+    path = tmp_path / "report.csv.gz"
+    with gzip.open(path, "wb") as handle:
+        handle.write(BODY)
+
+    async with _client(path, DIGEST) as client:
+        encoded = await client.get("/download", headers={"Accept-Encoding": "gzip"})
+        assert encoded.headers["content-encoding"] == "gzip"
+        assert encoded.content == BODY
+
+        identity = await client.get("/download", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in identity.headers
+        assert identity.headers["accept-ranges"] == "none"
+        assert identity.content == BODY
@@ -0,0 +1,76 @@
+from datetime import date, datetime, timezone
+
+from sqlalchemy import Column, Date, DateTime, Integer, MetaData, Table, func, select
+from sqlalchemy.dialects import postgresql
+
+from app.services.base import decode_cursor, encode_cursor
+from app.services.report_rollups import combine_with_rollup, month_window
+
+
+UTC = timezone.utc
+metadata = MetaData()
+rollup = Table("rollup", metadata, Column("month", Date), Column("total", Integer))
+source = Table("source", metadata, Column("created_at", DateTime(timezone=True)))
+
+
+def _stmts():
+    rollup_stmt = select(rollup.c.month.label("month"), rollup.c.total.label("total"))
+    live_stmt = select(
+        func.date_trunc("month", source.c.created_at).label("month"), func.count().label("total")
+    ).group_by("month")
+    return rollup_stmt, live_stmt
+
+
+def test_month_window_whole_months_only() -> None:
+    start, end = month_window(datetime(2026, 1, 15, tzinfo=UTC), datetime(2026, 5, 10, tzinfo=UTC))
+    assert start == datetime(2026, 2, 1, tzinfo=UTC)
+    assert end == datetime(2026, 5, 1, tzinfo=UTC)
+
+
+def test_month_window_aligned_bounds_and_naive_values() -> None:
+    start, end = month_window(datetime(2026, 1, 1), datetime(2026, 3, 31, 23, 59, 59, 999999))
+    assert start == datetime(2026, 1, 1, tzinfo=UTC)
+    assert end == datetime(2026, 4, 1, tzinfo=UTC)
+
+
+def test_month_window_december_rollover() -> None:
+    start, _ = month_window(datetime(2025, 12, 2, tzinfo=UTC), None)
+    assert start == datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def test_combine_with_rollup_unfiltered_reads_rollup_only() -> None:
+    rollup_stmt, live_stmt = _stmts()
+    stmt = combine_with_rollup(rollup_stmt, rollup.c.month, live_stmt, source.c.created_at, None, None)
+    assert stmt is rollup_stmt
+
+
+def test_combine_with_rollup_partial_months_come_from_source() -> None:
+    rollup_stmt, live_stmt = _stmts()
+    stmt = combine_with_rollup(
+        rollup_stmt,
+        rollup.c.month,
+        live_stmt,
+        source.c.created_at,
+        datetime(2026, 1, 15, tzinfo=UTC),
+        datetime(2026, 5, 10, tzinfo=UTC),
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "UNION ALL" in sql
+    assert "NOT (source.created_at >= " in sql
+
+
+def test_combine_with_rollup_within_one_month_skips_rollup() -> None:
+    rollup_stmt, live_stmt = _stmts()
+    stmt = combine_with_rollup(
+        rollup_stmt,
+        rollup.c.month,
+        live_stmt,
+        source.c.created_at,
+        datetime(2026, 1, 15, tzinfo=UTC),
+        datetime(2026, 1, 20, tzinfo=UTC),
+    )
+    assert stmt is live_stmt
+
+
+def test_cursor_round_trips_dates() -> None:
+    assert decode_cursor(encode_cursor([date(2026, 2, 1)]), 1) == [date(2026, 2, 1)]
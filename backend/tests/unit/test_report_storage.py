@@ -1,5 +1,12 @@
+import gzip
+import hashlib
+import json
+import zipfile
+from datetime import datetime, timezone
 from pathlib import Path
 
+import pyarrow.parquet as pq
+
 from app.core.storage import ReportStorage
 
 
@@ -67,3 +74,75 @@ def test_save_pdf(tmp_path: Path) -> None:
     assert path.exists()
     # PDF signature.
     assert path.read_bytes().startswith(b"%PDF")
+
+
+def test_save_ndjson(tmp_path: Path) -> None:
+    storage = ReportStorage(str(tmp_path))
+    file_path, file_name = storage.save_export(
+        report_code="invoice_aging",
+        export_format="ndjson",
+        columns=_sample_columns(),
+        rows=_sample_rows(),
+        title="Invoice Aging",
+    )
+
+    assert file_name.endswith(".ndjson")
+    lines = Path(file_path).read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0]) == {"invoice_number": "INV-1001", "amount_cents": 2000}
+
+
+def test_save_csv_compressed(tmp_path: Path) -> None:
+    storage = ReportStorage(str(tmp_path), compress=True)
+    file_path, file_name = storage.save_export(
+        report_code="invoice_aging",
+        export_format="csv",
+        columns=_sample_columns(),
+        rows=_sample_rows(),
+    )
+
+    assert file_name.endswith(".csv")
+    assert file_path.endswith(".csv.gz")
+    with gzip.open(file_path, "rt", encoding="utf-8") as handle:
+        assert "INV-1002" in handle.read()
+
+
+def test_build_bundle(tmp_path: Path) -> None:
+    storage = ReportStorage(str(tmp_path), compress=True)
+    first, name = storage.save_export("invoice_aging", "csv", _sample_columns(), _sample_rows())
+    second, _ = storage.save_export("invoice_aging", "ndjson", _sample_columns(), _sample_rows())
+
+    bundle_path = storage.build_bundle([(first, name), (second, "rows.ndjson"), (first, name)])
+
+    with zipfile.ZipFile(bundle_path) as archive:
+        names = archive.namelist()
+        assert names == [name, "rows.ndjson", name.replace(".csv", "-1.csv")]
+        assert "INV-1001" in archive.read(name).decode("utf-8")
+
+
+def test_file_digest(tmp_path: Path) -> None:
+    path = tmp_path / "artifact.bin"
+    path.write_bytes(b"report bytes")
+
+    size, digest = ReportStorage.file_digest(str(path))
+
+    assert size == len(b"report bytes")
+    assert digest == hashlib.sha256(b"report bytes").hexdigest()
+
+
+def test_save_parquet_typed_columns(tmp_path: Path) -> None:
+    storage = ReportStorage(str(tmp_path))
+    columns = _sample_columns() + [{"key": "issued_at", "label": "Issued"}]
+    rows = [
+        {"invoice_number": "INV-1001", "amount_cents": 2000, "issued_at": None},
+        {"invoice_number": "INV-1002", "amount_cents": 3500, "issued_at": datetime(2026, 1, 5)},
+    ]
+
+    file_path, file_name = storage.save_export("invoice_aging", "parquet", columns, rows)
+
+    assert file_name.endswith(".parquet")
+    table = pq.read_table(file_path)
+    assert str(table.schema.field("amount_cents").type) == "int64"
+    assert str(table.schema.field("issued_at").type) == "timestamp[us, tz=UTC]"
+    assert table.column("amount_cents").to_pylist() == [2000, 3500]
+    assert table.column("issued_at").to_pylist()[1] == datetime(2026, 1, 5, tzinfo=timezone.utc)
@@ -0,0 +1,66 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.explain import Explain
+from app.core.streaming import iter_csv, iter_ndjson, iter_stream
+from app.models.guest import Guest
+
+
+COLUMNS = [
+    {"key": "guest", "label": "Guest"},
+    {"key": "check_in_at", "label": "Check In"},
+]
+
+
+async def _rows(count: int):
+    for index in range(count):
+        yield {
+            "guest": f"Guest {index}",
+            "check_in_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "ignored": "not a column",
+        }
+
+
+async def _collect(chunks) -> list[str]:
+    return [chunk async for chunk in chunks]
+
+
+async def test_iter_csv_writes_header_and_batches_rows() -> None:
+    chunks = await _collect(iter_csv(COLUMNS, _rows(5), chunk_rows=2))
+
+    # Header + first two rows, two more rows, then the remainder.
+    assert len(chunks) == 3
+    lines = "".join(chunks).splitlines()
+    assert lines[0] == "Guest,Check In"
+    assert lines[1] == "Guest 0,2026-01-01T00:00:00+00:00"
+    assert len(lines) == 6
+
+
+async def test_iter_ndjson_projects_columns() -> None:
+    chunks = await _collect(iter_ndjson(COLUMNS, _rows(3), chunk_rows=10))
+
+    assert len(chunks) == 1
+    records = [json.loads(line) for line in chunks[0].splitlines()]
+    assert records[2] == {"guest": "Guest 2", "check_in_at": "2026-01-01T00:00:00+00:00"}
+
+
+async def test_iter_stream_empty_csv_is_header_only() -> None:
+    chunks = await _collect(iter_stream("csv", COLUMNS, _rows(0)))
+    assert "".join(chunks) == "Guest,Check In\r\n"
+
+
+def test_iter_stream_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError, match="Unsupported stream format"):
+        iter_stream("xml", COLUMNS, _rows(0))
+
+
+def test_explain_wraps_statement_with_bind_params() -> None:
+    stmt = select(Guest.id).where(Guest.status == "active")
+    compiled = Explain(stmt).compile(dialect=postgresql.dialect())
+
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT guests.id")
+    assert "active" in compiled.params.values()
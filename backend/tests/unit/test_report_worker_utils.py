@@ -1,6 +1,16 @@
 from datetime import datetime, timezone
+from uuid import uuid4
 
-from app.workers.report_exports import _clean_status, _parse_datetime
+import pyarrow.parquet as pq
+
+from app.core import storage as storage_module
+from app.core.config import settings
+from app.core.storage import ReportStorage
+from app.models.report_export import ReportExport
+from app.workers import report_exports
+from app.workers.report_exports import _clean_status, _parse_datetime, _render_streamed_export
+
+COLUMNS = [{"key": "name", "label": "Name"}]
 
 
 def test_parse_datetime_from_iso_string() -> None:
@@ -19,3 +29,59 @@ def test_clean_status_none_or_blank_is_none() -> None:
 
 def test_clean_status_normalizes_text() -> None:
     assert _clean_status(" paid ") == "paid"
+
+
+async def _rows(count: int):
+    for index in range(count):
+        yield {"name": f"guest-{index}"}
+
+
+async def _render(tmp_path, monkeypatch, export_format: str, count: int):
+    updates = []
+
+    async def record_update(_export_id, **values) -> None:
+        updates.append(values["rows_processed"])
+
+    monkeypatch.setattr(settings, "report_export_progress_rows", 2)
+    monkeypatch.setattr(report_exports, "_update_export", record_update)
+    export = ReportExport(id=uuid4(), report_code="guest_activity", export_format=export_format)
+    storage = ReportStorage(str(tmp_path))
+    result = await _render_streamed_export(storage, export, COLUMNS, "Guests", _rows(count))
+    return result, updates
+
+
+async def test_streamed_export_reports_progress_per_batch(tmp_path, monkeypatch) -> None:
+    (file_path, _, row_count), updates = await _render(tmp_path, monkeypatch, "csv", 5)
+
+    assert updates == [2, 4, 5]
+    assert row_count == 5
+    with open(file_path, encoding="utf-8") as handle:
+        assert handle.read().splitlines() == ["Name"] + [f"guest-{index}" for index in range(5)]
+    assert not any((tmp_path / "parts").iterdir())
+
+
+async def test_streamed_export_without_rows_keeps_csv_header(tmp_path, monkeypatch) -> None:
+    (file_path, _, row_count), updates = await _render(tmp_path, monkeypatch, "csv", 0)
+
+    assert (row_count, updates) == (0, [0])
+    with open(file_path, encoding="utf-8") as handle:
+        assert handle.read().splitlines() == ["Name"]
+
+
+async def test_streamed_export_collects_rows_for_whole_file_formats(tmp_path, monkeypatch) -> None:
+    (file_path, file_name, row_count), updates = await _render(tmp_path, monkeypatch, "excel", 3)
+
+    assert updates == [2, 3]
+    assert row_count == 3 and file_name.endswith(".xlsx")
+
+
+async def test_streamed_parquet_writes_row_groups_as_batches_arrive(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(storage_module, "PARQUET_ROW_GROUP_SIZE", 2)
+
+    (file_path, file_name, row_count), updates = await _render(tmp_path, monkeypatch, "parquet", 5)
+
+    assert updates == [2, 4, 5]
+    assert row_count == 5 and file_name.endswith(".parquet")
+    parquet_file = pq.ParquetFile(file_path)
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.read().column("name").to_pylist() == [f"guest-{index}" for index in range(5)]
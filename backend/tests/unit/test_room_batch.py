@@ -0,0 +1,131 @@
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from app.models.room import Room
+from app.modules.hotel.rooms.schemas import RoomCreate, RoomStatusTransition
+from app.modules.hotel.rooms.service import RoomService
+
+
+class _FakeResult:
+    def __init__(self, rows) -> None:
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    def __init__(self, existing: set[str]) -> None:
+        self.existing = existing
+        self.statements: list[str] = []
+        self.params = None
+        self.committed = False
+
+    async def execute(self, stmt, params=None, execution_options=None):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        if params is None:
+            return _FakeResult([])
+        self.params = params
+        upsert = "DO UPDATE" in self.statements[-1]
+        rows = []
+        for values in params:
+            inserted = values["number"] not in self.existing
+            if inserted or upsert:
+                rows.append((Room(id=uuid4(), **values), inserted))
+        return _FakeResult(rows)
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+def _items(*numbers: str) -> list[RoomCreate]:
+    return [RoomCreate(number=number, room_type="double", currency="eur") for number in numbers]
+
+
+async def test_create_mode_reports_conflicts_and_duplicates_in_order() -> None:
+    session = _FakeSession(existing={"102"})
+
+    results = await RoomService(session).batch_upsert(uuid4(), _items("101", "102", "101"))
+
+    assert [result["status"] for result in results] == ["created", "conflict", "duplicate"]
+    assert [result["index"] for result in results] == [0, 1, 2]
+    insert_sql = session.statements[0]
+    assert "ON CONFLICT (tenant_id, number) DO NOTHING" in insert_sql
+    assert "RETURNING" in insert_sql and "xmax = 0" in insert_sql
+    assert [values["number"] for values in session.params] == ["101", "102"]
+    assert session.params[0]["currency"] == "EUR"
+    assert "INSERT INTO search_documents" in session.statements[1]
+    assert session.committed
+
+
+async def test_upsert_mode_updates_existing_rooms_but_not_their_status() -> None:
+    session = _FakeSession(existing={"102"})
+
+    results = await RoomService(session).batch_upsert(uuid4(), _items("101", "102"), mode="upsert")
+
+    assert [result["status"] for result in results] == ["created", "updated"]
+    set_clause = session.statements[0].split("DO UPDATE SET", 1)[1].split("RETURNING")[0]
+    assert "room_type = excluded.room_type" in set_clause
+    assert "status" not in set_clause
+
+
+class _FakeScalars:
+    def __init__(self, rooms) -> None:
+        self._rooms = rooms
+
+    def all(self):
+        return self._rooms
+
+
+class _StatusSession:
+    def __init__(self, rooms) -> None:
+        self.rooms = rooms
+        self.statement = None
+        self.committed = False
+
+    async def scalars(self, stmt):
+        self.statement = str(stmt.compile(dialect=postgresql.dialect()))
+        return _FakeScalars(self.rooms)
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+async def test_status_transition_is_one_guarded_update_with_one_audit_entry() -> None:
+    rooms = [Room(id=uuid4(), number="101", status="available") for _ in range(3)]
+    session = _StatusSession(rooms)
+    payload = RoomStatusTransition(
+        status="available", floor="1", expected_status=["occupied", "maintenance"]
+    )
+
+    with patch("app.modules.hotel.rooms.service.audit_event_stub", new_callable=AsyncMock) as audit:
+        updated = await RoomService(session).transition_status(uuid4(), payload)
+
+    assert updated == rooms
+    assert session.statement.startswith("UPDATE rooms SET status=")
+    assert "rooms.floor = " in session.statement
+    assert "rooms.status IN (" in session.statement
+    assert "RETURNING rooms.id" in session.statement
+    audit.assert_awaited_once()
+    assert len(audit.call_args.kwargs["metadata"]["room_ids"]) == 3
+    assert session.committed
+
+
+async def test_status_transition_without_matches_is_not_audited() -> None:
+    session = _StatusSession([])
+    payload = RoomStatusTransition(status="maintenance", room_ids=[uuid4()])
+
+    with patch("app.modules.hotel.rooms.service.audit_event_stub", new_callable=AsyncMock) as audit:
+        assert await RoomService(session).transition_status(uuid4(), payload) == []
+
+    audit.assert_not_called()
+    assert "rooms.id IN (" in session.statement
+
+
+def test_status_transition_requires_a_selector() -> None:
+    with pytest.raises(ValidationError, match="Provide room_ids, floor or room_type"):
+        RoomStatusTransition(status="available")
@@ -0,0 +1,83 @@
+import importlib.util
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.modules.hotel.guests.service import GuestService
+from app.services.search import (
+    GUEST_DOCUMENT,
+    INCIDENT_DOCUMENT,
+    ROOM_DOCUMENT,
+    contains_term,
+    escape_like,
+)
+
+
+MIGRATION = Path(__file__).parents[2] / "migrations/versions/0029_trigram_search_indexes.py"
+
+
+def _migration():
+    spec = importlib.util.spec_from_file_location("trigram_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _sql(clause) -> str:
+    return str(
+        clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+class _FakeResult:
+    def all(self):
+        return []
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.executed = []
+
+    async def execute(self, stmt):
+        self.executed.append(stmt.compile(dialect=postgresql.dialect()))
+        return _FakeResult()
+
+
+def test_documents_match_index_expressions() -> None:
+    migration = _migration()
+    for document, expected, table in (
+        (GUEST_DOCUMENT, migration.GUEST_DOCUMENT, "guests"),
+        (ROOM_DOCUMENT, migration.ROOM_DOCUMENT, "rooms"),
+        (INCIDENT_DOCUMENT, migration.INCIDENT_DOCUMENT, "incidents"),
+    ):
+        assert _sql(document).replace(f"{table}.", "") == expected
+
+
+def test_like_wildcards_are_escaped() -> None:
+    assert escape_like("50%_off\\") == "50\\%\\_off\\\\"
+    assert contains_term(GUEST_DOCUMENT, " 50% ").right.value == "%50\\%%"
+
+
+async def test_guest_search_is_tenant_scoped_and_ranked() -> None:
+    session = _FakeSession()
+
+    await GuestService(session).list(uuid4(), 1, 20, search="ann", include_total=False)
+
+    compiled = session.executed[0]
+    sql = str(compiled)
+    assert "guests.tenant_id =" in sql
+    assert "guests.email, '')) ILIKE" in sql
+    assert "ORDER BY word_similarity(" in sql
+    assert "DESC, guests.created_at DESC, guests.id DESC \n LIMIT" in sql
+    assert {"%ann%", "ann"} <= set(compiled.params.values())
+
+
+async def test_guest_list_without_search_keeps_chronological_order() -> None:
+    session = _FakeSession()
+
+    await GuestService(session).list(uuid4(), 1, 20, include_total=False)
+
+    sql = str(session.executed[0])
+    assert "word_similarity" not in sql
+    assert "ORDER BY guests.created_at DESC, guests.id DESC" in sql
@@ -24,7 +24,6 @@ import { adminReportsApi } from "@/lib/api/admin/reports";
 import type { ReportDetail, ReportExport, ReportExportFormat } from "@/lib/types/reports";
 
 const API_BASE = process.env.NEXT_PUBLIC_API_URL ?? "http://localhost:8000/api";
-const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
 
 type ReportFilters = { date_from?: string; date_to?: string; status?: string };
 type ReportRow = Record<string, string | number | null>;
@@ -114,12 +113,7 @@ export default function AdminReportDetailPage() {
       toast.success("Export requested");
 
       if (exportData.status === "pending" || exportData.status === "processing") {
-        for (let attempt = 0; attempt < 60; attempt += 1) {
-          await sleep(1000);
-          const latest = await adminReportsApi.getExport(exportData.id);
-          setExportInfo(latest);
-          if (latest.status === "completed" || latest.status === "failed") break;
-        }
+        await adminReportsApi.watchExport(exportData.id, setExportInfo);
       }
     } catch (err: unknown) {
       const message = err instanceof Error ? err.message : "Failed to export report";
@@ -199,6 +193,7 @@ export default function AdminReportDetailPage() {
                     <option value="csv">CSV</option>
                     <option value="pdf">PDF</option>
                     <option value="excel">Excel</option>
+                    <option value="parquet">Parquet</option>
                   </SelectInput>
                 </div>
               </div>
@@ -223,6 +218,12 @@ export default function AdminReportDetailPage() {
                 Export status: <span className="font-semibold capitalize">{exportInfo.status}</span> (
                 {exportInfo.export_format.toUpperCase()})
               </p>
+              {exportInfo.status === "processing" && exportInfo.rows_processed != null ? (
+                <p className="text-[color:var(--color-text-muted)]">
+                  {exportInfo.rows_processed.toLocaleString()}
+                  {exportInfo.rows_total ? ` of ~${exportInfo.rows_total.toLocaleString()}` : ""} rows processed
+                </p>
+              ) : null}
               {downloadUrl ? (
                 <p>
                   File ready:{" "}
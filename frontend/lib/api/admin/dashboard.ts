@@ -1,6 +1,8 @@
 import { apiFetch } from "@/lib/api/client";
-import type { AdminDashboardSummary } from "@/lib/types/dashboard";
+import type { AdminDashboardSummary, DatabasePoolStatus } from "@/lib/types/dashboard";
 
 export const adminDashboardApi = {
-  summary: () => apiFetch<AdminDashboardSummary>("/admin/dashboard/summary")
+  summary: () => apiFetch<AdminDashboardSummary>("/admin/dashboard/summary"),
+  databasePool: (target: "primary" | "replica" = "primary") =>
+    apiFetch<DatabasePoolStatus>(`/admin/dashboard/database-pool?target=${target}`)
 };
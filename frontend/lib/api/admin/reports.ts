@@ -1,5 +1,8 @@
 import { apiFetch } from "@/lib/api/client";
+import { watchReportExport } from "@/lib/api/report-events";
 import type {
+  InvoiceAgingInvoicePage,
+  InvoiceAgingResponse,
   ReportDetail,
   ReportExport,
   ReportExportRequest,
@@ -36,6 +39,28 @@ export const adminReportsApi = {
       method: "POST",
       body: JSON.stringify(payload)
     }),
+  invoiceAging: (params?: { limit?: number; cursor?: string }) =>
+    apiFetch<InvoiceAgingResponse>(
+      `/admin/reports/invoice_aging/buckets${buildQuery({
+        limit: params?.limit ? String(params.limit) : undefined,
+        cursor: params?.cursor
+      })}`
+    ),
+  invoiceAgingBucket: (bucket: string, params?: { tenant_id?: string; limit?: number; cursor?: string }) =>
+    apiFetch<InvoiceAgingInvoicePage>(
+      `/admin/reports/invoice_aging/buckets/${bucket}${buildQuery({
+        tenant_id: params?.tenant_id,
+        limit: params?.limit ? String(params.limit) : undefined,
+        cursor: params?.cursor
+      })}`
+    ),
   getExport: (exportId: string) =>
-    apiFetch<ReportExport>(`/admin/reports/exports/${exportId}`)
+    apiFetch<ReportExport>(`/admin/reports/exports/${exportId}`),
+  watchExport: (exportId: string, onUpdate: (latest: ReportExport) => void) =>
+    watchReportExport(
+      "/admin/reports/exports/events",
+      exportId,
+      () => apiFetch<ReportExport>(`/admin/reports/exports/${exportId}`),
+      onUpdate
+    )
 };
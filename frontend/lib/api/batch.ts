@@ -0,0 +1,11 @@
+import { apiFetch } from "@/lib/api/client";
+import type { BatchResponseItem } from "@/lib/types/api";
+
+export const batchApi = {
+  // Paths are relative to the API root, as with apiFetch (e.g. "/hotel/rooms?limit=20").
+  get: (paths: string[]) =>
+    apiFetch<BatchResponseItem[]>("/batch", {
+      method: "POST",
+      body: JSON.stringify({ requests: paths.map((path) => ({ method: "GET", path })) })
+    })
+};
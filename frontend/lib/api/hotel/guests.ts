@@ -1,5 +1,17 @@
 import { apiFetch } from "@/lib/api/client";
-import type { Guest, GuestCreate, GuestListResponse, GuestUpdate } from "@/lib/types/guests";
+import type {
+  Guest,
+  GuestCreate,
+  GuestImport,
+  GuestImportFormat,
+  GuestListResponse,
+  GuestUpdate
+} from "@/lib/types/guests";
+
+const IMPORT_CONTENT_TYPES: Record<GuestImportFormat, string> = {
+  csv: "text/csv",
+  ndjson: "application/x-ndjson"
+};
 
 export const hotelGuestsApi = {
   list: (params?: { page?: number; limit?: number; search?: string }) => {
@@ -15,5 +27,12 @@ export const hotelGuestsApi = {
     apiFetch<Guest>("/hotel/guests", { method: "POST", body: JSON.stringify(payload) }),
   update: (id: string, payload: GuestUpdate) =>
     apiFetch<Guest>(`/hotel/guests/${id}`, { method: "PUT", body: JSON.stringify(payload) }),
-  remove: (id: string) => apiFetch<void>(`/hotel/guests/${id}`, { method: "DELETE" })
+  remove: (id: string) => apiFetch<void>(`/hotel/guests/${id}`, { method: "DELETE" }),
+  importFile: (file: Blob, format: GuestImportFormat) =>
+    apiFetch<GuestImport>(`/hotel/guests/import?format=${format}`, {
+      method: "POST",
+      body: file,
+      headers: { "Content-Type": IMPORT_CONTENT_TYPES[format] }
+    }),
+  getImport: (id: string) => apiFetch<GuestImport>(`/hotel/guests/imports/${id}`)
 };
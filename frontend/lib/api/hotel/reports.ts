@@ -1,4 +1,5 @@
 import { apiFetch } from "@/lib/api/client";
+import { watchReportExport } from "@/lib/api/report-events";
 import type {
   ReportDetail,
   ReportExport,
@@ -37,5 +38,12 @@ export const hotelReportsApi = {
       body: JSON.stringify(payload)
     }),
   getExport: (exportId: string) =>
-    apiFetch<ReportExport>(`/hotel/reports/exports/${exportId}`)
+    apiFetch<ReportExport>(`/hotel/reports/exports/${exportId}`),
+  watchExport: (exportId: string, onUpdate: (latest: ReportExport) => void) =>
+    watchReportExport(
+      "/hotel/reports/exports/events",
+      exportId,
+      () => apiFetch<ReportExport>(`/hotel/reports/exports/${exportId}`),
+      onUpdate
+    )
 };
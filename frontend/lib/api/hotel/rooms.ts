@@ -1,5 +1,14 @@
 import { apiFetch } from "@/lib/api/client";
-import type { Room, RoomCreate, RoomListResponse, RoomUpdate } from "@/lib/types/rooms";
+import type {
+  Room,
+  RoomBatchRequest,
+  RoomBatchResponse,
+  RoomCreate,
+  RoomListResponse,
+  RoomStatusTransition,
+  RoomStatusTransitionResponse,
+  RoomUpdate
+} from "@/lib/types/rooms";
 
 export const hotelRoomsApi = {
   list: (params?: { page?: number; limit?: number; search?: string }) => {
@@ -15,5 +24,15 @@ export const hotelRoomsApi = {
     apiFetch<Room>("/hotel/rooms", { method: "POST", body: JSON.stringify(payload) }),
   update: (id: string, payload: RoomUpdate) =>
     apiFetch<Room>(`/hotel/rooms/${id}`, { method: "PUT", body: JSON.stringify(payload) }),
-  remove: (id: string) => apiFetch<void>(`/hotel/rooms/${id}`, { method: "DELETE" })
+  remove: (id: string) => apiFetch<void>(`/hotel/rooms/${id}`, { method: "DELETE" }),
+  batch: (payload: RoomBatchRequest) =>
+    apiFetch<RoomBatchResponse>("/hotel/rooms/batch", {
+      method: "POST",
+      body: JSON.stringify(payload)
+    }),
+  transitionStatus: (payload: RoomStatusTransition) =>
+    apiFetch<RoomStatusTransitionResponse>("/hotel/rooms/status", {
+      method: "POST",
+      body: JSON.stringify(payload)
+    })
 };
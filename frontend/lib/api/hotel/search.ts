@@ -0,0 +1,7 @@
+import { apiFetch } from "@/lib/api/client";
+import type { SearchResponse } from "@/lib/types/search";
+
+export const hotelSearchApi = {
+  search: (q: string, limit = 5) =>
+    apiFetch<SearchResponse>(`/hotel/search?q=${encodeURIComponent(q)}&limit=${limit}`)
+};
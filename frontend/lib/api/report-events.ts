@@ -0,0 +1,44 @@
+import type { ReportExport } from "@/lib/types/reports";
+
+const API_BASE = process.env.NEXT_PUBLIC_API_URL ?? "http://localhost:8000/api";
+const TERMINAL_STATUSES = new Set(["completed", "failed"]);
+
+/**
+ * Follow one export through the server-sent events stream until it completes or fails.
+ * `refresh` is called once the stream is open to catch up on anything that
+ * happened before the connection was established.
+ */
+export function watchReportExport(
+  eventsPath: string,
+  exportId: string,
+  refresh: () => Promise<ReportExport>,
+  onUpdate: (latest: ReportExport) => void
+): Promise<ReportExport | null> {
+  return new Promise((resolve) => {
+    const source = new EventSource(`${API_BASE}${eventsPath}`, { withCredentials: true });
+    let last: ReportExport | null = null;
+
+    const apply = (latest: ReportExport) => {
+      if (latest.id !== exportId) return;
+      last = latest;
+      onUpdate(latest);
+      if (TERMINAL_STATUSES.has(latest.status)) {
+        source.close();
+        resolve(latest);
+      }
+    };
+    const handleEvent = (event: Event) => {
+      apply(JSON.parse((event as MessageEvent<string>).data) as ReportExport);
+    };
+
+    source.addEventListener("progress", handleEvent);
+    source.addEventListener("completed", handleEvent);
+    source.addEventListener("failed", handleEvent);
+    source.onopen = () => {
+      void refresh().then(apply).catch(() => undefined);
+    };
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) resolve(last);
+    };
+  });
+}
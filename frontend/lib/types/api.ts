@@ -22,3 +22,9 @@ export interface PasswordChangeRequest {
 export interface PasswordChangeResponse {
   message: string;
 }
+
+export interface BatchResponseItem<T = unknown> {
+  status: number;
+  headers: Record<string, string>;
+  body: T;
+}
@@ -16,6 +16,21 @@ export type AdminDashboardSummary = {
   recent_hotels: RecentHotel[];
 };
 
+export type DatabasePoolStatus = {
+  pool_class: string;
+  pool_size: number | null;
+  max_overflow: number | null;
+  checked_out: number | null;
+  checked_in: number | null;
+  overflow: number | null;
+  checkouts: number;
+  checkout_wait_ms_avg: number;
+  checkout_wait_ms_max: number;
+  slow_checkouts: number;
+  checkout_timeouts: number;
+  liveness_failures: number;
+};
+
 export type RecentIncident = {
   id: string;
   title: string;
@@ -17,6 +17,8 @@ export interface PaginationMeta {
   page: number;
   limit: number;
   total: number;
+  next_cursor?: string | null;
+  total_is_estimate?: boolean;
 }
 
 export interface GuestListResponse {
@@ -45,3 +47,24 @@ export interface GuestUpdate {
   check_out_at?: string;
   notes?: string;
 }
+
+export type GuestImportFormat = "csv" | "ndjson";
+
+export interface GuestImportError {
+  row: number;
+  message: string;
+}
+
+export interface GuestImport {
+  id: string;
+  status: "pending" | "processing" | "completed" | "failed";
+  import_format: GuestImportFormat;
+  file_size?: number | null;
+  rows_processed: number;
+  rows_imported: number;
+  rows_failed: number;
+  errors?: GuestImportError[] | null;
+  error_message?: string | null;
+  created_at?: string | null;
+  completed_at?: string | null;
+}
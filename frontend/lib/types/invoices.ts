@@ -21,6 +21,8 @@ export interface PaginationMeta {
   page: number;
   limit: number;
   total: number;
+  next_cursor?: string | null;
+  total_is_estimate?: boolean;
 }
 
 export interface InvoiceListResponse {
@@ -36,12 +36,16 @@ export interface ReportExport {
   status: "pending" | "processing" | "completed" | "failed" | string;
   file_name?: string | null;
   download_path?: string | null;
+  shards_total?: number | null;
+  shards_completed?: number | null;
+  rows_total?: number | null;
+  rows_processed?: number | null;
   error_message?: string | null;
   created_at?: string | null;
   completed_at?: string | null;
 }
 
-export type ReportExportFormat = "csv" | "pdf" | "excel";
+export type ReportExportFormat = "csv" | "pdf" | "excel" | "parquet";
 
 export interface ReportExportRequest {
   format: ReportExportFormat;
@@ -49,3 +53,45 @@ export interface ReportExportRequest {
   date_to?: string;
   status?: string;
 }
+
+export interface AgingBucket {
+  code: string;
+  label: string;
+}
+
+export interface AgingBucketTotals {
+  count: number;
+  amount_cents: number;
+}
+
+export interface InvoiceAgingTenantRow {
+  tenant_id: string;
+  hotel_name: string;
+  buckets: Record<string, AgingBucketTotals>;
+  total_outstanding_cents: number;
+}
+
+export interface InvoiceAgingResponse {
+  as_of: string;
+  buckets: AgingBucket[];
+  tenants: InvoiceAgingTenantRow[];
+  next_cursor?: string | null;
+}
+
+export interface InvoiceAgingInvoice {
+  id: string;
+  tenant_id: string;
+  invoice_number: string;
+  hotel_name: string;
+  amount_cents: number;
+  status: string;
+  due_at?: string | null;
+  days_overdue?: number | null;
+}
+
+export interface InvoiceAgingInvoicePage {
+  bucket: string;
+  as_of: string;
+  items: InvoiceAgingInvoice[];
+  next_cursor?: string | null;
+}
@@ -17,6 +17,8 @@ export interface PaginationMeta {
   page: number;
   limit: number;
   total: number;
+  next_cursor?: string | null;
+  total_is_estimate?: boolean;
 }
 
 export interface RoomListResponse {
@@ -45,3 +47,36 @@ export interface RoomUpdate {
   currency?: string;
   description?: string;
 }
+
+export interface RoomBatchRequest {
+  items: RoomCreate[];
+  mode?: "create" | "upsert";
+}
+
+export interface RoomBatchItemResult {
+  index: number;
+  number: string;
+  status: "created" | "updated" | "conflict" | "duplicate";
+  room?: Room | null;
+  detail?: string | null;
+}
+
+export interface RoomBatchResponse {
+  results: RoomBatchItemResult[];
+  created: number;
+  updated: number;
+  failed: number;
+}
+
+export interface RoomStatusTransition {
+  status: string;
+  room_ids?: string[];
+  floor?: string;
+  room_type?: string;
+  expected_status?: string[];
+}
+
+export interface RoomStatusTransitionResponse {
+  updated: Room[];
+  skipped_ids: string[];
+}
@@ -0,0 +1,13 @@
+export type SearchEntityType = "guests" | "rooms" | "incidents" | "helpdesk";
+
+export interface SearchHit {
+  entity_id: string;
+  title: string;
+  headline: string;
+  rank: number;
+}
+
+export interface SearchResponse {
+  query: string;
+  results: Partial<Record<SearchEntityType, SearchHit[]>>;
+}